@@ -20,6 +20,19 @@ def load(
     experiment_label=None,
     x1_level=None,
     mini_meta=False,
+    n_jobs=1,
+    executor=None,
+    ci_precision=None,
+    time_budget_s=None,
+    engine="vectorized",
+    weights=None,
+    rng_mode="legacy",
+    tests=None,
+    permutation_count=5000,
+    intervals=("bca", "percentile"),
+    permutation=True,
+    profile=False,
+    exact=False,
 ):
     """
     Loads data in preparation for estimation statistics.
@@ -80,6 +93,116 @@ def load(
         is True; otherwise it can only be a string.
     mini_meta : boolean, default False
         Indicator of weighted delta calculation.
+    n_jobs : int, default 1
+        The number of worker processes across which the contrasts of each
+        effect size are computed. If -1, all CPUs are used. The results
+        are identical to those of a serial run, whatever the number of
+        workers. As with any process pool, scripts using this option
+        should guard their entry point with `if __name__ == "__main__":`.
+        With the "blb" engine, the contrasts are computed one after
+        another, and the subsets of each are spread across the workers.
+    executor : concurrent.futures.Executor, default None
+        An existing executor on which to compute the contrasts (or, with
+        the "blb" engine, their subsets), instead of a process pool of
+        `n_jobs` workers created for each effect size.
+    ci_precision : float, default None
+        If given, the bootstrap of each contrast is adaptive. Resamples are
+        drawn in blocks until the Monte Carlo standard error of the limits
+        of the confidence interval is at most `ci_precision` times its
+        width (e.g. 0.01), or until `resamples` resamples were drawn. The
+        number of resamples used by each contrast is reported in the
+        `resamples` column of the results. It cannot be used together with
+        `delta2` or `mini_meta`.
+    time_budget_s : float, default None
+        If given, the number of seconds within which the bootstrap resamples
+        and permutations of each effect size are drawn, shared between the
+        contrasts. Resamples are drawn in blocks of at most 1000 until the
+        budget runs out, so at least one block of each is always drawn, and
+        the time spent outside of resampling is not bounded. The `resamples` and
+        `permutation_count` columns of the results report the numbers drawn
+        and the `truncated` column whether either is short of the number
+        requested. It cannot be used together with `delta2` or `mini_meta`.
+    engine : string, default "vectorized"
+        The engine with which the bootstraps and permutations are computed.
+        "vectorized" evaluates blocks of resamples at once and "loop" one
+        resample at a time; both draw the same resamples and compute them
+        with the same arithmetic, so they give the same bootstraps,
+        permutations, intervals and p-values to the last bit. "counts", which
+        requires `proportional=True`, resamples binary data from its
+        counts of ones, in a time that does not depend on the size of the
+        groups. Its resamples follow the same distribution as those of the
+        other engines, but not the same random stream. "poisson", which
+        cannot be used with `paired`, bootstraps each group in a single
+        pass with Poisson(1) weights, holding only running sums for each
+        resample instead of resampled copies of the groups. It supports the
+        mean difference, Cohen's d and h and Hedges' g, and cannot be used
+        with `ci_precision` or `time_budget_s`. "blb" bootstraps 20 small
+        subsets of each group, of len(group)**0.6 values, resampled to the
+        size of the group, and averages the confidence intervals of the
+        subsets (the Bag of Little Bootstraps). It suits large groups and
+        effect sizes such as the median difference and Cliff's delta, and
+        has the same restrictions as "poisson".
+    weights : string, default None
+        The name of a column of `data` holding the number of times each
+        row occurs, for aggregated data in long format (`x` and `y` must be
+        given). The effect sizes, confidence intervals and statistical
+        tests are those of the data with each row repeated that many
+        times, but are computed from the counts without expanding it; the
+        bootstraps are multinomial counts of the rows, so they follow a
+        different random stream. The weights must be non-negative whole
+        numbers. It cannot be used with `paired`, `delta2`, `mini_meta`
+        or the "counts" engine.
+    rng_mode : string, default "legacy"
+        The random number generators from which the bootstraps and
+        permutations are drawn. "legacy" draws them from numpy's
+        `RandomState`, seeded with `random_seed`, and gives the same
+        results as earlier versions. "generator" draws them from numpy's
+        `Generator`, with independent streams spawned from `random_seed`
+        with `SeedSequence.spawn` for each contrast, and within it for
+        the bootstraps, the permutations and each shard of 1000 of them.
+        The results then do not depend on how the resamples are split into
+        blocks, nor on where or in which order they are computed, but
+        differ from those of "legacy".
+    tests : list of strings, default None
+        The statistical tests reported in the results of each effect size,
+        among "permutation", "welch", "students_t", "mann_whitney",
+        "brunner_munzel", "wilcoxon", "paired_students_t", "mcnemar" and
+        "kruskal" (those that do not apply to the data are not reported).
+        The tests left out are not performed, which saves the cost of the
+        permutation test when only the confidence intervals are needed.
+        None reports all of them, and False none. The permutation test is
+        always performed with `delta2` or `mini_meta`.
+    permutation_count : int, default 5000
+        The number of permutations drawn for each permutation test.
+    intervals : tuple of strings, default ("bca", "percentile")
+        The confidence intervals computed for each contrast. With
+        ("percentile",), the jackknife, the acceleration and the bias
+        correction, which are only needed for the bias-corrected and
+        accelerated (BCa) interval, are skipped; for large groups, the
+        jackknife can be the costliest stage. The results then have no BCa
+        columns, and must be plotted with `ci_type="percentile"`.
+    permutation : boolean, default True
+        If False, the permutation test is not performed, and its columns
+        are left out of the results, whatever `tests`. It cannot be False
+        with `delta2` or `mini_meta`.
+    profile : boolean, default False
+        If True, the wall time, number of calls and peak allocated bytes of
+        each stage of every contrast (the jackknife, the bootstrap, the
+        permutation test, the other tests, ...) and of every plot (the
+        swarms, the violins, the gridkey, ...) are recorded. They are
+        reported by the `timings` of the effect sizes, and, for the
+        contrasts, in extra `calls_*`, `wall_time_s_*` and `peak_bytes_*`
+        columns of their results. The memory is traced with `tracemalloc`,
+        which slows the computations down.
+    exact : boolean or "auto", default False
+        If True, each permutation test enumerates every distinct
+        relabelling of the groups (or, for paired data, every set of
+        control/test swaps) instead of drawing `permutation_count` random
+        permutations, and its p-value is exact. This is only possible for
+        small groups, with at most 2^24 relabellings. "auto" enumerates
+        them only when there are no more of them than `permutation_count`.
+        It must be False with `delta2` or `mini_meta`, and cannot be True
+        with `weights`.
 
     Returns
     -------
@@ -103,6 +226,19 @@ def load(
         experiment_label,
         x1_level,
         mini_meta,
+        n_jobs,
+        executor,
+        ci_precision,
+        time_budget_s,
+        engine,
+        weights,
+        rng_mode,
+        tests,
+        permutation_count,
+        intervals,
+        permutation,
+        profile,
+        exact,
     )
 
 # %% ../nbs/API/load.ipynb 5
@@ -4,8 +4,11 @@
 __all__ = ['Dabest']
 
 # %% ../nbs/API/dabest_object.ipynb 4
+import numbers
+
 # Import standard data science libraries
 from numpy import array, repeat, random, issubdtype, number
+import numpy as np
 import pandas as pd
 from scipy.stats import norm
 from scipy.stats import randint
@@ -34,12 +37,26 @@ class Dabest(object):
         experiment_label,
         x1_level,
         mini_meta,
+        n_jobs=1,
+        executor=None,
+        ci_precision=None,
+        time_budget_s=None,
+        engine="vectorized",
+        weights=None,
+        rng_mode="legacy",
+        tests=None,
+        permutation_count=5000,
+        intervals=("bca", "percentile"),
+        permutation=True,
+        profile=False,
+        exact=False,
     ):
         """
         Parses and stores pandas DataFrames in preparation for estimation
         statistics. You should not be calling this class directly; instead,
         use `dabest.load()` to parse your DataFrame prior to analysis.
         """
+        from ._stats_tools.confint_2group_diff import _BoundedIndexCache
 
         self.__delta2 = delta2
         self.__experiment = experiment
@@ -52,6 +69,21 @@ class Dabest(object):
         self.__random_seed = random_seed
         self.__proportional = proportional
         self.__mini_meta = mini_meta
+        self.__n_jobs = n_jobs
+        self.__executor = executor
+        self.__ci_precision = ci_precision
+        self.__time_budget_s = time_budget_s
+        self.__engine = engine
+        self.__weights = weights
+        self.__rng_mode = rng_mode
+        self.__tests = tests
+        self.__permutation_count = permutation_count
+        self.__intervals = intervals
+        self.__permutation = permutation
+        self.__profile = profile
+        self.__exact = exact
+        # Resample indexes drawn for one effect size, reused by the others.
+        self.__resample_index_cache = _BoundedIndexCache()
 
         # after this call the attributes self.__experiment_label and self.__x1_level are updated
         self._check_errors(x, y, idx, experiment, experiment_label, x1_level)
@@ -429,6 +461,111 @@ class Dabest(object):
         """
         return self.__mini_meta
 
+    @property
+    def n_jobs(self):
+        """
+        The number of worker processes across which contrasts are computed.
+        """
+        return self.__n_jobs
+
+    @property
+    def executor(self):
+        """
+        The executor on which contrasts are computed, if one was supplied.
+        """
+        return self.__executor
+
+    @property
+    def ci_precision(self):
+        """
+        The precision targeted by the adaptive bootstrap, if any.
+        """
+        return self.__ci_precision
+
+    @property
+    def time_budget_s(self):
+        """
+        The number of seconds within which the resamples of each effect
+        size are drawn, if any.
+        """
+        return self.__time_budget_s
+
+    @property
+    def engine(self):
+        """
+        The engine with which the bootstraps and permutations are computed.
+        """
+        return self.__engine
+
+    @property
+    def weights(self):
+        """
+        Returns the column of frequency weights declared to `dabest.load()`,
+        if any.
+        """
+        return self.__weights
+
+    @property
+    def rng_mode(self):
+        """
+        The random number generators from which the bootstraps and
+        permutations are drawn, either 'legacy' or 'generator'.
+        """
+        return self.__rng_mode
+
+    @property
+    def tests(self):
+        """
+        The statistical tests reported in the results of each effect size,
+        or None if all of them are.
+        """
+        return self.__tests
+
+    @property
+    def permutation_count(self):
+        """
+        The number of permutations drawn for each permutation test.
+        """
+        return self.__permutation_count
+
+    @property
+    def intervals(self):
+        """
+        The confidence intervals computed for each contrast.
+        """
+        return self.__intervals
+
+    @property
+    def permutation(self):
+        """
+        Whether the permutation test is performed.
+        """
+        return self.__permutation
+
+    @property
+    def profile(self):
+        """
+        Whether the stages of the effect sizes and their plots are profiled.
+        """
+        return self.__profile
+
+    @property
+    def exact(self):
+        """
+        Whether the permutation tests enumerate every relabelling of the
+        groups, either True, False or 'auto'.
+        """
+        return self.__exact
+
+    @property
+    def _resample_index_cache(self):
+        """
+        The bootstrap and permutation indexes drawn so far, which are
+        shared by the effect sizes of all contrasts. At most
+        `MAX_INDEX_CACHE_ELEMENTS` of them are kept.
+        """
+        return self.__resample_index_cache
+
     @property
     def _all_plot_groups(self):
         """
@@ -442,6 +579,77 @@ class Dabest(object):
         At the end of this function these two class attributes are updated
                 self.__experiment_label and self.__x1_level
         '''
+        # Check if the adaptive bootstrap can be used
+        if self.__ci_precision is not None:
+            if not (isinstance(self.__ci_precision, numbers.Real)
+                    and not isinstance(self.__ci_precision, bool)
+                    and self.__ci_precision > 0):
+                err0 = "`ci_precision` must be a positive number."
+                raise ValueError(err0)
+            if self.__delta2 or self.__mini_meta:
+                # Their bootstraps are combined resample by resample across contrasts.
+                err0 = "`ci_precision` cannot be used with `delta2` or `mini_meta`."
+                raise ValueError(err0)
+
+        # Check if the resampling engine can be used
+        if self.__engine not in ("vectorized", "loop", "counts", "poisson", "blb"):
+            err0 = "`engine` must be one of ['vectorized', 'loop', 'counts', 'poisson', 'blb'], not '{}'."
+            raise ValueError(err0.format(self.__engine))
+        if self.__engine == "counts" and not self.__proportional:
+            err0 = "The 'counts' engine can only be used when `proportional` is True."
+            raise ValueError(err0)
+        if self.__engine in ("poisson", "blb"):
+            if self.__is_paired:
+                err0 = "The '{}' engine cannot be used with paired data."
+                raise ValueError(err0.format(self.__engine))
+            if self.__ci_precision is not None or self.__time_budget_s is not None:
+                # The resamples are not drawn in prefix-consistent blocks.
+                err0 = "The '{}' engine cannot be used with `ci_precision` or `time_budget_s`."
+                raise ValueError(err0.format(self.__engine))
+
+        # Check if the number of permutations is valid
+        if not (isinstance(self.__permutation_count, (int, np.integer))
+                and self.__permutation_count >= 1):
+            err0 = "`permutation_count` must be a positive integer, not {}."
+            raise ValueError(err0.format(self.__permutation_count))
+
+        # Check if the random number generators can be used
+        if self.__rng_mode not in ("legacy", "generator"):
+            err0 = "`rng_mode` must be one of ['legacy', 'generator'], not '{}'."
+            raise ValueError(err0.format(self.__rng_mode))
+
+        # Check if the permutation tests can be exact
+        if self.__exact not in (True, False, "auto"):
+            err0 = "`exact` must be one of [True, False, 'auto'], not '{}'."
+            raise ValueError(err0.format(self.__exact))
+        if self.__exact is not False and (self.__delta2 or self.__mini_meta):
+            # Their p-values combine the random permutations of the contrasts.
+            err0 = "`exact` must be False with `delta2` or `mini_meta`."
+            raise ValueError(err0)
+        if self.__exact is True and self.__weights is not None:
+            err0 = "`exact` cannot be True with `weights`."
+            raise ValueError(err0)
+
+        # Check if frequency weights can be used
+        if self.__weights is not None:
+            if self.__is_paired or self.__delta2 or self.__mini_meta:
+                err0 = "`weights` cannot be used with `paired`, `delta2` or `mini_meta`."
+                raise ValueError(err0)
+            if self.__engine in ("counts", "poisson", "blb"):
+                err0 = "The '{}' engine cannot be used with `weights`.".format(self.__engine)
+                raise ValueError(err0)
+
+        # Check if the time budget can be used
+        if self.__time_budget_s is not None:
+            if not (isinstance(self.__time_budget_s, numbers.Real)
+                    and not isinstance(self.__time_budget_s, bool)
+                    and self.__time_budget_s > 0):
+                err0 = "`time_budget_s` must be a positive number."
+                raise ValueError(err0)
+            if self.__delta2 or self.__mini_meta:
+                err0 = "`time_budget_s` cannot be used with `delta2` or `mini_meta`."
+                raise ValueError(err0)
+
         # Check if it is a valid mini_meta case
         if self.__mini_meta:
             # Only mini_meta calculation but not proportional and delta-delta function
@@ -609,6 +817,22 @@ class Dabest(object):
                     err1 = " Please check `idx` and try again."
                     raise IndexError(err0 + err1)
 
+            # check the frequency weights are whole numbers of occurrences.
+            if self.__weights is not None:
+                if self.__weights not in self.__output_data.columns:
+                    err = "{0} is not a column in `data`. Please check.".format(self.__weights)
+                    raise IndexError(err)
+                weights = self.__output_data[self.__weights]
+                if not issubdtype(weights.dtype, number):
+                    err = "{0} is a column in `data`, but it is not numeric.".format(self.__weights)
+                    raise ValueError(err)
+                if not (weights.notnull().all() and (weights >= 0).all()
+                        and (weights == np.floor(weights)).all()):
+                    err = "The frequency weights in {0} must be non-negative whole numbers.".format(
+                        self.__weights
+                    )
+                    raise ValueError(err)
+
             # Select only rows where the value in the `x` column
             # is found in `idx`.
             plot_data = self.__output_data[
@@ -629,6 +853,10 @@ class Dabest(object):
             self.__xvar = "group"
             self.__yvar = "value"
 
+            if self.__weights is not None:
+                err = "`weights` can only be used with long data, when `x` and `y` are given."
+                raise ValueError(err)
+
             # Check if there is NaN under any of the paired settings
             if self.__is_paired is not None and self.__output_data.isnull().values.any():
                 import warnings
@@ -669,8 +897,45 @@ class Dabest(object):
                 plot_data[self.__xvar], categories=all_plot_groups, ordered=True
             )
 
+        self.__group_index = self._build_group_index(plot_data, all_plot_groups)
+
         return plot_data
 
+    def _build_group_index(self, plot_data, all_plot_groups):
+        """
+        Returns a dict mapping each group to the positions of its rows in
+        `plot_data`, in their original order.
+
+        The rows are ordered by their group's categorical code once, so that
+        each group is a contiguous slice of that ordering, instead of being
+        found by scanning the whole frame for every group.
+        """
+        codes = plot_data[self.__xvar].cat.codes.to_numpy()
+        order = np.argsort(codes, kind="stable")
+        # Rows without a group have code -1, and are sorted first.
+        bounds = np.cumsum(np.bincount(codes + 1, minlength=len(all_plot_groups) + 1))
+
+        return {
+            group: order[bounds[i] : bounds[i + 1]]
+            for i, group in enumerate(all_plot_groups)
+        }
+
+    def _get_group_data(self, group):
+        """
+        Returns the `yvar` values of `group`, as a new pandas Series,
+        from the group index built with the plot data.
+        """
+        return self.__plot_data[self.__yvar].take(self.__group_index[group])
+
+    def _get_group_weights(self, group):
+        """
+        Returns the frequency weights of the `yvar` values of `group`, in the
+        same order as `_get_group_data`, or None if there are none.
+        """
+        if self.__weights is None:
+            return None
+        return self.__plot_data[self.__weights].take(self.__group_index[group])
+
     def _compute_effectsize_dfs(self):
         '''
         Function to compute all attributes based on EffectSizeDataFrame.
@@ -689,6 +954,18 @@ class Dabest(object):
             x1_level=self.__x1_level,
             x2=self.__x2,
             mini_meta=self.__mini_meta,
+            n_jobs=self.__n_jobs,
+            executor=self.__executor,
+            ci_precision=self.__ci_precision,
+            time_budget_s=self.__time_budget_s,
+            engine=self.__engine,
+            rng_mode=self.__rng_mode,
+            tests=self.__tests,
+            permutation_count=self.__permutation_count,
+            intervals=self.__intervals,
+            permutation=self.__permutation,
+            profile=self.__profile,
+            exact=self.__exact,
         )
 
         self.__mean_diff = EffectSizeDataFrame(
@@ -77,8 +77,8 @@ class DeltaDelta(object):
             self.__bootstraps_delta_delta, self.__difference
         )
 
-        self.__jackknives = np.array(
-            ci1g.compute_1group_jackknife(self.__bootstraps_delta_delta, np.mean)
+        self.__jackknives = ci1g.compute_1group_mean_jackknife(
+            self.__bootstraps_delta_delta
         )
 
         self.__acceleration_value = ci2g._calc_accel(self.__jackknives)
@@ -379,20 +379,17 @@ class MiniMetaDelta(object):
 
 
         idx  = self.__dabest_obj.idx
-        dat  = self.__dabest_obj._plot_data
-        xvar = self.__dabest_obj._xvar
-        yvar = self.__dabest_obj._yvar
 
         # compute the variances of each control group and each test group
         control_var=[]
         test_var=[]
         for j, current_tuple in enumerate(idx):
             cname = current_tuple[0]
-            control = dat[dat[xvar] == cname][yvar].copy()
+            control = self.__dabest_obj._get_group_data(cname)
             control_var.append(np.var(control, ddof=1))
 
             tname = current_tuple[1]
-            test = dat[dat[xvar] == tname][yvar].copy()
+            test = self.__dabest_obj._get_group_data(tname)
             test_var.append(np.var(test, ddof=1))
         self.__control_var = np.array(control_var)
         self.__test_var    = np.array(test_var)
@@ -421,9 +418,8 @@ class MiniMetaDelta(object):
         self.__bias_correction = ci2g.compute_meandiff_bias_correction(
                                     self.__bootstraps_weighted_delta, self.__difference)
         
-        self.__jackknives = np.array(ci1g.compute_1group_jackknife(
-                                                self.__bootstraps_weighted_delta, 
-                                                np.mean))
+        self.__jackknives = ci1g.compute_1group_mean_jackknife(
+                                                self.__bootstraps_weighted_delta)
 
         self.__acceleration_value = ci2g._calc_accel(self.__jackknives)
 
@@ -484,27 +480,19 @@ class MiniMetaDelta(object):
         Perform a permutation test and obtain the permutation p-value
         based on the permutation data.
         """
+        from ._stats_tools import confint_2group_diff as ci2g
+
         self.__permutations     = np.array(self.__effsizedf["permutations"])
         self.__permutations_var = np.array(self.__effsizedf["permutations_var"])
 
         THRESHOLD = np.abs(self.__difference)
 
-        all_num = []
-        all_denom = []
-
-        groups = len(self.__permutations)
-        for i in range(0, len(self.__permutations[0])):
-            weight = [1/self.__permutations_var[j][i] for j in range(0, groups)]
-            all_num.append(np.sum([weight[j]*self.__permutations[j][i] for j in range(0, groups)]))
-            all_denom.append(np.sum(weight))
-        
-        output=[]
-        for i in range(0, len(all_num)):
-            output.append(all_num[i]/all_denom[i])
-        
-        self.__permutations_weighted_delta = np.array(output)
+        # Each permutation is weighted by its own pooled group variance.
+        self.__permutations_weighted_delta = ci2g.calculate_weighted_delta(
+                                                np.stack(self.__permutations_var),
+                                                self.__permutations)
 
-        count = sum(np.abs(self.__permutations_weighted_delta)>THRESHOLD)
+        count = np.count_nonzero(np.abs(self.__permutations_weighted_delta)>THRESHOLD)
         self.__pvalue_permutation = count/self.__permutation_count
 
 
@@ -1,7 +1,7 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/API/effsize_objects.ipynb.
 
 # %% auto 0
-__all__ = ['TwoGroupsEffectSize', 'EffectSizeDataFrame', 'PermutationTest']
+__all__ = ['STATISTICAL_TESTS', 'PROFILED_STAGES', 'TwoGroupsEffectSize', 'EffectSizeDataFrame', 'PermutationTest']
 
 # %% ../nbs/API/effsize_objects.ipynb 5
 import pandas as pd
@@ -11,16 +11,48 @@ from scipy.special import binom as binomcoeff  # devMJBL
 from scipy.stats import binom  # devMJBL
 from scipy.integrate import fixed_quad  # devMJBL
 from numpy import arange, mean  # devMJBL
+import numpy as np
 from numpy import array, isnan, isinf, repeat, random, isin, abs, var
 from numpy import sort as npsort
 from numpy import nan as npnan
-from numpy.random import PCG64, RandomState
 from statsmodels.stats.contingency_tables import mcnemar
 import warnings
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, islice, repeat as iterrepeat
+from math import comb, lgamma, log
 from string import Template
 import scipy.stats as spstats
+from .misc_tools import _StageProfiler, _profile_stage
 
 # %% ../nbs/API/effsize_objects.ipynb 6
+# The statistical tests that can be performed on a contrast. Those that do
+# not apply to its data report NaN.
+STATISTICAL_TESTS = ("permutation", "welch", "students_t", "mann_whitney", "brunner_munzel",
+                     "wilcoxon", "paired_students_t", "mcnemar", "kruskal")
+
+# The statistical test reported by each attribute of `TwoGroupsEffectSize`.
+_TEST_OF_ATTRIBUTE = dict(
+    [("permutations", "permutation"), ("permutation_count", "permutation"),
+     ("permutations_var", "permutation")] +
+    [(kind + "_" + test, test) for test in STATISTICAL_TESTS for kind in ("pvalue", "statistic")]
+)
+
+
+# The stages of a contrast recorded with `profile=True`.
+PROFILED_STAGES = ("difference", "jackknife", "bootstrap", "intervals", "permutation",
+                   "tests")
+
+
+def _check_intervals(intervals, name="intervals"):
+    if (isinstance(intervals, str) or not len(intervals) or
+            not all(i in ("bca", "percentile") for i in intervals)):
+        err = ("`{}` must be a non-empty list among ['bca', 'percentile'], "
+               "not {}.".format(name, intervals))
+        raise ValueError(err)
+
+
 class TwoGroupsEffectSize(object):
 
     """
@@ -51,6 +83,74 @@ class TwoGroupsEffectSize(object):
             `random_seed` is used to seed the random number generator during
             bootstrap resampling. This ensures that the confidence intervals
             reported are replicable.
+        index_cache : dict, default None
+            If given, the bootstrap resamples and permutations are stored
+            in, or read from, this dict, so that they are drawn only once
+            for all the effect sizes computed with it.
+        ci_precision : float, default None
+            If given, the bootstrap is adaptive: resamples are drawn in
+            blocks until the Monte Carlo standard error of every limit of
+            the percentile and BCa intervals is at most `ci_precision`
+            times the width of the interval, or until `resamples`
+            resamples were drawn. `resamples` then reports the number of
+            resamples actually drawn.
+        time_budget_s : float, default None
+            If given, the bootstrap resamples and the permutations are drawn
+            in blocks until, respectively, half and all of this many seconds
+            have passed. `resamples` and `permutation_count` then report the
+            numbers actually drawn, and `truncated` whether either is short
+            of the number requested.
+        engine : string, default 'vectorized'
+            The resampling engine of the bootstrap and the permutation test,
+            one of 'vectorized', 'loop', 'counts' or 'poisson'. The 'counts'
+            engine only applies to binary data, which is resampled from its
+            counts of ones; its jackknife is likewise computed from the
+            counts. The 'poisson' engine only applies to unpaired groups,
+            which are bootstrapped in a single pass with
+            `compute_poisson_bootstrapped_diff`, and so does the 'blb'
+            engine, which bootstraps them with the Bag of Little Bootstraps
+            of `compute_blb_bootstrapped_diff` and averages the intervals of
+            its subsets. With either, the permutations are drawn by the
+            vectorized engine.
+        control_weights, test_weights : array-like, default None
+            If given, the frequency of each value of the unpaired groups,
+            which are then treated as if each value were repeated as many
+            times as its weight, without being expanded. Values with zero
+            weights are dropped with the missing values.
+        rng_mode : string, default 'legacy'
+            If 'legacy', the bootstraps are drawn from
+            `RandomState(PCG64(random_seed))` and the permutations from
+            `RandomState(PCG64(12345))`, as in earlier versions. If
+            'generator', both are drawn from `Generator` streams spawned
+            from `random_seed`, which may then also be a `SeedSequence`
+            (see `compute_bootstrapped_diff`).
+        tests : list of strings, default ()
+            The statistical tests, among `STATISTICAL_TESTS`, that are
+            performed when the object is created. The others are performed
+            on first access of their `pvalue_*` and `statistic_*` attributes
+            (or, for the permutation test, `permutations`,
+            `permutation_count` and `permutations_var`), and memoized. With
+            `time_budget_s`, the permutation test is always performed when
+            the object is created.
+        intervals : tuple of strings, default ('bca', 'percentile')
+            The confidence intervals computed, among 'bca' and
+            'percentile'. Without 'bca', neither the jackknife nor the
+            acceleration and bias correction are computed, and the BCa
+            limits and indexes are NaN and None; likewise for the
+            percentile interval without 'percentile'.
+        profile : boolean, default False
+            If True, the wall time, number of calls and peak allocated
+            bytes of each stage ('difference', 'jackknife', 'bootstrap',
+            'intervals', 'permutation' and 'tests') are recorded in
+            `timings` (see `misc_tools._StageProfiler`).
+        exact : boolean or 'auto', default False
+            Whether the permutation test enumerates every distinct
+            relabelling of the groups instead of drawing
+            `permutation_count` random permutations (see
+            `PermutationTest`).
+        executor : concurrent.futures.Executor, default None
+            If given, the subsets of the 'blb' engine are bootstrapped on
+            it. It is not kept by the object.
 
         Returns
         -------
@@ -88,10 +188,29 @@ class TwoGroupsEffectSize(object):
         resamples=5000,
         permutation_count=5000,
         random_seed=12345,
+        index_cache=None,
+        ci_precision=None,
+        time_budget_s=None,
+        engine="vectorized",
+        control_weights=None,
+        test_weights=None,
+        rng_mode="legacy",
+        tests=(),
+        intervals=("bca", "percentile"),
+        profile=False,
+        exact=False,
+        executor=None,
     ):
         from ._stats_tools import confint_2group_diff as ci2g
         from ._stats_tools import effsize as es
 
+        # The deadlines are set before any work, so the budget covers it all.
+        self.__deadline = None
+        if time_budget_s is not None:
+            start = time.perf_counter()
+            self.__deadline = start + time_budget_s
+            bootstrap_deadline = start + time_budget_s / 2
+
         self.__EFFECT_SIZE_DICT = {
             "mean_diff": "mean difference",
             "median_diff": "median difference",
@@ -108,71 +227,138 @@ class TwoGroupsEffectSize(object):
         self.__random_seed = random_seed
         self.__ci = ci
         self.__proportional = proportional
+        self.__index_cache = index_cache
+        self.__time_budget_s = time_budget_s
+        self.__engine = engine
+        self.__rng_mode = rng_mode
+        self.__tests = tuple(tests)
+        self.__intervals = tuple(intervals)
+        self.__weighted = control_weights is not None or test_weights is not None
+        self.__profiler = _StageProfiler() if profile else None
+        self.__exact = exact
         self._check_errors(control, test)
 
         # Convert to numpy arrays for speed.
         # NaNs are automatically dropped.
         control = array(control)
         test = array(test)
-        self.__control = control[~isnan(control)]
-        self.__test = test[~isnan(test)]
+        if self.__weighted:
+            self.__control, self.__control_weights = _drop_unobserved(control, control_weights)
+            self.__test, self.__test_weights = _drop_unobserved(test, test_weights)
+        else:
+            self.__control = control[~isnan(control)]
+            self.__test = test[~isnan(test)]
+            self.__control_weights = self.__test_weights = None
         self.__permutation_count = permutation_count
 
         self.__alpha = ci2g._compute_alpha_from_ci(self.__ci)
 
-        self.__difference = es.two_group_difference(
-            self.__control, self.__test, self.__is_paired, self.__effect_size
-        )
-
-        self.__jackknives = ci2g.compute_meandiff_jackknife(
-            self.__control, self.__test, self.__is_paired, self.__effect_size
-        )
+        with _profile_stage(self.__profiler, "difference"):
+            if self.__weighted:
+                self.__difference = es._weighted_difference(
+                    self.__control, self.__control_weights[None],
+                    self.__test, self.__test_weights[None], self.__effect_size
+                )[0]
+            else:
+                self.__difference = es.two_group_difference(
+                    self.__control, self.__test, self.__is_paired, self.__effect_size
+                )
 
-        self.__acceleration_value = ci2g._calc_accel(self.__jackknives)
+        if "bca" not in self.__intervals:
+            # Only needed for the BCa interval, for which the jackknife is
+            # the most expensive stage.
+            self.__acceleration_value = npnan
+        else:
+            with _profile_stage(self.__profiler, "jackknife"):
+                self._compute_acceleration()
+
+        converged = None
+        if ci_precision is not None or time_budget_s is not None:
+            def converged(bootstraps):
+                if time_budget_s is not None and time.perf_counter() >= bootstrap_deadline:
+                    return True
+                if ci_precision is None:
+                    return False
+                precision = ci2g.compute_interval_precision(
+                    bootstraps, self.__difference, self.__acceleration_value, self.__ci
+                )
+                return precision <= ci_precision
 
-        bootstraps = ci2g.compute_bootstrapped_diff(
-            self.__control,
-            self.__test,
-            self.__is_paired,
-            self.__effect_size,
-            self.__resamples,
-            self.__random_seed,
+        # Kept to continue the bootstrap in `extend_resamples`.
+        self.__bootstrap_streams = ci2g._ResampleStreams(
+            self.__random_seed, self.__rng_mode, (ci2g.BOOTSTRAP_STREAM,)
         )
-        self.__bootstraps = bootstraps
-
-        sorted_bootstraps = npsort(self.__bootstraps)
-        # Added in v0.2.6.
-        # Raises a UserWarning if there are any infiinities in the bootstraps.
-        num_infinities = len(self.__bootstraps[isinf(self.__bootstraps)])
-
-        if num_infinities > 0:
-            warn_msg = (
-                "There are {} bootstrap(s) that are not defined. "
-                "This is likely due to smaple sample sizes. "
-                "The values in a bootstrap for a group will be more likely "
-                "to be all equal, with a resulting variance of zero. "
-                "The computation of Cohen's d and Hedges' g thus "
-                "involved a division by zero. "
+        with _profile_stage(self.__profiler, "bootstrap"):
+            bootstraps = ci2g.compute_bootstrapped_diff(
+                self.__control,
+                self.__test,
+                self.__is_paired,
+                self.__effect_size,
+                self.__resamples,
+                self.__random_seed,
+                engine=self.__engine,
+                index_cache=self.__index_cache,
+                converged=converged,
+                x0_weights=self.__control_weights,
+                x1_weights=self.__test_weights,
+                rng_mode=self.__rng_mode,
+                streams=self.__bootstrap_streams,
+                executor=executor,
             )
-            warnings.warn(warn_msg.format(num_infinities), category=UserWarning)
-
-        self.__bias_correction = ci2g.compute_meandiff_bias_correction(
-            self.__bootstraps, self.__difference
+        self.__bootstraps = bootstraps
+        # An adaptive bootstrap may stop early by design, not only on the deadline.
+        bootstrap_truncated = (
+            time_budget_s is not None and len(bootstraps) < self.__resamples
+            and time.perf_counter() >= bootstrap_deadline
         )
+        self.__resamples = len(bootstraps)
 
-        self._compute_bca_intervals(sorted_bootstraps)
-
-        # Compute percentile intervals.
-        pct_idx_low = int((self.__alpha / 2) * self.__resamples)
-        pct_idx_high = int((1 - (self.__alpha / 2)) * self.__resamples)
-
-        self.__pct_interval_idx = (pct_idx_low, pct_idx_high)
-        self.__pct_low = sorted_bootstraps[pct_idx_low]
-        self.__pct_high = sorted_bootstraps[pct_idx_high]
+        with _profile_stage(self.__profiler, "intervals"):
+            self._compute_intervals()
 
-        self._perform_statistical_test()
+        if self.__proportional and not self.__is_paired:
+            # The Cohen's h calculation is for binary categorical data
+            if self.__weighted:
+                self.__proportional_difference = es._weighted_difference(
+                    self.__control, self.__control_weights[None],
+                    self.__test, self.__test_weights[None], "cohens_h"
+                )[0]
+            else:
+                try:
+                    self.__proportional_difference = es.cohens_h(
+                        self.__control, self.__test
+                    )
+                except ValueError as e:
+                    warnings.warn(f"Calculation of Cohen's h failed. This method is applicable "
+                      f"only for binary data (0's and 1's). Details: {e}")
+
+        # The other tests are performed on first use. The permutations must
+        # be drawn within the time budget.
+        self.__test_results = {}
+        for test in self.__tests:
+            if test != "permutation":
+                self._statistical_test(test)
+        if "permutation" in self.__tests or time_budget_s is not None:
+            self._permutation_test()
+
+        if time_budget_s is not None:
+            permutations_truncated = (
+                self.permutation_count < self.__permutation_count
+                and not self.__PermutationTest_result.exact
+            )
+            self.__truncated = bootstrap_truncated or permutations_truncated
+            if self.__truncated:
+                warnings.warn(
+                    "The time budget of {} s was reached after {} bootstrap "
+                    "resamples and {} permutations were taken; the confidence "
+                    "intervals and the permutation p-value are less precise "
+                    "than requested.".format(
+                        time_budget_s, self.__resamples, self.permutation_count
+                    )
+                )
 
-    def __repr__(self, show_resample_count=True, define_pval=True, sigfig=3):
+    def __repr__(self, show_resample_count=True, define_pval=True, sigfig=3,
+                 show_pvalue=True):
         RM_STATUS = {
             "baseline": "for repeated measures against baseline \n",
             "sequential": "for the sequential design of repeated-measures experiment \n",
@@ -199,16 +385,29 @@ class TwoGroupsEffectSize(object):
         else:
             ci_width = str(self.__ci)
 
+        # The BCa interval is reported, unless only the percentile one was computed.
+        bca = "bca" in self.__intervals
         ci_out = {
             "es": base_string_fmt.format(self.__difference),
             "ci": ci_width,
-            "bca_low": base_string_fmt.format(self.__bca_low),
-            "bca_high": base_string_fmt.format(self.__bca_high),
+            "bca_low": base_string_fmt.format(self.__bca_low if bca else self.__pct_low),
+            "bca_high": base_string_fmt.format(self.__bca_high if bca else self.__pct_high),
         }
 
         out2 = "is {es} [{ci}%CI {bca_low}, {bca_high}].".format(**ci_out)
         out = out1 + out2
 
+        bs1 = "{} bootstrap samples were taken; ".format(self.__resamples)
+        if bca:
+            bs2 = "the confidence interval is bias-corrected and accelerated."
+        else:
+            bs2 = "the confidence interval is a percentile interval."
+        bs = bs1 + bs2
+
+        if not show_pvalue:
+            # The permutation test was not requested.
+            return "{}\n\n{}".format(out, bs) if show_resample_count else out
+
         pval_rounded = base_string_fmt.format(self.pvalue_permutation)
 
         p1 = "The p-value of the two-sided permutation t-test is {}, ".format(
@@ -217,10 +416,6 @@ class TwoGroupsEffectSize(object):
         p2 = "calculated for legacy purposes only. "
         pvalue = p1 + p2
 
-        bs1 = "{} bootstrap samples were taken; ".format(self.__resamples)
-        bs2 = "the confidence interval is bias-corrected and accelerated."
-        bs = bs1 + bs2
-
         pval_def1 = (
             "Any p-value reported is the probability of observing the"
             + "effect size (or greater),\nassuming the null hypothesis of "
@@ -245,6 +440,8 @@ class TwoGroupsEffectSize(object):
         '''
         Function to check configuration errors for the given control and test data.
         '''
+        from ._stats_tools import confint_2group_diff as ci2g
+
         kosher_es = [a for a in self.__EFFECT_SIZE_DICT.keys()]
         if self.__effect_size not in kosher_es:
             err1 = "The effect size '{}'".format(self.__effect_size)
@@ -267,6 +464,170 @@ class TwoGroupsEffectSize(object):
             )
             raise ValueError(err1)
 
+        if self.__weighted and self.__is_paired:
+            raise ValueError("Frequency weights cannot be used with paired data.")
+
+        if self.__weighted and self.__engine in ("counts", "poisson", "blb"):
+            raise ValueError("The '{}' engine cannot be used with frequency weights."
+                             .format(self.__engine))
+
+        ci2g._check_rng_mode(self.__rng_mode)
+
+        if self.__exact not in (True, False, "auto"):
+            err = "`exact` must be one of [True, False, 'auto'], not '{}'.".format(self.__exact)
+            raise ValueError(err)
+
+        for test in self.__tests:
+            if test not in STATISTICAL_TESTS:
+                err = "'{}' is not one of the statistical tests {}.".format(
+                    test, list(STATISTICAL_TESTS))
+                raise ValueError(err)
+
+        _check_intervals(self.__intervals)
+
+    def extend_resamples(self, resamples, permutation_count=0):
+        """
+        Draws `resamples` more bootstrap resamples, continuing the random
+        stream of those already drawn, and updates the confidence intervals.
+        The results are those of a contrast created with all the resamples.
+
+        If `permutation_count` is positive, the permutation test is
+        performed again with that many more permutations, as whether it is
+        exact, and the swaps of paired permutations, depend on all of them.
+
+        Only the vectorized and loop engines can be extended.
+        """
+        from ._stats_tools import confint_2group_diff as ci2g
+
+        if self.__engine not in ("vectorized", "loop"):
+            raise ValueError("The bootstrap of the '{}' engine cannot be extended."
+                             .format(self.__engine))
+        for count in (resamples, permutation_count):
+            if not isinstance(count, (int, np.integer)) or count < 0:
+                raise ValueError("`resamples` and `permutation_count` must be "
+                                 "non-negative integers, not {}.".format(count))
+
+        if resamples > 0:
+            streams = self.__bootstrap_streams
+            with _profile_stage(self.__profiler, "bootstrap"):
+                if streams.position < self.__resamples:
+                    # The first resamples were read from the index cache.
+                    ci2g._skip_bootstrap_resamples(
+                        streams, len(self.__control), len(self.__test), self.__is_paired,
+                        self.__resamples - streams.position
+                    )
+                bootstraps = ci2g.compute_bootstrapped_diff(
+                    self.__control,
+                    self.__test,
+                    self.__is_paired,
+                    self.__effect_size,
+                    resamples,
+                    self.__random_seed,
+                    engine=self.__engine,
+                    x0_weights=self.__control_weights,
+                    x1_weights=self.__test_weights,
+                    rng_mode=self.__rng_mode,
+                    streams=streams,
+                )
+            self.__bootstraps = np.concatenate([self.__bootstraps, bootstraps])
+            self.__resamples = len(self.__bootstraps)
+            with _profile_stage(self.__profiler, "intervals"):
+                self._compute_intervals()
+
+        if permutation_count > 0:
+            self.__permutation_count += permutation_count
+            # The extra permutations are taken whatever the time budget.
+            self.__deadline = None
+            try:
+                del self.__PermutationTest_result
+            except AttributeError:
+                pass
+            if "permutation" in self.__tests:
+                self._permutation_test()
+
+    def _compute_acceleration(self):
+        """
+        Computes the jackknife of the effect size and the acceleration of
+        the BCa interval.
+        """
+        from ._stats_tools import confint_2group_diff as ci2g
+
+        if self.__weighted:
+            jack_values, jack_counts = ci2g._compute_weighted_jackknife(
+                self.__control, self.__control_weights, self.__test, self.__test_weights,
+                self.__effect_size
+            )
+            self.__acceleration_value = ci2g._calc_accel(jack_values, jack_counts)
+        elif self.__engine == "counts" or (self.__engine in ("poisson", "blb")
+                                           and self.__proportional):
+            ci2g._check_binary_counts(self.__control, self.__test, self.__effect_size)
+            jack_values, jack_counts = ci2g._compute_binary_jackknife(
+                self.__control, self.__test, self.__is_paired, self.__effect_size
+            )
+            self.__acceleration_value = ci2g._calc_accel(jack_values, jack_counts)
+        else:
+            self.__jackknives = ci2g.compute_meandiff_jackknife(
+                self.__control, self.__test, self.__is_paired, self.__effect_size
+            )
+            self.__acceleration_value = ci2g._calc_accel(self.__jackknives)
+
+    def _compute_intervals(self):
+        """
+        Computes the bias correction and the confidence intervals of the
+        bootstraps.
+        """
+        from ._stats_tools import confint_2group_diff as ci2g
+
+        self.__sorted_bootstraps = sorted_bootstraps = npsort(self.__bootstraps)
+        # Added in v0.2.6.
+        # Raises a UserWarning if there are any infiinities in the bootstraps.
+        num_infinities = len(self.__bootstraps[isinf(self.__bootstraps)])
+
+        if num_infinities > 0:
+            warn_msg = (
+                "There are {} bootstrap(s) that are not defined. "
+                "This is likely due to smaple sample sizes. "
+                "The values in a bootstrap for a group will be more likely "
+                "to be all equal, with a resulting variance of zero. "
+                "The computation of Cohen's d and Hedges' g thus "
+                "involved a division by zero. "
+            )
+            warnings.warn(warn_msg.format(num_infinities), category=UserWarning)
+
+        if "bca" in self.__intervals:
+            self.__bias_correction = ci2g.compute_meandiff_bias_correction(
+                self.__bootstraps, self.__difference
+            )
+        else:
+            self.__bias_correction = npnan
+
+        if self.__engine == "blb":
+            # The limits are averaged over the subsets, and their indexes
+            # are those within each subset.
+            (self.__bca_low, self.__bca_high, self.__pct_low, self.__pct_high,
+             self.__bca_interval_idx, self.__pct_interval_idx) = ci2g.compute_blb_intervals(
+                self.__bootstraps, self.__difference, self.__acceleration_value, self.__ci
+            )
+        else:
+            if "bca" in self.__intervals:
+                self._compute_bca_intervals(sorted_bootstraps)
+
+            # Compute percentile intervals.
+            pct_idx_low = int((self.__alpha / 2) * self.__resamples)
+            pct_idx_high = int((1 - (self.__alpha / 2)) * self.__resamples)
+
+            self.__pct_interval_idx = (pct_idx_low, pct_idx_high)
+            self.__pct_low = sorted_bootstraps[pct_idx_low]
+            self.__pct_high = sorted_bootstraps[pct_idx_high]
+
+        # The intervals that were not requested are not reported.
+        if "bca" not in self.__intervals:
+            self.__bca_low = self.__bca_high = npnan
+            self.__bca_interval_idx = None
+        if "percentile" not in self.__intervals:
+            self.__pct_low = self.__pct_high = npnan
+            self.__pct_interval_idx = None
+
     def _compute_bca_intervals(self, sorted_bootstraps):
         '''
         Function to compute the bca intervals given the sorted bootstraps.
@@ -316,123 +677,254 @@ class TwoGroupsEffectSize(object):
                 self.__bca_high = self.__difference
                 warnings.warn(err_temp.substitute(lim_type="upper"), stacklevel=0)
 
-    def _perform_statistical_test(self):
+    def intervals(self, ci=None, kind=None):
+        """
+        Returns confidence intervals of several widths from the bootstraps
+        already drawn, with the same bias correction and acceleration.
+
+        Parameters
+        ----------
+        ci : float or list of floats, default None
+            The widths of the confidence intervals, in percent. Defaults to
+            the `ci` of the contrast.
+        kind : string or list of strings, default None
+            The confidence intervals returned, among 'bca' and 'percentile'.
+            Defaults to those that were computed.
+
+        Returns
+        -------
+        A pandas DataFrame with one row per width, with the columns `ci`,
+        `bca_low`, `bca_high`, `pct_low` and `pct_high` of the intervals
+        returned.
+        """
+        from ._stats_tools import confint_2group_diff as ci2g
+
+        ci = np.atleast_1d(self.__ci if ci is None else ci)
+        if kind is None:
+            kind = self.__intervals
+        elif isinstance(kind, str):
+            kind = (kind,)
+        _check_intervals(kind, "kind")
+        if "bca" in kind and "bca" not in self.__intervals:
+            raise ValueError("The BCa intervals cannot be computed, as the acceleration "
+                             "was not; add 'bca' to `intervals`.")
+
+        if self.__engine == "blb":
+            limits = [ci2g.compute_blb_intervals(self.__bootstraps, self.__difference,
+                                                 self.__acceleration_value, c)[:4]
+                      for c in ci]
+            limits = dict(zip(["bca_low", "bca_high", "pct_low", "pct_high"],
+                              np.transpose(limits)))
+        else:
+            limits = ci2g.compute_intervals(self.__sorted_bootstraps, self.__difference,
+                                            self.__bias_correction,
+                                            self.__acceleration_value, ci, kind)
+
+        columns = ["ci"]
+        if "bca" in kind:
+            columns += ["bca_low", "bca_high"]
+        if "percentile" in kind:
+            columns += ["pct_low", "pct_high"]
+        return pd.DataFrame(dict(limits, ci=ci), columns=columns)
+
+    def _perform_permutation_test(self):
         '''
-        Function to complete the statistical tests
+        Function to complete the permutation test.
         '''
-        from ._stats_tools import effsize as es
+        with _profile_stage(self.__profiler, "permutation"):
+            self.__PermutationTest_result = PermutationTest(
+                self.__control,
+                self.__test,
+                self.__effect_size,
+                self.__is_paired,
+                self.__permutation_count,
+                # Permutations cannot be accumulated in a single pass or subsampled.
+                engine="vectorized" if self.__engine in ("poisson", "blb") else self.__engine,
+                index_cache=self.__index_cache,
+                deadline=self.__deadline,
+                control_weights=self.__control_weights,
+                test_weights=self.__test_weights,
+                # The legacy permutations were always drawn with the default seed.
+                random_seed=12345 if self.__rng_mode == "legacy" else self.__random_seed,
+                rng_mode=self.__rng_mode,
+                exact=self.__exact,
+            )
+        # The cache is only needed while the resamples are drawn.
+        self.__index_cache = None
 
-        # Perform statistical tests.
-        self.__PermutationTest_result = PermutationTest(
-            self.__control,
-            self.__test,
-            self.__effect_size,
-            self.__is_paired,
-            self.__permutation_count,
-        )
+    def _permutation_test(self):
+        '''
+        Returns the `PermutationTest` of the contrast, performing it on
+        first use.
+        '''
+        try:
+            return self.__PermutationTest_result
+        except AttributeError:
+            self._perform_permutation_test()
+            return self.__PermutationTest_result
 
-        if self.__is_paired and not self.__proportional:
-            # Wilcoxon, a non-parametric version of the paired T-test.
-            try:
-                wilcoxon = spstats.wilcoxon(self.__control, self.__test)
-                self.__pvalue_wilcoxon = wilcoxon.pvalue
-                self.__statistic_wilcoxon = wilcoxon.statistic
-            except ValueError as e:
-                warnings.warn("Wilcoxon test could not be performed. This might be due "
-                    "to no variability in the difference of the paired groups. \n"
-                    "Error: {}\n"
-                    "For detailed information, please refer to https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.wilcoxon.html "
-                    .format(e))
+    def _statistical_test(self, test):
+        '''
+        Returns the statistic and p-value of `test`, one of the
+        `STATISTICAL_TESTS` other than 'permutation', performing it on
+        first use.
+        '''
+        if test not in self.__test_results:
+            with _profile_stage(self.__profiler, "tests"):
+                if self.__weighted:
+                    self.__test_results[test] = self._perform_weighted_statistical_test(test)
+                else:
+                    self.__test_results[test] = self._perform_statistical_test(test)
+        return self.__test_results[test]
 
-            if self.__effect_size != "median_diff":
+    def _perform_statistical_test(self, test):
+        '''
+        Function to complete the statistical test `test`. Returns its
+        statistic and p-value, which are NaN if it does not apply to the
+        data.
+        '''
+        from ._stats_tools import effsize as es
+
+        if self.__is_paired and not self.__proportional:
+            if test == "wilcoxon":
+                # Wilcoxon, a non-parametric version of the paired T-test.
+                try:
+                    wilcoxon = spstats.wilcoxon(self.__control, self.__test)
+                    return wilcoxon.statistic, wilcoxon.pvalue
+                except ValueError as e:
+                    warnings.warn("Wilcoxon test could not be performed. This might be due "
+                        "to no variability in the difference of the paired groups. \n"
+                        "Error: {}\n"
+                        "For detailed information, please refer to https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.wilcoxon.html "
+                        .format(e))
+
+            elif test == "paired_students_t" and self.__effect_size != "median_diff":
                 # Paired Student's t-test.
                 paired_t = spstats.ttest_rel(
                     self.__control, self.__test, nan_policy="omit"
                 )
-                self.__pvalue_paired_students_t = paired_t.pvalue
-                self.__statistic_paired_students_t = paired_t.statistic
+                return paired_t.statistic, paired_t.pvalue
 
         elif self.__is_paired and self.__proportional:
-            # for binary paired data, use McNemar's test
-            # References:
-            # https://en.wikipedia.org/wiki/McNemar%27s_test
-
-            df_temp = pd.DataFrame({"control": self.__control, "test": self.__test})
-            x1 = len(df_temp[(df_temp["control"] == 0) & (df_temp["test"] == 0)])
-            x2 = len(df_temp[(df_temp["control"] == 0) & (df_temp["test"] == 1)])
-            x3 = len(df_temp[(df_temp["control"] == 1) & (df_temp["test"] == 0)])
-            x4 = len(df_temp[(df_temp["control"] == 1) & (df_temp["test"] == 1)])
-            table = [[x1, x2], [x3, x4]]
-            _mcnemar = mcnemar(table, exact=True, correction=True)
-            self.__pvalue_mcnemar = _mcnemar.pvalue
-            self.__statistic_mcnemar = _mcnemar.statistic
+            if test == "mcnemar":
+                # for binary paired data, use McNemar's test
+                # References:
+                # https://en.wikipedia.org/wiki/McNemar%27s_test
+
+                x1, x2, x3, x4 = es._binary_cells(self.__control, self.__test).tolist()
+                table = [[x1, x2], [x3, x4]]
+                _mcnemar = mcnemar(table, exact=True, correction=True)
+                return _mcnemar.statistic, _mcnemar.pvalue
 
         elif self.__proportional:
-            # The Cohen's h calculation is for binary categorical data
-            try:
-                self.__proportional_difference = es.cohens_h(
-                    self.__control, self.__test
-                )
-            except ValueError as e:
-                warnings.warn(f"Calculation of Cohen's h failed. This method is applicable "
-                  f"only for binary data (0's and 1's). Details: {e}")
+            # Cohen's h is reported instead, as `proportional_difference`.
+            pass
 
         elif self.__effect_size == "cliffs_delta":
-            # Let's go with Brunner-Munzel!
-            brunner_munzel = spstats.brunnermunzel(
-                self.__control, self.__test, nan_policy="omit"
-            )
-            self.__pvalue_brunner_munzel = brunner_munzel.pvalue
-            self.__statistic_brunner_munzel = brunner_munzel.statistic
+            if test == "brunner_munzel":
+                # Let's go with Brunner-Munzel!
+                brunner_munzel = spstats.brunnermunzel(
+                    self.__control, self.__test, nan_policy="omit"
+                )
+                return brunner_munzel.statistic, brunner_munzel.pvalue
 
         elif self.__effect_size == "median_diff":
-            # According to scipy's documentation of the function,
-            # "The Kruskal-Wallis H-test tests the null hypothesis
-            # that the population median of all of the groups are equal."
-            kruskal = spstats.kruskal(self.__control, self.__test, nan_policy="omit")
-            self.__pvalue_kruskal = kruskal.pvalue
-            self.__statistic_kruskal = kruskal.statistic
-
-        else:  # for mean difference, Cohen's d, and Hedges' g.
+            if test == "kruskal":
+                # According to scipy's documentation of the function,
+                # "The Kruskal-Wallis H-test tests the null hypothesis
+                # that the population median of all of the groups are equal."
+                kruskal = spstats.kruskal(self.__control, self.__test, nan_policy="omit")
+                return kruskal.statistic, kruskal.pvalue
+
+        elif test == "welch":  # for mean difference, Cohen's d, and Hedges' g.
             # Welch's t-test, assumes normality of distributions,
             # but does not assume equal variances.
             welch = spstats.ttest_ind(
                 self.__control, self.__test, equal_var=False, nan_policy="omit"
             )
-            self.__pvalue_welch = welch.pvalue
-            self.__statistic_welch = welch.statistic
+            return welch.statistic, welch.pvalue
 
+        elif test == "students_t":
             # Student's t-test, assumes normality of distributions,
             # as well as assumption of equal variances.
             students_t = spstats.ttest_ind(
                 self.__control, self.__test, equal_var=True, nan_policy="omit"
             )
-            self.__pvalue_students_t = students_t.pvalue
-            self.__statistic_students_t = students_t.statistic
+            return students_t.statistic, students_t.pvalue
 
+        elif test == "mann_whitney":
             # Mann-Whitney test: Non parametric,
             # does not assume normality of distributions
             try:
                 mann_whitney = spstats.mannwhitneyu(
                     self.__control, self.__test, alternative="two-sided"
                 )
-                self.__pvalue_mann_whitney = mann_whitney.pvalue
-                self.__statistic_mann_whitney = mann_whitney.statistic
+                return mann_whitney.statistic, mann_whitney.pvalue
             except ValueError as e:
                 warnings.warn("Mann-Whitney test could not be performed. This might be due "
                   "to identical rank values in both control and test groups. "
                   "Details: {}".format(e))
 
-            standardized_es = es.cohens_d(self.__control, self.__test, is_paired=None)
+        return npnan, npnan
+
+    def _perform_weighted_statistical_test(self, test):
+        '''
+        Function to complete the statistical test `test` of
+        frequency-weighted groups, which is that of the expanded groups.
+        Returns its statistic and p-value, which are NaN if it does not
+        apply to the data.
+        '''
+        from ._stats_tools import effsize as es
+
+        groups = (self.__control, self.__control_weights, self.__test, self.__test_weights)
+
+        if self.__proportional:
+            # Cohen's h is reported instead, as `proportional_difference`.
+            pass
+
+        elif self.__effect_size == "cliffs_delta":
+            if test == "brunner_munzel":
+                return _weighted_brunnermunzel(*groups)
+
+        elif self.__effect_size == "median_diff":
+            if test == "kruskal":
+                return _weighted_kruskal(*groups)
+
+        elif test in ("welch", "students_t"):  # for mean difference, Cohen's d, and Hedges' g.
+            control_n, control_mean, control_var = es._weighted_moments(
+                self.__control, self.__control_weights[None]
+            )
+            test_n, test_mean, test_var = es._weighted_moments(
+                self.__test, self.__test_weights[None]
+            )
+            stats = (control_mean[0], np.sqrt(control_var[0]), control_n[0],
+                     test_mean[0], np.sqrt(test_var[0]), test_n[0])
+
+            t_test = spstats.ttest_ind_from_stats(*stats, equal_var=test == "students_t")
+            return t_test.statistic, t_test.pvalue
+
+        elif test == "mann_whitney":
+            try:
+                return _weighted_mannwhitneyu(*groups)
+            except ValueError as e:
+                warnings.warn("Mann-Whitney test could not be performed. This might be due "
+                  "to identical rank values in both control and test groups. "
+                  "Details: {}".format(e))
 
+        return npnan, npnan
 
-    def to_dict(self):
+    def to_dict(self, tests=None):
         """
         Returns the attributes of the `dabest.TwoGroupEffectSize` object as a
-        dictionary.
+        dictionary. If `tests` is given, the attributes of the statistical
+        tests that are not in it are left out, and those tests are not
+        performed.
         """
         # Only get public (user-facing) attributes.
         attrs = [a for a in dir(self) if not a.startswith(("_", "to_dict"))]
+        if tests is not None:
+            attrs = [a for a in attrs
+                     if a not in _TEST_OF_ATTRIBUTE or _TEST_OF_ATTRIBUTE[a] in tests]
         out = {}
         for a in attrs:
             out[a] = getattr(self, a)
@@ -497,6 +989,17 @@ class TwoGroupsEffectSize(object):
         """
         return self.__random_seed
 
+    @property
+    def timings(self):
+        """
+        The `calls`, `wall_time_s` and `peak_bytes` of each stage of the
+        contrast run so far, if it was created with `profile=True`, and
+        None otherwise.
+        """
+        if self.__profiler is None:
+            return None
+        return self.__profiler.to_dict()
+
     @property
     def bca_interval_idx(self):
         return self.__bca_interval_idx
@@ -535,137 +1038,101 @@ class TwoGroupsEffectSize(object):
 
     @property
     def pvalue_brunner_munzel(self):
-        try:
-            return self.__pvalue_brunner_munzel
-        except AttributeError:
-            return npnan
+        return self._statistical_test("brunner_munzel")[1]
 
     @property
     def statistic_brunner_munzel(self):
-        try:
-            return self.__statistic_brunner_munzel
-        except AttributeError:
-            return npnan
+        return self._statistical_test("brunner_munzel")[0]
 
     @property
     def pvalue_wilcoxon(self):
-        try:
-            return self.__pvalue_wilcoxon
-        except AttributeError:
-            return npnan
+        return self._statistical_test("wilcoxon")[1]
 
     @property
     def statistic_wilcoxon(self):
-        try:
-            return self.__statistic_wilcoxon
-        except AttributeError:
-            return npnan
+        return self._statistical_test("wilcoxon")[0]
 
     @property
     def pvalue_mcnemar(self):
-        try:
-            return self.__pvalue_mcnemar
-        except AttributeError:
-            return npnan
+        return self._statistical_test("mcnemar")[1]
 
     @property
     def statistic_mcnemar(self):
-        try:
-            return self.__statistic_mcnemar
-        except AttributeError:
-            return npnan
+        return self._statistical_test("mcnemar")[0]
 
     @property
     def pvalue_paired_students_t(self):
-        try:
-            return self.__pvalue_paired_students_t
-        except AttributeError:
-            return npnan
+        return self._statistical_test("paired_students_t")[1]
 
     @property
     def statistic_paired_students_t(self):
-        try:
-            return self.__statistic_paired_students_t
-        except AttributeError:
-            return npnan
+        return self._statistical_test("paired_students_t")[0]
 
     @property
     def pvalue_kruskal(self):
-        try:
-            return self.__pvalue_kruskal
-        except AttributeError:
-            return npnan
+        return self._statistical_test("kruskal")[1]
 
     @property
     def statistic_kruskal(self):
-        try:
-            return self.__statistic_kruskal
-        except AttributeError:
-            return npnan
+        return self._statistical_test("kruskal")[0]
 
     @property
     def pvalue_welch(self):
-        try:
-            return self.__pvalue_welch
-        except AttributeError:
-            return npnan
+        return self._statistical_test("welch")[1]
 
     @property
     def statistic_welch(self):
-        try:
-            return self.__statistic_welch
-        except AttributeError:
-            return npnan
+        return self._statistical_test("welch")[0]
 
     @property
     def pvalue_students_t(self):
-        try:
-            return self.__pvalue_students_t
-        except AttributeError:
-            return npnan
+        return self._statistical_test("students_t")[1]
 
     @property
     def statistic_students_t(self):
-        try:
-            return self.__statistic_students_t
-        except AttributeError:
-            return npnan
+        return self._statistical_test("students_t")[0]
 
     @property
     def pvalue_mann_whitney(self):
-        try:
-            return self.__pvalue_mann_whitney
-        except AttributeError:
-            return npnan
+        return self._statistical_test("mann_whitney")[1]
 
     @property
     def statistic_mann_whitney(self):
-        try:
-            return self.__statistic_mann_whitney
-        except AttributeError:
-            return npnan
+        return self._statistical_test("mann_whitney")[0]
 
     @property
     def pvalue_permutation(self):
         """
         p value of permutation test
         """
-        return self.__PermutationTest_result.pvalue
+        return self._permutation_test().pvalue
 
     @property
     def permutation_count(self):
         """
         The number of permutations taken.
         """
-        return self.__PermutationTest_result.permutation_count
+        return self._permutation_test().permutation_count
 
     @property
     def permutations(self):
-        return self.__PermutationTest_result.permutations
+        return self._permutation_test().permutations
+
+    @property
+    def truncated(self):
+        """
+        Whether the bootstrap or the permutations were stopped by
+        `time_budget_s` short of the numbers requested, or None if there
+        is no time budget.
+        """
+        try:
+            return self.__truncated
+        except AttributeError:
+            return None
 
     @property
     def permutations_var(self):
-        return self.__PermutationTest_result.permutations_var
+        return self._permutation_test().permutations_var
 
     @property
     def proportional_difference(self):
@@ -694,11 +1161,82 @@ class EffectSizeDataFrame(object):
         delta2=False,
         experiment_label=None,
         mini_meta=False,
+        n_jobs=1,
+        executor=None,
+        ci_precision=None,
+        time_budget_s=None,
+        engine="vectorized",
+        rng_mode="legacy",
+        tests=None,
+        intervals=("bca", "percentile"),
+        permutation=True,
+        profile=False,
+        exact=False,
     ):
         """
         Parses the data from a Dabest object, enabling plotting and printing
         capability for the effect size of interest.
+
+        The contrasts are computed serially, unless `n_jobs` is greater
+        than 1 (or -1, for all CPUs), in which case they are spread across
+        a process pool of `n_jobs` workers, or unless an `executor` is
+        supplied, in which case they are computed on it. With the 'blb'
+        engine, the contrasts are computed one after another, and the
+        subsets of the Bag of Little Bootstraps of each of them are spread
+        across the workers or the executor instead.
+
+        If `time_budget_s` is given, it is shared evenly between the
+        contrasts that run one after another on each worker.
+
+        If `rng_mode` is 'generator', each contrast, and the delta-delta
+        bootstrap, is seeded with its own child of `random_seed`, spawned
+        with `SeedSequence.spawn`.
+
+        `tests` lists the statistical tests, among `STATISTICAL_TESTS`,
+        whose columns are reported in the results; None reports all of
+        them and False none. The other tests are not performed. If
+        `permutation` is False, the permutation test is left out of them.
+        It is always performed for `delta2` and `mini_meta`, whose
+        p-values are computed from its permutations.
+
+        `intervals` lists the confidence intervals computed for each
+        contrast, among 'bca' and 'percentile' (see `TwoGroupsEffectSize`).
+
+        If `profile` is True, the stages of each contrast, and those of
+        `plot`, are profiled; see `timings`.
+
+        `exact` is passed to the permutation test of each contrast (see
+        `PermutationTest`). It must be False for `delta2` and `mini_meta`,
+        which combine the random permutations of their contrasts.
         """
+        if n_jobs != -1 and not (isinstance(n_jobs, int) and n_jobs >= 1):
+            err = "`n_jobs` must be a positive integer or -1, not {}.".format(n_jobs)
+            raise ValueError(err)
+
+        if tests is None:
+            tests = STATISTICAL_TESTS
+        elif tests is False:
+            tests = ()
+        if isinstance(tests, str) or not all(t in STATISTICAL_TESTS for t in tests):
+            err = "`tests` must be None, False or a list of tests among {}, not {}.".format(
+                list(STATISTICAL_TESTS), tests)
+            raise ValueError(err)
+        if not permutation:
+            if delta2 or mini_meta:
+                err = "`permutation` cannot be False with `delta2` or `mini_meta`."
+                raise ValueError(err)
+            tests = [t for t in tests if t != "permutation"]
+        tests = tuple(tests)
+        if exact not in (True, False, "auto"):
+            err = "`exact` must be one of [True, False, 'auto'], not '{}'.".format(exact)
+            raise ValueError(err)
+        if exact is not False and (delta2 or mini_meta):
+            err = "`exact` must be False with `delta2` or `mini_meta`."
+            raise ValueError(err)
+        if (delta2 or mini_meta) and "permutation" not in tests:
+            tests += ("permutation",)
+
+        _check_intervals(intervals)
 
         self.__dabest_obj = dabest
         self.__effect_size = effect_size
@@ -713,94 +1251,200 @@ class EffectSizeDataFrame(object):
         self.__x2 = x2
         self.__delta2 = delta2
         self.__mini_meta = mini_meta
+        self.__n_jobs = n_jobs
+        self.__executor = executor
+        self.__ci_precision = ci_precision
+        self.__time_budget_s = time_budget_s
+        self.__engine = engine
+        self.__rng_mode = rng_mode
+        self.__tests = tests
+        self.__intervals = tuple(intervals)
+        self.__profile = bool(profile)
+        self.__exact = exact
+        self.__plot_profiler = None
+
+    def __map_contrasts(self, func, *iterables):
+        """
+        Returns the list of `func` applied to each contrast's arguments,
+        computed serially, on a process pool, or on the supplied executor.
+        """
+        if self.__engine == "blb":
+            return self.__map_blb_contrasts(func, *iterables)
+
+        if self.__executor is not None:
+            return list(self.__executor.map(func, *iterables))
+
+        n_jobs = self.__n_workers()
+        if n_jobs == 1:
+            return list(map(func, *iterables))
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            return list(executor.map(func, *iterables))
+
+    def __map_blb_contrasts(self, func, *iterables):
+        """
+        Returns the list of `func` applied to each contrast's arguments,
+        computed serially, with the subsets of their Bag of Little
+        Bootstraps bootstrapped on the process pool or the supplied
+        executor. There are more subsets than contrasts, and they cost
+        the most.
+        """
+        if self.__executor is not None:
+            return [func(*args, executor=self.__executor) for args in zip(*iterables)]
+
+        n_jobs = self.__n_workers()
+        if n_jobs == 1:
+            return list(map(func, *iterables))
+
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            return [func(*args, executor=executor) for args in zip(*iterables)]
+
+    def __n_workers(self):
+        """
+        Returns the number of contrasts that are computed at the same time.
+        """
+        if self.__executor is not None:
+            # Executors that do not report their size are assumed serial.
+            return getattr(self.__executor, "_max_workers", 1)
+        return os.cpu_count() if self.__n_jobs == -1 else self.__n_jobs
 
     def __pre_calc(self):
-        from .misc_tools import print_greeting, get_varname
         from ._stats_tools import confint_2group_diff as ci2g
-        from ._delta_objects import MiniMetaDelta, DeltaDelta
 
         idx = self.__dabest_obj.idx
-        dat = self.__dabest_obj._plot_data
-        xvar = self.__dabest_obj._xvar
-        yvar = self.__dabest_obj._yvar
 
-        out = []
-        reprs = []
+        contrasts = []
+        for j, current_tuple in enumerate(idx):
+            if self.__is_paired != "sequential":
+                cname = current_tuple[0]
+                control = self.__dabest_obj._get_group_data(cname)
+
+            for ix, tname in enumerate(current_tuple[1:]):
+                if self.__is_paired == "sequential":
+                    cname = current_tuple[ix]
+                    control = self.__dabest_obj._get_group_data(cname)
+                test = self.__dabest_obj._get_group_data(tname)
+                contrasts.append((j, ix, current_tuple, cname, tname, control, test,
+                                  self.__dabest_obj._get_group_weights(cname),
+                                  self.__dabest_obj._get_group_weights(tname)))
+
+        # In legacy mode, every contrast is seeded with the same `random_seed`.
+        # Otherwise, each contrast is seeded with its own child of it, and the
+        # delta-delta bootstrap with the last one. Either way, the results do
+        # not depend on where, or in which order, the contrasts are computed.
+        if self.__rng_mode == "generator":
+            seeds = np.random.SeedSequence(self.__random_seed).spawn(len(contrasts) + 1)
+        else:
+            seeds = [self.__random_seed] * (len(contrasts) + 1)
 
         if self.__delta2:
-            mixed_data = []
-            for j, current_tuple in enumerate(idx):
-                if self.__is_paired != "sequential":
-                    cname = current_tuple[0]
-                    control = dat[dat[xvar] == cname][yvar].copy()
-
-                for ix, tname in enumerate(current_tuple[1:]):
-                    if self.__is_paired == "sequential":
-                        cname = current_tuple[ix]
-                        control = dat[dat[xvar] == cname][yvar].copy()
-                    test = dat[dat[xvar] == tname][yvar].copy()
-                    mixed_data.append(control)
-                    mixed_data.append(test)
-            bootstraps_delta_delta = ci2g.compute_delta2_bootstrapped_diff(
+            # The control and test groups of the two contrasts. Their
+            # resamples are the same for every effect size, so they are
+            # drawn once and kept in the cache of the Dabest object.
+            mixed_data = [group for c in contrasts for group in c[5:7]]
+            self.__bootstraps_delta_delta = ci2g.compute_delta2_bootstrapped_diff(
                 mixed_data[0],
                 mixed_data[1],
                 mixed_data[2],
                 mixed_data[3],
                 self.__is_paired,
                 self.__resamples,
-                self.__random_seed,
+                seeds[-1],
+                index_cache=self.__dabest_obj._resample_index_cache,
+                rng_mode=self.__rng_mode,
             )
 
-        for j, current_tuple in enumerate(idx):
-            if self.__is_paired != "sequential":
-                cname = current_tuple[0]
-                control = dat[dat[xvar] == cname][yvar].copy()
+        # The resample indexes are shared through the cache of the Dabest
+        # object only when the contrasts are computed in this process.
+        serial = self.__engine == "blb" or (self.__executor is None and self.__n_jobs == 1)
+        index_cache = self.__dabest_obj._resample_index_cache if serial else None
+        contrast_budget = None
+        if self.__time_budget_s is not None:
+            rounds = -(-len(contrasts) // self.__n_workers())
+            contrast_budget = self.__time_budget_s / max(rounds, 1)
+        self.__contrast_groups = contrasts
+        self.__contrasts = self.__map_contrasts(
+            TwoGroupsEffectSize,
+            [c[5] for c in contrasts],
+            [c[6] for c in contrasts],
+            iterrepeat(self.__effect_size),
+            iterrepeat(self.__proportional),
+            iterrepeat(self.__is_paired),
+            iterrepeat(self.__ci),
+            iterrepeat(self.__resamples),
+            iterrepeat(self.__permutation_count),
+            seeds[:-1],
+            iterrepeat(index_cache),
+            iterrepeat(self.__ci_precision),
+            iterrepeat(contrast_budget),
+            iterrepeat(self.__engine),
+            [c[7] for c in contrasts],
+            [c[8] for c in contrasts],
+            iterrepeat(self.__rng_mode),
+            iterrepeat(self.__tests),
+            iterrepeat(self.__intervals),
+            iterrepeat(self.__profile),
+            iterrepeat(self.__exact),
+        )
 
-            for ix, tname in enumerate(current_tuple[1:]):
-                if self.__is_paired == "sequential":
-                    cname = current_tuple[ix]
-                    control = dat[dat[xvar] == cname][yvar].copy()
-                test = dat[dat[xvar] == tname][yvar].copy()
+        self.__collect_results()
 
-                result = TwoGroupsEffectSize(
-                    control,
-                    test,
-                    self.__effect_size,
-                    self.__proportional,
-                    self.__is_paired,
-                    self.__ci,
-                    self.__resamples,
-                    self.__permutation_count,
-                    self.__random_seed,
-                )
-                r_dict = result.to_dict()
-                r_dict["control"] = cname
-                r_dict["test"] = tname
+    def __collect_results(self):
+        """
+        Tabulates the results of the contrasts, and computes the delta-delta
+        and weighted delta from them.
+        """
+        from .misc_tools import print_greeting, get_varname
+        from ._delta_objects import MiniMetaDelta, DeltaDelta
+
+        idx = self.__dabest_obj.idx
+
+        out = []
+        reprs = []
+
+        for (j, ix, current_tuple, cname, tname, control, test,
+             control_weights, test_weights), result in zip(self.__contrast_groups,
+                                                           self.__contrasts):
+            r_dict = result.to_dict(self.__tests)
+            r_dict["control"] = cname
+            r_dict["test"] = tname
+            # Reports the seed given, rather than the child of each contrast.
+            r_dict["random_seed"] = self.__random_seed
+            if control_weights is None:
                 r_dict["control_N"] = int(len(control))
                 r_dict["test_N"] = int(len(test))
-                out.append(r_dict)
-                if j == len(idx) - 1 and ix == len(current_tuple) - 2:
-                    if self.__delta2 and self.__effect_size in ["mean_diff", "delta_g"]:
-                        resamp_count = False
-                        def_pval = False
-                    elif self.__mini_meta and self.__effect_size == "mean_diff":
-                        resamp_count = False
-                        def_pval = False
-                    else:
-                        resamp_count = True
-                        def_pval = True
-                else:
+            else:
+                # The number of observations the weighted rows stand for.
+                r_dict["control_N"] = int(control_weights.sum())
+                r_dict["test_N"] = int(test_weights.sum())
+            if self.__profile:
+                for stage, record in result.timings.items():
+                    for key, value in record.items():
+                        r_dict["{}_{}".format(key, stage)] = value
+            out.append(r_dict)
+            if j == len(idx) - 1 and ix == len(current_tuple) - 2:
+                if self.__delta2 and self.__effect_size in ["mean_diff", "delta_g"]:
                     resamp_count = False
                     def_pval = False
+                elif self.__mini_meta and self.__effect_size == "mean_diff":
+                    resamp_count = False
+                    def_pval = False
+                else:
+                    resamp_count = True
+                    def_pval = True
+            else:
+                resamp_count = False
+                def_pval = False
 
-                text_repr = result.__repr__(
-                    show_resample_count=resamp_count, define_pval=def_pval
-                )
+            text_repr = result.__repr__(
+                show_resample_count=resamp_count, define_pval=def_pval,
+                show_pvalue="permutation" in self.__tests
+            )
 
-                to_replace = "between {} and {} is".format(cname, tname)
-                text_repr = text_repr.replace("is", to_replace, 1)
+            to_replace = "between {} and {} is".format(cname, tname)
+            text_repr = text_repr.replace("is", to_replace, 1)
 
-                reprs.append(text_repr)
+            reprs.append(text_repr)
 
         self.__for_print = "\n\n".join(reprs)
 
@@ -828,6 +1472,7 @@ class EffectSizeDataFrame(object):
             "pvalue_permutation",
             "permutation_count",
             "permutations_var",
+            "truncated",
             "pvalue_welch",
             "statistic_welch",
             "pvalue_students_t",
@@ -846,6 +1491,11 @@ class EffectSizeDataFrame(object):
             "statistic_kruskal",
             "proportional_difference",
         ]
+        if self.__profile:
+            columns_in_order += [
+                "{}_{}".format(key, stage) for stage in PROFILED_STAGES
+                for key in ("calls", "wall_time_s", "peak_bytes")
+            ]
         self.__results = out_.reindex(columns=columns_in_order)
         self.__results.dropna(axis="columns", how="all", inplace=True)
 
@@ -858,7 +1508,7 @@ class EffectSizeDataFrame(object):
         # Create and compute the delta-delta statistics
         if self.__delta2:
             self.__delta_delta = DeltaDelta(
-                self, self.__permutation_count, bootstraps_delta_delta, self.__ci
+                self, self.__permutation_count, self.__bootstraps_delta_delta, self.__ci
             )
             reprs.append(self.__delta_delta.__repr__(header=False))
         elif self.__delta2 and self.__effect_size not in ["mean_diff", "delta_g"]:
@@ -906,23 +1556,24 @@ class EffectSizeDataFrame(object):
     def __calc_lqrt(self):
         rnd_seed = self.__random_seed
         db_obj = self.__dabest_obj
-        dat = db_obj._plot_data
-        xvar = db_obj._xvar
-        yvar = db_obj._yvar
         delta2 = self.__delta2
 
+        if db_obj.weights is not None:
+            err = "The Lq-Likelihood-ratio-type test is not available for frequency-weighted data."
+            raise ValueError(err)
+
         out = []
 
         for j, current_tuple in enumerate(db_obj.idx):
             if self.__is_paired != "sequential":
                 cname = current_tuple[0]
-                control = dat[dat[xvar] == cname][yvar].copy()
+                control = db_obj._get_group_data(cname)
 
             for ix, tname in enumerate(current_tuple[1:]):
                 if self.__is_paired == "sequential":
                     cname = current_tuple[ix]
-                    control = dat[dat[xvar] == cname][yvar].copy()
-                test = dat[dat[xvar] == tname][yvar].copy()
+                    control = db_obj._get_group_data(cname)
+                test = db_obj._get_group_data(tname)
 
                 if self.__is_paired:
                     # Refactored here in v0.3.0 for performance issues.
@@ -963,6 +1614,68 @@ class EffectSizeDataFrame(object):
                     )
         self.__lqrt_results = pd.DataFrame(out)
 
+    def extend_resamples(self, resamples, permutation_count=0, contrasts=None):
+        """
+        Draws `resamples` more bootstrap resamples for some contrasts, and
+        `permutation_count` more permutations, and updates their results.
+        They are those that `dabest.load` would give with the larger counts;
+        see `TwoGroupsEffectSize.extend_resamples`.
+
+        Parameters
+        ----------
+        resamples : int
+            The number of bootstrap resamples added.
+        permutation_count : int, default 0
+            The number of permutations added.
+        contrasts : list of ints, default None
+            The rows of `results` of the contrasts extended. Defaults to all
+            of them.
+        """
+        if self.__delta2 or self.__mini_meta:
+            raise ValueError("The resamples cannot be extended with `delta2` or "
+                             "`mini_meta`, whose bootstraps are drawn with those "
+                             "of every contrast.")
+
+        self.results
+        if contrasts is None:
+            contrasts = range(len(self.__contrasts))
+        for i in contrasts:
+            if i not in range(len(self.__contrasts)):
+                raise ValueError("{} is not a row of `results`.".format(i))
+
+        for i in contrasts:
+            self.__contrasts[i].extend_resamples(resamples, permutation_count)
+        self.__collect_results()
+
+    def intervals(self, ci=None, kind=None):
+        """
+        Returns confidence intervals of several widths for every contrast,
+        from the bootstraps already drawn, without resampling again.
+
+        Parameters
+        ----------
+        ci : float or list of floats, default None
+            The widths of the confidence intervals, in percent. Defaults to
+            the `ci` given to `dabest.load`.
+        kind : string or list of strings, default None
+            The confidence intervals returned, among 'bca' and 'percentile'.
+            Defaults to the `intervals` given to `dabest.load`.
+
+        Returns
+        -------
+        A pandas DataFrame with one row per contrast and width.
+        """
+        columns = ["control", "test", "control_N", "test_N", "effect_size",
+                   "is_paired", "difference"]
+        frames = []
+        for (_, row), contrast in zip(self.results.iterrows(), self.__contrasts):
+            frame = contrast.intervals(ci, kind)
+            for position, column in enumerate(columns):
+                frame.insert(position, column, [row[column]] * len(frame))
+            frames.append(frame)
+
+        return pd.concat(frames, ignore_index=True)
+
     def plot(
         self,
         color_col=None,
@@ -1190,6 +1903,10 @@ class EffectSizeDataFrame(object):
         if self.__delta2:
             color_col = self.__x2
 
+        if ci_type == "bca" and "bca" not in self.__intervals:
+            raise ValueError("The BCa intervals were not computed; plot them with "
+                             "`ci_type='percentile'`, or add 'bca' to `intervals`.")
+
         # if self.__proportional:
         #     raw_marker_size = 0.01
 
@@ -1198,8 +1915,16 @@ class EffectSizeDataFrame(object):
 
         all_kwargs = locals()
         del all_kwargs["self"]
+        if self.__profile:
+            # Each plot is profiled anew.
+            self.__plot_profiler = _StageProfiler()
 
-        out = effectsize_df_plotter(self, **all_kwargs)
+        try:
+            out = effectsize_df_plotter(self, **all_kwargs)
+        finally:
+            if self.__plot_profiler is not None:
+                # Ends the stage an error was raised in.
+                self.__plot_profiler.stop()
 
         return out
 
@@ -1248,6 +1973,34 @@ class EffectSizeDataFrame(object):
 
         return results_df[cols_of_interest]
 
+    @property
+    def timings(self):
+        """
+        The `calls`, `wall_time_s` and `peak_bytes` of each stage of each
+        contrast, and of the last plot, as a DataFrame with one row per
+        contrast and stage; the stages of the plot have no `control` and
+        `test`. They are recorded only with `profile=True`; otherwise,
+        returns None.
+        """
+        if not self.__profile:
+            return None
+
+        rows = []
+        for (_, row), contrast in zip(self.results.iterrows(), self.__contrasts):
+            for stage, record in contrast.timings.items():
+                rows.append(dict(control=row["control"], test=row["test"], stage=stage,
+                                 **record))
+        if self.__plot_profiler is not None:
+            for stage, record in self.__plot_profiler.to_dict().items():
+                rows.append(dict(control=None, test=None, stage=stage, **record))
+
+        return pd.DataFrame(rows, columns=["control", "test", "stage", "calls",
+                                           "wall_time_s", "peak_bytes"])
+
+    @property
+    def _plot_profiler(self):
+        return self.__plot_profiler
+
     @property
     def _for_print(self):
         return self.__for_print
@@ -1392,6 +2145,54 @@ class PermutationTest:
         `random_seed` is used to seed the random number generator during
         bootstrap resampling. This ensures that the generated permutations
         are replicable.
+    engine : string, default 'vectorized'
+        If 'vectorized', the permutations are drawn in blocks of
+        `block_size` and their effect sizes and group variances are
+        computed for the whole block at once. For paired data, each block
+        is a matrix of control/test swaps; for the mean difference, the
+        permuted effect sizes are the paired differences multiplied by the
+        matching matrix of random signs. If 'loop', the permutations are
+        drawn and evaluated one at a time. Both engines draw the same
+        permutations for a given `random_seed`. If 'counts', which only
+        applies to 'mean_diff' and 'cohens_h' of binary data, the counts of
+        ones of each permutation are drawn instead of the permuted values,
+        in O(permutation_count) time whatever the size of the groups.
+    block_size : int, default None
+        The number of permutations evaluated per block by the vectorized
+        engine. If None, it is chosen to keep the memory of each block
+        bounded.
+    exact : boolean or 'auto', default False
+        If True, every distinct relabelling of the pooled sample (or, for
+        paired data, every one of the 2^n sets of control/test swaps) is
+        enumerated once, in blocks, instead of drawing `permutation_count`
+        random permutations. The p-value is then the exact proportion of
+        relabellings at least as extreme as the observed effect size. If
+        'auto', the relabellings are enumerated only when there are no
+        more of them than `permutation_count`. At most `_MAX_EXACT_COUNT`
+        (2^24) relabellings are enumerated; beyond it, `exact=True` raises
+        a ValueError and 'auto' draws random permutations.
+    index_cache : dict, default None
+        If given, the permutations drawn by the vectorized engine are
+        stored in, or read from, this dict, keyed by the group sizes,
+        `permutation_count` and `random_seed`, so that they are drawn
+        only once for all the effect sizes of a contrast.
+    deadline : float, default None
+        A `time.perf_counter()` value. If given, permutations are drawn in
+        blocks until the first block that ends after it, and
+        `permutation_count` then reports the number of permutations taken.
+        Exact enumeration ignores it.
+    control_weights, test_weights : array-like, default None
+        If given, the frequency of each value of the unpaired groups, whose
+        permutations are then drawn as counts of their values whatever the
+        engine (see `_permute_weighted`). Values with missing values or
+        zero weights are dropped.
+    rng_mode : string, default 'legacy'
+        If 'legacy', the permutations are drawn from
+        `RandomState(PCG64(random_seed))`, as in earlier versions. If
+        'generator', they are drawn from `Generator` streams spawned from
+        `random_seed`, which may then also be a `SeedSequence`, each shard
+        of permutations from its own stream (see
+        `confint_2group_diff._ResampleStreams`).
         
     Returns
     -------
@@ -1410,8 +2211,19 @@ class PermutationTest:
                  is_paired:str=None,
                  permutation_count:int=5000, # The number of permutations (reshuffles) to perform.
                  random_seed:int=12345,#`random_seed` is used to seed the random number generator during bootstrap resampling. This ensures that the generated permutations are replicable.
+                 engine:str="vectorized", # Either 'vectorized', 'loop' or 'counts'.
+                 block_size:int=None, # The number of permutations evaluated per block by the vectorized engine.
+                 exact=False, # Either True, False or 'auto'.
+                 index_cache:dict=None, # A dict in which drawn permutations are cached.
+                 deadline:float=None, # A `time.perf_counter()` value after which no more permutations are drawn.
+                 control_weights:array=None, # The frequency of each control value.
+                 test_weights:array=None, # The frequency of each test value.
+                 rng_mode:str="legacy", # Either 'legacy' or 'generator'.
                  **kwargs):
-        from ._stats_tools.effsize import two_group_difference
+        from ._stats_tools.confint_2group_diff import ADAPTIVE_CHECK_INTERVAL
+        from ._stats_tools.confint_2group_diff import PERMUTATION_STREAM, _ResampleStreams
+        from ._stats_tools.confint_2group_diff import _integers, _seed_key
+        from ._stats_tools.effsize import two_group_difference, _weighted_difference
         from ._stats_tools.confint_2group_diff import calculate_group_var
         
 
@@ -1421,59 +2233,166 @@ class PermutationTest:
         if is_paired and len(control) != len(test):
             raise ValueError("The two arrays do not have the same length.")
 
-        # Initialise random number generator.
-        # rng = random.default_rng(seed=random_seed)
-        rng = RandomState(PCG64(random_seed))
+        if engine not in ("vectorized", "loop", "counts"):
+            err = "`engine` must be one of ['vectorized', 'loop', 'counts'], not '{}'.".format(engine)
+            raise ValueError(err)
+
+        if exact not in (True, False, "auto"):
+            err = "`exact` must be one of [True, False, 'auto'], not '{}'.".format(exact)
+            raise ValueError(err)
+
+        # Initialise random number generators.
+        streams = _ResampleStreams(random_seed, rng_mode, (PERMUTATION_STREAM,))
 
         # Set required constants and variables
         control = array(control)
         test = array(test)
 
+        weighted = control_weights is not None or test_weights is not None
+        if weighted:
+            if is_paired:
+                raise ValueError("Frequency weights cannot be used with paired data.")
+            if exact is True:
+                raise ValueError("Exact permutation tests are not available for "
+                                 "frequency-weighted data.")
+            control, control_weights = _drop_unobserved(control, control_weights)
+            test, test_weights = _drop_unobserved(test, test_weights)
+
         control_sample = control.copy()
         test_sample    = test.copy()
 
-        BAG = array([*control, *test])
-        CONTROL_LEN = int(len(control))
-        TEST_LEN = int(len(test))  # devMJBL
-        EXTREME_COUNT = 0.
-        THRESHOLD = abs(two_group_difference(control, test, 
-                                                is_paired, effect_size))
+        BAG = np.concatenate([control, test])
+        if weighted:
+            CONTROL_LEN = int(control_weights.sum())
+            TEST_LEN = int(test_weights.sum())
+            THRESHOLD = abs(_weighted_difference(control, control_weights[None],
+                                                 test, test_weights[None], effect_size)[0])
+        else:
+            CONTROL_LEN = int(len(control))
+            TEST_LEN = int(len(test))  # devMJBL
+            THRESHOLD = abs(two_group_difference(control, test, 
+                                                    is_paired, effect_size))
         self.__permutations = []
         self.__permutations_var = []
 
-        for i in range(int(self.__permutation_count)):
+        # The batched kernels do not drop NaNs within each permutation.
+        has_nan = isnan(control).any() or isnan(test).any()
+        if has_nan and engine == "vectorized":
+            engine = "loop"
+
+        if exact is True and has_nan:
+            raise ValueError("Exact permutation tests are not available for "
+                             "data with missing values.")
+
+        # The number of relabellings is astronomically large for large groups,
+        # so it is only computed when its logarithm shows that it may be used.
+        if is_paired:
+            log_exact_count = CONTROL_LEN * log(2)
+        else:
+            log_exact_count = (lgamma(CONTROL_LEN + TEST_LEN + 1) - lgamma(CONTROL_LEN + 1)
+                               - lgamma(TEST_LEN + 1))
+        if exact is True and log_exact_count > log(_MAX_EXACT_COUNT):
+            err = ("Exact permutation tests enumerate at most {} relabellings, "
+                   "but these groups have about 10^{:.0f}. Use `exact=False` "
+                   "to draw random permutations.").format(_MAX_EXACT_COUNT,
+                                                          log_exact_count / log(10))
+            raise ValueError(err)
+
+        self.__exact = exact is True or (exact == "auto" and not has_nan and not weighted and
+                                         log_exact_count <= log(max(permutation_count, 1)) + 1
+                                         and log_exact_count <= log(_MAX_EXACT_COUNT) + 1)
+        if self.__exact:
             if is_paired:
-                # Select which control-test pairs to swap.
-                random_idx = rng.choice(CONTROL_LEN,
-                                rng.randint(0, CONTROL_LEN+1),
-                                replace=False)
-
-                # Perform swap.
-                for i in random_idx:
-                    _placeholder      = control_sample[i]
-                    control_sample[i] = test_sample[i]
-                    test_sample[i]    = _placeholder
-                
+                exact_count = 2 ** CONTROL_LEN
             else:
-                # Shuffle the bag and assign to control and test groups.
-                # NB. rng.shuffle didn't produce replicable results...
-                shuffled = rng.permutation(BAG) 
-                control_sample = shuffled[:CONTROL_LEN]
-                test_sample    = shuffled[CONTROL_LEN:]
+                exact_count = comb(CONTROL_LEN + TEST_LEN, TEST_LEN)
+            self.__exact = exact is True or exact_count <= min(permutation_count,
+                                                                _MAX_EXACT_COUNT)
+
+        if self.__exact:
+            self.__permutation_count = exact_count
+            if is_paired:
+                self.__permutations, self.__permutations_var = _enumerate_paired(
+                    control, test, effect_size, block_size
+                )
+            else:
+                self.__permutations, self.__permutations_var = _enumerate_unpaired(
+                    control, test, effect_size, block_size
+                )
+
+            # Count the relabellings at least as extreme as the observed one,
+            # which is itself one of them.
+            EXTREME_COUNT = _count_extreme(self.__permutations, THRESHOLD)
+            self.pvalue = EXTREME_COUNT / exact_count
+            return
+
+        if weighted:
+            self.__permutations, self.__permutations_var = _permute_weighted(
+                streams, control, control_weights, test, test_weights, effect_size,
+                self.__permutation_count, deadline
+            )
+        elif engine == "counts":
+            self.__permutations, self.__permutations_var = _permute_binary_counts(
+                streams, control, test, effect_size, self.__permutation_count, is_paired
+            )
+        elif engine == "vectorized" and is_paired:
+            key = ("paired_permutation", CONTROL_LEN, int(permutation_count),
+                   _seed_key(random_seed), rng_mode)
+            self.__permutations, self.__permutations_var = _permute_paired(
+                streams, control, test, effect_size, self.__permutation_count, block_size,
+                index_cache, key, deadline
+            )
+        elif engine == "vectorized":
+            key = ("permutation", CONTROL_LEN + TEST_LEN, int(permutation_count),
+                   _seed_key(random_seed), rng_mode)
+            self.__permutations, self.__permutations_var = _permute_unpaired(
+                streams, control, test, effect_size, self.__permutation_count, block_size,
+                index_cache, key, deadline
+            )
+        else:
+            for rng in streams.rows(self.__permutation_count):
+                if is_paired:
+                    # Select which control-test pairs to swap.
+                    random_idx = rng.choice(CONTROL_LEN,
+                                    _integers(rng, 0, CONTROL_LEN+1),
+                                    replace=False)
+
+                    # Perform swap.
+                    for i in random_idx:
+                        _placeholder      = control_sample[i]
+                        control_sample[i] = test_sample[i]
+                        test_sample[i]    = _placeholder
+                
+                else:
+                    # Shuffle the bag and assign to control and test groups.
+                    # NB. rng.shuffle didn't produce replicable results...
+                    shuffled = rng.permutation(BAG) 
+                    control_sample = shuffled[:CONTROL_LEN]
+                    test_sample    = shuffled[CONTROL_LEN:]
 
 
-            es = two_group_difference(control_sample, test_sample, 
-                                    False, effect_size)
+                es = two_group_difference(control_sample, test_sample, 
+                                        False, effect_size)
             
-            group_var = calculate_group_var(var(control_sample, ddof=1), 
-                                      CONTROL_LEN, 
-                                      var(test_sample, ddof=1), 
-                                      len(test_sample))
-            self.__permutations.append(es)
-            self.__permutations_var.append(group_var)
+                group_var = calculate_group_var(var(control_sample, ddof=1), 
+                                          CONTROL_LEN, 
+                                          var(test_sample, ddof=1), 
+                                          len(test_sample))
+                self.__permutations.append(es)
+                self.__permutations_var.append(group_var)
+
+                if (deadline is not None and
+                    len(self.__permutations) % ADAPTIVE_CHECK_INTERVAL == 0 and
+                    time.perf_counter() >= deadline):
+                    break
 
-            if abs(es) > THRESHOLD:
-                EXTREME_COUNT += 1.
+            self.__permutations = array(self.__permutations)
+            self.__permutations_var = array(self.__permutations_var)
+
+        # Fewer permutations may have been taken before the deadline.
+        self.__permutation_count = permutation_count = len(self.__permutations)
+
+        EXTREME_COUNT = float((abs(self.__permutations) > THRESHOLD).sum())
 
         # devMJBL
         # adjust calculated p-value according to Phipson & Smyth (2010)
@@ -1505,9 +2424,6 @@ class PermutationTest:
 
             self.pvalue = (EXTREME_COUNT + 1)/(permutation_count + 1) - integrationVal
 
-        self.__permutations = array(self.__permutations)
-        self.__permutations_var = array(self.__permutations_var)
-
        # self.pvalue = EXTREME_COUNT / self.__permutation_count
 
 
@@ -1524,6 +2440,15 @@ class PermutationTest:
         return self.__permutation_count
 
 
+    @property
+    def exact(self):
+        """
+        Whether every distinct relabelling was enumerated, rather than a
+        random sample of them.
+        """
+        return self.__exact
+
+
     @property
     def permutations(self):
         """
@@ -1539,3 +2464,492 @@ class PermutationTest:
         """
         return self.__permutations_var
 
+
+# The relative tolerance within which a relabelling of an exact permutation
+# test ties with the observed effect size.
+_TIE_RTOL = 1e-12
+
+# The largest number of relabellings that an exact permutation test enumerates.
+# Their effect sizes and group variances alone take 256 MiB.
+_MAX_EXACT_COUNT = 2 ** 24
+
+
+def _count_extreme(permutations, threshold):
+    """
+    Counts the relabellings of an exact permutation test whose absolute
+    effect size is at least `threshold`, the absolute observed one. Ties are
+    counted up to a relative `_TIE_RTOL`, as relabellings with the same
+    effect size may differ in the last bits of their sums, and as the
+    tolerance must not depend on the scale of the data.
+    """
+    return float(np.count_nonzero(abs(permutations) >= threshold * (1 - _TIE_RTOL)))
+
+
+def _draw_permutation_indexes(streams, bag_len, size):
+    """
+    Draws the next `size` permutations of the pooled sample of the
+    `_ResampleStreams` `streams` as a 2-D array of indexes, with one
+    permutation per row. They are consumed as `rng.permutation(BAG)` does
+    in the permutation-by-permutation loop.
+    """
+    out = np.empty((size, bag_len), dtype=np.intp)
+    for i, rng in enumerate(streams.rows(size)):
+        out[i] = rng.permutation(bag_len)
+    return out
+
+
+def _get_deadline_block_size(group_len, permutation_count, block_size=None, deadline=None):
+    """
+    Returns the number of permutations per block, which is at most
+    `ADAPTIVE_CHECK_INTERVAL` when a deadline is checked after each block.
+    """
+    from ._stats_tools.confint_2group_diff import _get_block_size, ADAPTIVE_CHECK_INTERVAL
+
+    block_size = _get_block_size(group_len, permutation_count, block_size)
+    if deadline is not None:
+        block_size = min(block_size, ADAPTIVE_CHECK_INTERVAL)
+    return block_size
+
+
+def _permutation_block_stats(control_sample, test_sample, effect_size, es=None):
+    """
+    Computes the effect sizes and group variances of a block of permuted
+    samples, given as 2-D arrays with one permutation per row. If `es` is
+    given, only the group variances are computed.
+    """
+    from ._stats_tools.effsize import two_group_difference_batch
+    from ._stats_tools.confint_2group_diff import calculate_group_var
+
+    if es is None:
+        es = two_group_difference_batch(control_sample, test_sample, False, effect_size)
+    group_var = calculate_group_var(
+        var(control_sample, axis=1, ddof=1), control_sample.shape[1],
+        var(test_sample, axis=1, ddof=1), test_sample.shape[1]
+    )
+    return es, group_var
+
+
+def _swapped_block_stats(control, test, swapped, effect_size):
+    """
+    Computes the effect sizes and group variances of a block of paired
+    permutations, given as a 2-D boolean array of the control/test pairs
+    swapped in each permutation.
+
+    As in the loop, the swapped samples are compared as unpaired ones, with
+    the same arithmetic, so that both engines give the same permutations to
+    the last bit and count the same ties.
+    """
+    control_sample = np.where(swapped, test, control)
+    test_sample = np.where(swapped, control, test)
+
+    return _permutation_block_stats(control_sample, test_sample, effect_size)
+
+
+def _permute_unpaired(streams, control, test, effect_size, permutation_count, block_size=None,
+                      index_cache=None, key=None, deadline=None):
+    """
+    Computes the effect sizes and group variances of unpaired permutations,
+    evaluating blocks of permuted label assignments at once. The
+    permutations are cached in `index_cache` under `key`, if given, and
+    only those taken by `deadline` are returned.
+
+    As the pooled sample is fixed, Cliff's delta is computed from its
+    ranks, which are computed once.
+    """
+    from ._stats_tools.confint_2group_diff import _get_block_size, _iter_index_blocks
+    from ._stats_tools.effsize import _cliffs_delta_from_ranks
+
+    BAG = np.concatenate([control, test])
+    CONTROL_LEN = len(control)
+    permutation_count = int(permutation_count)
+    if effect_size == "cliffs_delta":
+        ranks = spstats.rankdata(BAG)
+
+    permutations = np.empty(permutation_count)
+    permutations_var = np.empty(permutation_count)
+
+    def draw_block(size):
+        return (_draw_permutation_indexes(streams, len(BAG), size),)
+
+    block_size = _get_deadline_block_size(len(BAG), permutation_count, block_size, deadline)
+    for start, (idx,) in _iter_index_blocks(draw_block, permutation_count, block_size,
+                                            (len(BAG),), index_cache, key):
+        size = len(idx)
+        shuffled = BAG[idx]
+
+        es = None
+        if effect_size == "cliffs_delta":
+            es = _cliffs_delta_from_ranks(ranks[idx[:, CONTROL_LEN:]], CONTROL_LEN)
+        es, group_var = _permutation_block_stats(
+            shuffled[:, :CONTROL_LEN], shuffled[:, CONTROL_LEN:], effect_size, es
+        )
+        permutations[start : start + size] = es
+        permutations_var[start : start + size] = group_var
+
+        if deadline is not None and time.perf_counter() >= deadline:
+            return permutations[: start + size], permutations_var[: start + size]
+
+    return permutations, permutations_var
+
+
+def _permute_binary_counts(streams, control, test, effect_size, permutation_count,
+                           is_paired=None):
+    """
+    Computes the effect sizes and group variances of permutations of binary
+    data from its counts, in O(permutation_count) time.
+
+    An unpaired permutation deals the pooled ones between the groups, so
+    the count of ones in the control group is hypergeometric. A paired
+    permutation swaps a random number of pairs, chosen as in the loop and
+    on top of the previous swaps; only the discordant pairs swapped
+    matter, and their numbers are hypergeometric given the number of pairs
+    swapped. The counts are drawn from the `_ResampleStreams` `streams`.
+    """
+    from ._stats_tools.confint_2group_diff import _check_binary_counts, calculate_group_var
+    from ._stats_tools.confint_2group_diff import _integers
+    from ._stats_tools import effsize as es
+
+    _check_binary_counts(control, test, effect_size)
+    permutation_count = int(permutation_count)
+
+    if is_paired:
+        cells = es._binary_cells(control, test)
+        pair_len = len(control)
+        draws = np.tile(cells, (permutation_count, 1))
+        discordant = cells[1:3].tolist()
+        for i, rng in enumerate(streams.rows(permutation_count)):
+            swapped = _integers(rng, 0, pair_len + 1)
+            # The swapped pairs among the (0, 1) pairs, then the (1, 0) pairs.
+            swapped_01 = rng.hypergeometric(discordant[0], pair_len - discordant[0],
+                                            swapped) if swapped else 0
+            rest = swapped - swapped_01
+            swapped_10 = rng.hypergeometric(discordant[1],
+                                            pair_len - discordant[0] - discordant[1],
+                                            rest) if rest else 0
+            discordant = [discordant[0] - swapped_01 + swapped_10,
+                          discordant[1] - swapped_10 + swapped_01]
+            draws[i, 1:3] = discordant
+
+        control_ones = draws[:, 2] + draws[:, 3]
+        test_ones = draws[:, 1] + draws[:, 3]
+        control_len = test_len = pair_len
+        # As in the loop, the swapped groups are compared as unpaired ones.
+        es_values = es._binary_difference_from_counts(control_ones, control_len,
+                                                      test_ones, test_len, effect_size)
+    else:
+        control_len, test_len = len(control), len(test)
+        ones = np.count_nonzero(control) + np.count_nonzero(test)
+        control_ones = np.concatenate([
+            rng.hypergeometric(ones, control_len + test_len - ones, control_len, size=count)
+            for rng, count in streams.take(permutation_count)
+        ])
+        test_ones = ones - control_ones
+        es_values = es._binary_difference_from_counts(control_ones, control_len,
+                                                      test_ones, test_len, effect_size)
+
+    def binary_var(ones, n):
+        # The sample variance (N-1 degrees of freedom) of a binary group.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return ones * (n - ones) / (n * (n - 1))
+
+    group_var = calculate_group_var(binary_var(control_ones, control_len), control_len,
+                                    binary_var(test_ones, test_len), test_len)
+    return es_values, group_var
+
+
+def _drop_unobserved(values, weights=None):
+    """
+    Returns the values of a frequency-weighted group that are not missing
+    and occur at least once, with their weights as integers. Without
+    weights, every value occurs once.
+    """
+    from ._stats_tools.confint_2group_diff import _check_frequency_weights
+
+    values = np.asarray(values, dtype=float)
+    if weights is None:
+        weights = np.ones(len(values))
+    weights = _check_frequency_weights(weights)
+    if len(weights) != len(values):
+        raise ValueError("There must be one frequency weight per value.")
+
+    keep = ~isnan(values) & (weights > 0)
+    return values[keep], weights[keep]
+
+
+def _permute_weighted(streams, control, control_weights, test, test_weights, effect_size,
+                      permutation_count, deadline=None):
+    """
+    Computes the effect sizes and group variances of unpaired permutations
+    of frequency-weighted groups, in which each value occurs as many times
+    as its weight, without expanding them.
+
+    A permutation deals the pooled observations between the groups, so the
+    numbers of occurrences of the pooled values dealt to the control group
+    are multivariate hypergeometric. They are drawn value by value, each
+    hypergeometric given the observations left to deal, for a whole block
+    of permutations at once, from the `_ResampleStreams` `streams`. Only
+    the permutations taken by `deadline` are returned.
+    """
+    from ._stats_tools.confint_2group_diff import ADAPTIVE_CHECK_INTERVAL, calculate_group_var
+    from ._stats_tools import effsize as es
+
+    values = np.concatenate([control, test])
+    weights = np.concatenate([control_weights, test_weights]).astype(np.int64)
+    control_n = int(control_weights.sum())
+    test_n = int(test_weights.sum())
+    permutation_count = int(permutation_count)
+
+    permutations = np.empty(permutation_count)
+    permutations_var = np.empty(permutation_count)
+
+    # The blocks are of a fixed size, as the draws depend on it; each of
+    # them is a shard of the streams.
+    for start in range(0, permutation_count, ADAPTIVE_CHECK_INTERVAL):
+        size = min(ADAPTIVE_CHECK_INTERVAL, permutation_count - start)
+        [(rng, _)] = streams.take(size)
+        control_counts = np.zeros((size, len(values)), dtype=np.int64)
+        left_control = np.full(size, control_n, dtype=np.int64)
+        left = control_n + test_n
+        for i, weight in enumerate(weights.tolist()):
+            left -= weight
+            # The generator rejects samples of size zero.
+            drawing = left_control > 0
+            if drawing.any():
+                control_counts[drawing, i] = rng.hypergeometric(weight, left,
+                                                                left_control[drawing])
+            left_control -= control_counts[:, i]
+        test_counts = weights - control_counts
+
+        permutations[start : start + size] = es._weighted_difference(
+            values, control_counts, values, test_counts, effect_size
+        )
+        _, _, control_var = es._weighted_moments(values, control_counts)
+        _, _, test_var = es._weighted_moments(values, test_counts)
+        permutations_var[start : start + size] = calculate_group_var(
+            control_var, control_n, test_var, test_n
+        )
+
+        if deadline is not None and time.perf_counter() >= deadline:
+            return permutations[: start + size], permutations_var[: start + size]
+
+    return permutations, permutations_var
+
+
+def _weighted_midranks(values, weights):
+    """
+    Returns the midrank of each value among the observations in which each
+    value occurs as many times as its weight, and the numbers of tied
+    observations at each distinct value.
+    """
+    _, codes = np.unique(values, return_inverse=True)
+    ties = np.bincount(codes, weights=weights)
+    midranks = np.cumsum(ties) - (ties - 1) / 2
+    return midranks[codes], ties
+
+
+def _weighted_mannwhitneyu(control, control_weights, test, test_weights):
+    """
+    Two-sided Mann-Whitney U test of frequency-weighted groups, as
+    `scipy.stats.mannwhitneyu` computes it for the expanded groups. SciPy
+    uses the normal approximation whenever there are ties, which repeated
+    values are.
+    """
+    ranks, ties = _weighted_midranks(np.concatenate([control, test]),
+                                     np.concatenate([control_weights, test_weights]))
+    if (ties == 1).all():
+        # Every value occurs once, so the groups are already expanded.
+        return spstats.mannwhitneyu(control, test, alternative="two-sided")
+
+    control_n, test_n = control_weights.sum(), test_weights.sum()
+    n = control_n + test_n
+    statistic = np.dot(control_weights, ranks[: len(control)]) - control_n * (control_n + 1) / 2
+    u = max(statistic, control_n * test_n - statistic)
+
+    tie_term = np.sum(ties ** 3 - ties)
+    s = np.sqrt(control_n * test_n / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (u - control_n * test_n / 2 - 0.5) / s
+    pvalue = np.clip(2 * norm.sf(z), 0, 1)
+    return statistic, pvalue
+
+
+def _weighted_kruskal(control, control_weights, test, test_weights):
+    """
+    Kruskal-Wallis H test of frequency-weighted groups, as
+    `scipy.stats.kruskal` computes it for the expanded groups.
+    """
+    ranks, ties = _weighted_midranks(np.concatenate([control, test]),
+                                     np.concatenate([control_weights, test_weights]))
+    control_n, test_n = control_weights.sum(), test_weights.sum()
+    n = control_n + test_n
+    control_rank_sum = np.dot(control_weights, ranks[: len(control)])
+    test_rank_sum = np.dot(test_weights, ranks[len(control) :])
+
+    tiecorrect = 1 - np.sum(ties ** 3 - ties) / (n ** 3 - n)
+    if tiecorrect == 0:
+        raise ValueError("All numbers are identical in kruskal")
+
+    statistic = (12 / (n * (n + 1)) * (control_rank_sum ** 2 / control_n
+                                       + test_rank_sum ** 2 / test_n) - 3 * (n + 1))
+    statistic /= tiecorrect
+    return statistic, spstats.chi2.sf(statistic, 1)
+
+
+def _weighted_brunnermunzel(control, control_weights, test, test_weights):
+    """
+    Two-sided Brunner-Munzel test of frequency-weighted groups, as
+    `scipy.stats.brunnermunzel` computes it for the expanded groups.
+    """
+    pooled_ranks, _ = _weighted_midranks(np.concatenate([control, test]),
+                                         np.concatenate([control_weights, test_weights]))
+    nx, ny = control_weights.sum(), test_weights.sum()
+
+    def rank_variance(weights, pooled, own):
+        n = weights.sum()
+        pooled_mean = np.dot(weights, pooled) / n
+        own_mean = np.dot(weights, own) / n
+        return pooled_mean, np.dot(weights, (pooled - own - pooled_mean + own_mean) ** 2) / (n - 1)
+
+    rankcx_mean, Sx = rank_variance(control_weights, pooled_ranks[: len(control)],
+                                    _weighted_midranks(control, control_weights)[0])
+    rankcy_mean, Sy = rank_variance(test_weights, pooled_ranks[len(control) :],
+                                    _weighted_midranks(test, test_weights)[0])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        statistic = nx * ny * (rankcy_mean - rankcx_mean)
+        statistic /= (nx + ny) * np.sqrt(nx * Sx + ny * Sy)
+
+        df_numer = (nx * Sx + ny * Sy) ** 2
+        df_denom = (nx * Sx) ** 2 / (nx - 1) + (ny * Sy) ** 2 / (ny - 1)
+        df = df_numer / df_denom
+
+    if df_numer == 0 and df_denom == 0:
+        warnings.warn("p-value cannot be estimated with `distribution='t' "
+                      "because degrees of freedom parameter is undefined "
+                      "(0/0). Try using `distribution='normal'", RuntimeWarning)
+
+    p = spstats.t.cdf(statistic, df)
+    return statistic, 2 * np.min([p, 1 - p])
+
+
+def _draw_paired_swaps(streams, pair_len, size):
+    """
+    Draws which control-test pairs are swapped in each of the next `size`
+    permutations of the `_ResampleStreams` `streams`, as a 2-D boolean
+    array with one permutation per row. They are consumed as in the
+    permutation-by-permutation loop.
+    """
+    from ._stats_tools.confint_2group_diff import _integers
+
+    out = np.zeros((size, pair_len), dtype=bool)
+    for i, rng in enumerate(streams.rows(size)):
+        out[i, rng.choice(pair_len, _integers(rng, 0, pair_len + 1), replace=False)] = True
+    return out
+
+
+def _permute_paired(streams, control, test, effect_size, permutation_count, block_size=None,
+                    index_cache=None, key=None, deadline=None):
+    """
+    Computes the effect sizes and group variances of paired permutations,
+    evaluating blocks of control/test swaps at once. The swaps are cached
+    in `index_cache` under `key`, if given, and only the permutations
+    taken by `deadline` are returned.
+
+    As in the loop, the swaps of each permutation are applied on top of
+    those of the previous one, so the pairs swapped in a permutation are
+    the cumulative parity of the swaps drawn so far.
+    """
+    from ._stats_tools.confint_2group_diff import _get_block_size, _iter_index_blocks
+
+    PAIR_LEN = len(control)
+    permutation_count = int(permutation_count)
+
+    permutations = np.empty(permutation_count)
+    permutations_var = np.empty(permutation_count)
+    swapped_state = np.zeros(PAIR_LEN, dtype=bool)
+
+    def draw_block(size):
+        nonlocal swapped_state
+        swaps = _draw_paired_swaps(streams, PAIR_LEN, size)
+        swapped = np.logical_xor.accumulate(swaps, axis=0) ^ swapped_state
+        swapped_state = swapped[-1]
+        return (swapped,)
+
+    block_size = _get_deadline_block_size(PAIR_LEN, permutation_count, block_size, deadline)
+    for start, (swapped,) in _iter_index_blocks(draw_block, permutation_count, block_size,
+                                                (PAIR_LEN,), index_cache, key):
+        size = len(swapped)
+        es, group_var = _swapped_block_stats(control, test, swapped, effect_size)
+        permutations[start : start + size] = es
+        permutations_var[start : start + size] = group_var
+
+        if deadline is not None and time.perf_counter() >= deadline:
+            return permutations[: start + size], permutations_var[: start + size]
+
+    return permutations, permutations_var
+
+
+def _enumerate_unpaired(control, test, effect_size, block_size=None):
+    """
+    Computes the effect sizes and group variances of every distinct
+    assignment of the pooled sample to the control and test groups,
+    evaluating them in blocks.
+    """
+    from ._stats_tools.confint_2group_diff import _get_block_size
+    from ._stats_tools.effsize import _cliffs_delta_from_ranks
+
+    BAG = np.concatenate([control, test])
+    CONTROL_LEN = len(control)
+    total = comb(len(BAG), CONTROL_LEN)
+    if effect_size == "cliffs_delta":
+        ranks = spstats.rankdata(BAG)
+
+    permutations = np.empty(total)
+    permutations_var = np.empty(total)
+    assignments = combinations(range(len(BAG)), CONTROL_LEN)
+
+    block_size = _get_block_size(len(BAG), total, block_size)
+    for start in range(0, total, block_size):
+        size = min(block_size, total - start)
+        control_idx = np.array(list(islice(assignments, size)), dtype=np.intp)
+        in_control = np.zeros((size, len(BAG)), dtype=bool)
+        in_control[np.arange(size)[:, None], control_idx] = True
+        test_idx = np.nonzero(~in_control)[1].reshape(size, -1)
+
+        es = None
+        if effect_size == "cliffs_delta":
+            es = _cliffs_delta_from_ranks(ranks[test_idx], CONTROL_LEN)
+        es, group_var = _permutation_block_stats(BAG[control_idx], BAG[test_idx],
+                                                 effect_size, es)
+        permutations[start : start + size] = es
+        permutations_var[start : start + size] = group_var
+
+    return permutations, permutations_var
+
+
+def _enumerate_paired(control, test, effect_size, block_size=None):
+    """
+    Computes the effect sizes and group variances of every one of the 2^n
+    sets of control/test swaps of paired data, evaluating them in blocks.
+    The pairs swapped in the i-th set are given by the binary digits of i.
+    """
+    from ._stats_tools.confint_2group_diff import _get_block_size
+
+    PAIR_LEN = len(control)
+    total = 2 ** PAIR_LEN
+    digits = np.arange(PAIR_LEN)
+
+    permutations = np.empty(total)
+    permutations_var = np.empty(total)
+
+    block_size = _get_block_size(PAIR_LEN, total, block_size)
+    for start in range(0, total, block_size):
+        size = min(block_size, total - start)
+        codes = np.arange(start, start + size, dtype=np.int64)
+        swapped = ((codes[:, None] >> digits) & 1).astype(bool)
+
+        es, group_var = _swapped_block_stats(control, test, swapped, effect_size)
+        permutations[start : start + size] = es
+        permutations_var[start : start + size] = group_var
+
+    return permutations, permutations_var
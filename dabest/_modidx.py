@@ -13,40 +13,152 @@ d = { 'settings': { 'branch': 'master',
                                                                                                                       'dabest/_stats_tools/confint_1group.py'),
                                                     'dabest._stats_tools.confint_1group.compute_1group_jackknife': ( 'API/confint_1group.html#compute_1group_jackknife',
                                                                                                                      'dabest/_stats_tools/confint_1group.py'),
+                                                    'dabest._stats_tools.confint_1group.compute_1group_mean_jackknife': ( 'API/confint_1group.html#compute_1group_mean_jackknife',
+                                                                                                                          'dabest/_stats_tools/confint_1group.py'),
                                                     'dabest._stats_tools.confint_1group.create_bootstrap_indexes': ( 'API/confint_1group.html#create_bootstrap_indexes',
                                                                                                                      'dabest/_stats_tools/confint_1group.py'),
                                                     'dabest._stats_tools.confint_1group.summary_ci_1group': ( 'API/confint_1group.html#summary_ci_1group',
                                                                                                               'dabest/_stats_tools/confint_1group.py')},
-            'dabest._stats_tools.confint_2group_diff': { 'dabest._stats_tools.confint_2group_diff._calc_accel': ( 'API/confint_2group_diff.html#_calc_accel',
+            'dabest._stats_tools.confint_2group_diff': { 'dabest._stats_tools.confint_2group_diff._BoundedIndexCache': ( 'API/confint_2group_diff.html#_boundedindexcache',
+                                                                                                                         'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._BoundedIndexCache.__delitem__': ( 'API/confint_2group_diff.html#_boundedindexcache.__delitem__',
+                                                                                                                                     'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._BoundedIndexCache.__init__': ( 'API/confint_2group_diff.html#_boundedindexcache.__init__',
+                                                                                                                                  'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._BoundedIndexCache.__setitem__': ( 'API/confint_2group_diff.html#_boundedindexcache.__setitem__',
+                                                                                                                                     'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._ResampleStreams': ( 'API/confint_2group_diff.html#_resamplestreams',
+                                                                                                                       'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._ResampleStreams.__init__': ( 'API/confint_2group_diff.html#_resamplestreams.__init__',
+                                                                                                                                'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._ResampleStreams.__rngs': ( 'API/confint_2group_diff.html#_resamplestreams.__rngs',
+                                                                                                                              'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._ResampleStreams.rows': ( 'API/confint_2group_diff.html#_resamplestreams.rows',
+                                                                                                                            'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._ResampleStreams.take': ( 'API/confint_2group_diff.html#_resamplestreams.take',
+                                                                                                                            'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._accumulate_poisson_moments': ( 'API/confint_2group_diff.html#_accumulate_poisson_moments',
+                                                                                                                                  'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._calc_accel': ( 'API/confint_2group_diff.html#_calc_accel',
                                                                                                                   'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._check_binary_counts': ( 'API/confint_2group_diff.html#_check_binary_counts',
+                                                                                                                           'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._check_frequency_weights': ( 'API/confint_2group_diff.html#_check_frequency_weights',
+                                                                                                                               'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._check_rng_mode': ( 'API/confint_2group_diff.html#_check_rng_mode',
+                                                                                                                      'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff._compute_alpha_from_ci': ( 'API/confint_2group_diff.html#_compute_alpha_from_ci',
                                                                                                                              'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._compute_binary_bootstraps': ( 'API/confint_2group_diff.html#_compute_binary_bootstraps',
+                                                                                                                                 'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._compute_binary_jackknife': ( 'API/confint_2group_diff.html#_compute_binary_jackknife',
+                                                                                                                                'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._compute_blb_subset_bootstraps': ( 'API/confint_2group_diff.html#_compute_blb_subset_bootstraps',
+                                                                                                                                     'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._compute_cliffs_delta_jackknife': ( 'API/confint_2group_diff.html#_compute_cliffs_delta_jackknife',
+                                                                                                                                      'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._compute_closed_form_jackknife': ( 'API/confint_2group_diff.html#_compute_closed_form_jackknife',
+                                                                                                                                     'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._compute_delta2_bootstraps_batch': ( 'API/confint_2group_diff.html#_compute_delta2_bootstraps_batch',
+                                                                                                                                       'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._compute_median_jackknife': ( 'API/confint_2group_diff.html#_compute_median_jackknife',
+                                                                                                                                'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff._compute_quantile': ( 'API/confint_2group_diff.html#_compute_quantile',
                                                                                                                         'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._compute_weighted_bootstraps': ( 'API/confint_2group_diff.html#_compute_weighted_bootstraps',
+                                                                                                                                   'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._compute_weighted_jackknife': ( 'API/confint_2group_diff.html#_compute_weighted_jackknife',
+                                                                                                                                  'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff._create_two_group_jackknife_indexes': ( 'API/confint_2group_diff.html#_create_two_group_jackknife_indexes',
                                                                                                                                           'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._draw_bootstrap_indexes': ( 'API/confint_2group_diff.html#_draw_bootstrap_indexes',
+                                                                                                                              'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._draw_poisson_weights': ( 'API/confint_2group_diff.html#_draw_poisson_weights',
+                                                                                                                            'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._draw_subset': ( 'API/confint_2group_diff.html#_draw_subset',
+                                                                                                                   'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._get_block_size': ( 'API/confint_2group_diff.html#_get_block_size',
+                                                                                                                      'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._integers': ( 'API/confint_2group_diff.html#_integers',
+                                                                                                                'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._iter_index_blocks': ( 'API/confint_2group_diff.html#_iter_index_blocks',
+                                                                                                                         'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._leave_one_out_medians': ( 'API/confint_2group_diff.html#_leave_one_out_medians',
+                                                                                                                             'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._leave_one_out_moments': ( 'API/confint_2group_diff.html#_leave_one_out_moments',
+                                                                                                                             'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._make_rng': ( 'API/confint_2group_diff.html#_make_rng',
+                                                                                                                'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._quantile_mc_se': ( 'API/confint_2group_diff.html#_quantile_mc_se',
+                                                                                                                      'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._seed_key': ( 'API/confint_2group_diff.html#_seed_key',
+                                                                                                                'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._skip_bootstrap_resamples': ( 'API/confint_2group_diff.html#_skip_bootstrap_resamples',
+                                                                                                                                'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff._spawn_seed': ( 'API/confint_2group_diff.html#_spawn_seed',
+                                                                                                                  'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff.calculate_group_var': ( 'API/confint_2group_diff.html#calculate_group_var',
                                                                                                                           'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff.calculate_weighted_delta': ( 'API/confint_2group_diff.html#calculate_weighted_delta',
                                                                                                                                'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff.compute_blb_bootstrapped_diff': ( 'API/confint_2group_diff.html#compute_blb_bootstrapped_diff',
+                                                                                                                                    'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff.compute_blb_intervals': ( 'API/confint_2group_diff.html#compute_blb_intervals',
+                                                                                                                            'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff.compute_bootstrapped_diff': ( 'API/confint_2group_diff.html#compute_bootstrapped_diff',
                                                                                                                                 'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff.compute_delta2_bootstrapped_diff': ( 'API/confint_2group_diff.html#compute_delta2_bootstrapped_diff',
                                                                                                                                        'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff.compute_interval_limits': ( 'API/confint_2group_diff.html#compute_interval_limits',
                                                                                                                               'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff.compute_interval_precision': ( 'API/confint_2group_diff.html#compute_interval_precision',
+                                                                                                                                 'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff.compute_intervals': ( 'API/confint_2group_diff.html#compute_intervals',
+                                                                                                                        'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff.compute_meandiff_bias_correction': ( 'API/confint_2group_diff.html#compute_meandiff_bias_correction',
                                                                                                                                        'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff.compute_meandiff_jackknife': ( 'API/confint_2group_diff.html#compute_meandiff_jackknife',
                                                                                                                                  'dabest/_stats_tools/confint_2group_diff.py'),
+                                                         'dabest._stats_tools.confint_2group_diff.compute_poisson_bootstrapped_diff': ( 'API/confint_2group_diff.html#compute_poisson_bootstrapped_diff',
+                                                                                                                                        'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff.create_jackknife_indexes': ( 'API/confint_2group_diff.html#create_jackknife_indexes',
                                                                                                                                'dabest/_stats_tools/confint_2group_diff.py'),
                                                          'dabest._stats_tools.confint_2group_diff.create_repeated_indexes': ( 'API/confint_2group_diff.html#create_repeated_indexes',
                                                                                                                               'dabest/_stats_tools/confint_2group_diff.py')},
-            'dabest._stats_tools.effsize': { 'dabest._stats_tools.effsize._compute_hedges_correction_factor': ( 'API/effsize.html#_compute_hedges_correction_factor',
+            'dabest._stats_tools.effsize': { 'dabest._stats_tools.effsize._binary_cells': ( 'API/effsize.html#_binary_cells',
+                                                                                            'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._binary_difference_from_cells': ( 'API/effsize.html#_binary_difference_from_cells',
+                                                                                                            'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._binary_difference_from_counts': ( 'API/effsize.html#_binary_difference_from_counts',
+                                                                                                             'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._cliffs_delta_batch': ( 'API/effsize.html#_cliffs_delta_batch',
+                                                                                                  'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._cliffs_delta_from_codes': ( 'API/effsize.html#_cliffs_delta_from_codes',
+                                                                                                       'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._cliffs_delta_from_ranks': ( 'API/effsize.html#_cliffs_delta_from_ranks',
+                                                                                                       'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._cohens_d_batch': ( 'API/effsize.html#_cohens_d_batch',
+                                                                                              'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._compute_hedges_correction_factor': ( 'API/effsize.html#_compute_hedges_correction_factor',
                                                                                                                 'dabest/_stats_tools/effsize.py'),
                                              'dabest._stats_tools.effsize._compute_standardizers': ( 'API/effsize.html#_compute_standardizers',
                                                                                                      'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._compute_standardizers_batch': ( 'API/effsize.html#_compute_standardizers_batch',
+                                                                                                           'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._difference_from_moments': ( 'API/effsize.html#_difference_from_moments',
+                                                                                                       'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._median_batch': ( 'API/effsize.html#_median_batch',
+                                                                                            'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._weighted_cliffs_delta': ( 'API/effsize.html#_weighted_cliffs_delta',
+                                                                                                     'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._weighted_difference': ( 'API/effsize.html#_weighted_difference',
+                                                                                                   'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._weighted_histogram': ( 'API/effsize.html#_weighted_histogram',
+                                                                                                  'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._weighted_median': ( 'API/effsize.html#_weighted_median',
+                                                                                               'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize._weighted_moments': ( 'API/effsize.html#_weighted_moments',
+                                                                                                'dabest/_stats_tools/effsize.py'),
                                              'dabest._stats_tools.effsize.cliffs_delta': ( 'API/effsize.html#cliffs_delta',
                                                                                            'dabest/_stats_tools/effsize.py'),
                                              'dabest._stats_tools.effsize.cohens_d': ( 'API/effsize.html#cohens_d',
@@ -59,13 +171,27 @@ d = { 'settings': { 'branch': 'master',
                                                                                        'dabest/_stats_tools/effsize.py'),
                                              'dabest._stats_tools.effsize.two_group_difference': ( 'API/effsize.html#two_group_difference',
                                                                                                    'dabest/_stats_tools/effsize.py'),
+                                             'dabest._stats_tools.effsize.two_group_difference_batch': ( 'API/effsize.html#two_group_difference_batch',
+                                                                                                         'dabest/_stats_tools/effsize.py'),
                                              'dabest._stats_tools.effsize.weighted_delta': ( 'API/effsize.html#weighted_delta',
                                                                                              'dabest/_stats_tools/effsize.py')},
             'dabest.forest_plot': { 'dabest.forest_plot.extract_plot_data': ( 'API/forest_plot.html#extract_plot_data',
                                                                               'dabest/forest_plot.py'),
                                     'dabest.forest_plot.forest_plot': ('API/forest_plot.html#forest_plot', 'dabest/forest_plot.py'),
                                     'dabest.forest_plot.load_plot_data': ('API/forest_plot.html#load_plot_data', 'dabest/forest_plot.py')},
-            'dabest.misc_tools': { 'dabest.misc_tools.get_varname': ('API/misc_tools.html#get_varname', 'dabest/misc_tools.py'),
+            'dabest.misc_tools': { 'dabest.misc_tools._StageProfiler': ('API/misc_tools.html#_stageprofiler', 'dabest/misc_tools.py'),
+                                   'dabest.misc_tools._StageProfiler.__init__': ( 'API/misc_tools.html#_stageprofiler.__init__',
+                                                                                  'dabest/misc_tools.py'),
+                                   'dabest.misc_tools._StageProfiler.stage': ( 'API/misc_tools.html#_stageprofiler.stage',
+                                                                               'dabest/misc_tools.py'),
+                                   'dabest.misc_tools._StageProfiler.start': ( 'API/misc_tools.html#_stageprofiler.start',
+                                                                               'dabest/misc_tools.py'),
+                                   'dabest.misc_tools._StageProfiler.stop': ( 'API/misc_tools.html#_stageprofiler.stop',
+                                                                              'dabest/misc_tools.py'),
+                                   'dabest.misc_tools._StageProfiler.to_dict': ( 'API/misc_tools.html#_stageprofiler.to_dict',
+                                                                                 'dabest/misc_tools.py'),
+                                   'dabest.misc_tools._profile_stage': ('API/misc_tools.html#_profile_stage', 'dabest/misc_tools.py'),
+                                   'dabest.misc_tools.get_varname': ('API/misc_tools.html#get_varname', 'dabest/misc_tools.py'),
                                    'dabest.misc_tools.merge_two_dicts': ('API/misc_tools.html#merge_two_dicts', 'dabest/misc_tools.py'),
                                    'dabest.misc_tools.print_greeting': ('API/misc_tools.html#print_greeting', 'dabest/misc_tools.py'),
                                    'dabest.misc_tools.unpack_and_add': ('API/misc_tools.html#unpack_and_add', 'dabest/misc_tools.py')},
@@ -82,6 +208,10 @@ d = { 'settings': { 'branch': 'master',
                                                                                     'dabest/plot_tools.py'),
                                    'dabest.plot_tools.SwarmPlot._swarm': ('API/plot_tools.html#swarmplot._swarm', 'dabest/plot_tools.py'),
                                    'dabest.plot_tools.SwarmPlot.plot': ('API/plot_tools.html#swarmplot.plot', 'dabest/plot_tools.py'),
+                                   'dabest.plot_tools._weighted_quantile': ( 'API/plot_tools.html#_weighted_quantile',
+                                                                             'dabest/plot_tools.py'),
+                                   'dabest.plot_tools._weighted_summaries': ( 'API/plot_tools.html#_weighted_summaries',
+                                                                              'dabest/plot_tools.py'),
                                    'dabest.plot_tools.check_data_matches_labels': ( 'API/plot_tools.html#check_data_matches_labels',
                                                                                     'dabest/plot_tools.py'),
                                    'dabest.plot_tools.error_bar': ('API/plot_tools.html#error_bar', 'dabest/plot_tools.py'),
@@ -1,26 +1,30 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/API/confint_1group.ipynb.
 
 # %% auto 0
-__all__ = ['create_bootstrap_indexes', 'compute_1group_jackknife', 'compute_1group_acceleration', 'compute_1group_bootstraps',
-           'compute_1group_bias_correction', 'summary_ci_1group']
+__all__ = ['create_bootstrap_indexes', 'compute_1group_jackknife', 'compute_1group_mean_jackknife', 'compute_1group_acceleration',
+           'compute_1group_bootstraps', 'compute_1group_bias_correction', 'summary_ci_1group']
 
 # %% ../../nbs/API/confint_1group.ipynb 4
 import numpy as np
-from numpy.random import PCG64, RandomState
 from scipy.stats import norm
 from numpy import sort as npsort
 
 # %% ../../nbs/API/confint_1group.ipynb 5
-def create_bootstrap_indexes(array, resamples=5000, random_seed=12345):
+def create_bootstrap_indexes(array, resamples=5000, random_seed=12345, rng_mode="legacy"):
     """Given an array-like, returns a generator of bootstrap indexes
     to be used for resampling.
+
+    The indexes are drawn from `RandomState(PCG64(random_seed))` if
+    `rng_mode` is "legacy", and from `Generator` streams spawned from
+    `random_seed` if it is "generator" (see `compute_bootstrapped_diff`).
     """
+    from . import confint_2group_diff as ci_2g
 
-    rng = RandomState(PCG64(random_seed))
+    streams = ci_2g._ResampleStreams(random_seed, rng_mode, (ci_2g.BOOTSTRAP_STREAM,))
 
-    indexes = range(0, len(array))
+    n = len(array)
 
-    out = (rng.choice(indexes, len(indexes), replace=True) for i in range(0, resamples))
+    out = (ci_2g._integers(rng, 0, n, n) for rng in streams.rows(resamples))
 
     return out
 
@@ -31,12 +35,32 @@ def compute_1group_jackknife(x, func, *args, **kwargs):
     """
     from . import confint_2group_diff as ci_2g
 
+    if func is np.mean and not args and not kwargs:
+        return compute_1group_mean_jackknife(x)
+
     jackknives = [i for i in ci_2g.create_jackknife_indexes(x)]
     out = [func(x[j], *args, **kwargs) for j in jackknives]
     del jackknives  # memory management.
     return out
 
 
+def compute_1group_mean_jackknife(x):
+    """
+    Returns the jackknife bootstraps for the mean of x, computed from its
+    sum in O(N) time and memory instead of from the N jackknife samples.
+    """
+    from . import confint_2group_diff as ci_2g
+
+    x = np.asarray(x, dtype=float)
+    if len(x) < 2 or not np.isfinite(x).all():
+        # The running sums cannot handle these; jackknife them one by one.
+        jackknives = ci_2g.create_jackknife_indexes(x)
+        return np.array([np.mean(x[j]) for j in jackknives])
+
+    loo_mean, _ = ci_2g._leave_one_out_moments(x)
+    return loo_mean
+
+
 def compute_1group_acceleration(jack_dist):
     """
     Returns the accaleration value based on the jackknife distribution.
@@ -47,13 +71,13 @@ def compute_1group_acceleration(jack_dist):
 
 
 def compute_1group_bootstraps(
-    x, func, resamples=5000, random_seed=12345, *args, **kwargs
+    x, func, resamples=5000, random_seed=12345, *args, rng_mode="legacy", **kwargs
 ):
     """Bootstraps func(x), with the number of specified resamples."""
 
     # Create bootstrap indexes.
     boot_indexes = create_bootstrap_indexes(
-        x, resamples=resamples, random_seed=random_seed
+        x, resamples=resamples, random_seed=random_seed, rng_mode=rng_mode
     )
 
     out = [func(x[b], *args, **kwargs) for b in boot_indexes]
@@ -78,6 +102,7 @@ def summary_ci_1group(
     random_seed: int = 12345,  # `random_seed` is used to seed the random number generator during bootstrap resampling. This ensures that the confidence intervals reported are replicable.
     sort_bootstraps: bool = True,
     *args,
+    rng_mode: str = "legacy",  # Either "legacy" or "generator"; see `create_bootstrap_indexes`.
     **kwargs
 ):
     """
@@ -104,7 +129,8 @@ def summary_ci_1group(
     from . import confint_2group_diff as ci2g
 
     boots = compute_1group_bootstraps(
-        x, func, resamples=resamples, random_seed=random_seed, *args, **kwargs
+        x, func, resamples=resamples, random_seed=random_seed, *args, rng_mode=rng_mode,
+        **kwargs
     )
     bias = compute_1group_bias_correction(x, boots, func)
 
@@ -1,19 +1,24 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/API/confint_2group_diff.ipynb.
 
 # %% auto 0
-__all__ = ['create_jackknife_indexes', 'create_repeated_indexes', 'compute_meandiff_jackknife', 'compute_bootstrapped_diff',
+__all__ = ['MAX_BLOCK_ELEMENTS', 'MAX_CACHED_INDEXES', 'MAX_INDEX_CACHE_ELEMENTS', 'ADAPTIVE_CHECK_INTERVAL', 'RNG_MODES',
+           'BOOTSTRAP_STREAM', 'PERMUTATION_STREAM', 'POISSON_EFFECT_SIZES', 'BLB_SUBSETS', 'BLB_EXPONENT',
+           'create_jackknife_indexes', 'create_repeated_indexes', 'compute_meandiff_jackknife',
+           'compute_poisson_bootstrapped_diff', 'compute_blb_bootstrapped_diff', 'compute_bootstrapped_diff',
            'compute_delta2_bootstrapped_diff', 'compute_meandiff_bias_correction', 'compute_interval_limits',
-           'calculate_group_var', 'calculate_weighted_delta']
+           'compute_intervals', 'compute_interval_precision', 'compute_blb_intervals', 'calculate_group_var',
+           'calculate_weighted_delta']
 
 # %% ../../nbs/API/confint_2group_diff.ipynb 4
 import numpy as np
 from numpy import arange, delete, errstate
 from numpy import mean as npmean
 from numpy import sum as npsum
-from numpy.random import PCG64, RandomState
+from numpy.random import PCG64, Generator, RandomState, SeedSequence
 import pandas as pd
 from scipy.stats import norm
 from numpy import isnan
+from collections.abc import Iterator
 
 # %% ../../nbs/API/confint_2group_diff.ipynb 5
 def create_jackknife_indexes(data):
@@ -77,12 +82,197 @@ def _create_two_group_jackknife_indexes(x0, x1, is_paired):
     return out
 
 
+def _leave_one_out_moments(x):
+    """
+    Returns the leave-one-out means and sample variances (N-1 degrees of
+    freedom) of x, derived from running sums and sums of squares.
+
+    The data is centred on its mean first, so that the sums of squares do
+    not suffer from catastrophic cancellation.
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    centre = npmean(x)
+    deviations = x - centre
+
+    loo_sum = npsum(deviations) - deviations
+    loo_sum_sq = npsum(deviations**2) - deviations**2
+
+    with errstate(divide="ignore", invalid="ignore"):
+        loo_mean = centre + loo_sum / (n - 1)
+        loo_var = (loo_sum_sq - loo_sum**2 / (n - 1)) / (n - 2)
+
+    return loo_mean, loo_var
+
+
+def _compute_closed_form_jackknife(x0, x1, is_paired, effect_size):
+    """
+    Computes the jackknife of mean- and variance-based effect sizes in
+    one vectorized pass, without materialising the jackknife samples.
+
+    The jackknife values are returned in the same order as those of
+    `_create_two_group_jackknife_indexes`. For unpaired groups, this
+    includes its truncation of each group's leave-one-out samples to the
+    size of the smaller group, so that the acceleration is unchanged.
+    """
+    from . import effsize as __es
+
+    x0 = np.asarray(x0, dtype=float)
+    x1 = np.asarray(x1, dtype=float)
+    x0_len = len(x0)
+    x1_len = len(x1)
+    standardize = effect_size in ("cohens_d", "hedges_g", "delta_g")
+
+    if is_paired and x0_len == x1_len:
+        loo_diff, _ = _leave_one_out_moments(x1 - x0)
+        if not standardize:
+            return loo_diff
+
+        _, loo_var0 = _leave_one_out_moments(x0)
+        _, loo_var1 = _leave_one_out_moments(x1)
+        divisor = np.sqrt((loo_var0 + loo_var1) / 2)
+        correction = [(x0_len - 1, x1_len - 1)]
+
+    else:
+        mean0, mean1 = npmean(x0), npmean(x1)
+        loo_mean0, loo_var0 = _leave_one_out_moments(x0)
+        loo_mean1, loo_var1 = _leave_one_out_moments(x1)
+        m = min(x0_len, x1_len)
+        loo_mean0, loo_var0 = loo_mean0[:m], loo_var0[:m]
+        loo_mean1, loo_var1 = loo_mean1[:m], loo_var1[:m]
+
+        loo_diff = np.concatenate([mean1 - loo_mean0, loo_mean1 - mean0])
+        if not standardize:
+            return loo_diff
+
+        var0 = np.var(x0, ddof=1)
+        var1 = np.var(x1, ddof=1)
+        with errstate(invalid="ignore"):
+            pooled_sd0 = np.sqrt(((x0_len - 2) * loo_var0 + (x1_len - 1) * var1) /
+                                 (x0_len + x1_len - 3))
+            pooled_sd1 = np.sqrt(((x0_len - 1) * var0 + (x1_len - 2) * loo_var1) /
+                                 (x0_len + x1_len - 3))
+        divisor = np.concatenate([pooled_sd0, pooled_sd1])
+        correction = [(x0_len - 1, x1_len)] * m + [(x0_len, x1_len - 1)] * m
+
+    if (divisor == 0).any():
+        raise ValueError("The divisor is zero, indicating no variability in the data.")
+
+    out = loo_diff / divisor
+
+    if effect_size in ("hedges_g", "delta_g"):
+        if len(correction) == 1:
+            out = out * __es._compute_hedges_correction_factor(*correction[0])
+        else:
+            factors = {c: __es._compute_hedges_correction_factor(*c)
+                       for c in set(correction)}
+            out = out * np.array([factors[c] for c in correction])
+
+    return out
+
+
+def _leave_one_out_medians(x):
+    """
+    Returns the leave-one-out medians of x, read off its sorted values.
+
+    Removing the value at sorted position r shifts every sorted value
+    above r down by one position, so each leave-one-out median is one
+    (or the mean of two) of the sorted values around the middle.
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    if n < 2:
+        # The median of an empty sample.
+        return np.repeat(np.nan, n)
+
+    order = np.argsort(x, kind="stable")
+    sorted_x = x[order]
+    position = np.empty(n, dtype=np.intp)
+    position[order] = arange(n)
+
+    def loo_value(j):
+        # The j-th smallest value once the value at `position` is removed.
+        return np.where(j < position, sorted_x[j], sorted_x[min(j + 1, n - 1)])
+
+    loo_n = n - 1
+    if loo_n % 2 == 1:
+        return loo_value((loo_n - 1) // 2)
+    return (loo_value(loo_n // 2 - 1) + loo_value(loo_n // 2)) / 2
+
+
+def _compute_median_jackknife(x0, x1, is_paired):
+    """
+    Computes the jackknife of the median difference from the sorted
+    samples, in O(N log N) time rather than with N separate medians.
+
+    The values are ordered and truncated as in `_compute_closed_form_jackknife`.
+    """
+    x0 = np.asarray(x0, dtype=float)
+    x1 = np.asarray(x1, dtype=float)
+
+    if is_paired and len(x0) == len(x1):
+        return _leave_one_out_medians(x1 - x0)
+
+    m = min(len(x0), len(x1))
+    return np.concatenate([np.median(x1) - _leave_one_out_medians(x0)[:m],
+                           _leave_one_out_medians(x1)[:m] - np.median(x0)])
+
+
+def _compute_cliffs_delta_jackknife(x0, x1):
+    """
+    Computes the jackknife of Cliff's delta for unpaired groups from the
+    dominance of each value over the other group, counted by binary
+    search in the sorted groups. Leaving a value out removes its own
+    dominance from the total.
+
+    The values are ordered and truncated as in `_compute_closed_form_jackknife`.
+    """
+    x0 = np.asarray(x0, dtype=float)
+    x1 = np.asarray(x1, dtype=float)
+    x0_len = len(x0)
+    x1_len = len(x1)
+    sorted0 = np.sort(x0)
+    sorted1 = np.sort(x1)
+
+    # Number of test values above, minus those below, each control value.
+    dominance0 = ((x1_len - np.searchsorted(sorted1, x0, side="right")) -
+                  np.searchsorted(sorted1, x0, side="left"))
+    # Number of control values below, minus those above, each test value.
+    dominance1 = (np.searchsorted(sorted0, x1, side="left") -
+                  (x0_len - np.searchsorted(sorted0, x1, side="right")))
+    total = npsum(dominance0)
+
+    m = min(x0_len, x1_len)
+    with errstate(divide="ignore", invalid="ignore"):
+        loo0 = (total - dominance0[:m]) / ((x0_len - 1) * x1_len)
+        loo1 = (total - dominance1[:m]) / (x0_len * (x1_len - 1))
+
+    return np.concatenate([loo0, loo1])
+
+
 def compute_meandiff_jackknife(x0, x1, is_paired, effect_size):
     """
     Given two arrays, returns the jackknife for their effect size.
+
+    For 'mean_diff', 'cohens_d', 'hedges_g' and 'delta_g', the
+    leave-one-out values are derived in closed form from running sums
+    and sums of squares, in O(N) time and memory. For unpaired
+    'cliffs_delta', they are derived from the dominance of each value
+    over the other group, and for 'median_diff' from the sorted
+    samples, both in O(N log N) time.
     """
     from . import effsize as __es
 
+    has_nan = (isnan(np.asarray(x0, dtype=float)).any() or
+               isnan(np.asarray(x1, dtype=float)).any())
+    if not has_nan:
+        if effect_size in ("mean_diff", "cohens_d", "hedges_g", "delta_g"):
+            return _compute_closed_form_jackknife(x0, x1, is_paired, effect_size)
+        if effect_size == "median_diff":
+            return _compute_median_jackknife(x0, x1, is_paired)
+        if effect_size == "cliffs_delta" and not is_paired:
+            return _compute_cliffs_delta_jackknife(x0, x1)
+
     jackknives = _create_two_group_jackknife_indexes(x0, x1, is_paired)
 
     out = []
@@ -97,46 +287,910 @@ def compute_meandiff_jackknife(x0, x1, is_paired, effect_size):
     return out
 
 
-def _calc_accel(jack_dist):
+def _check_binary_counts(x0, x1, effect_size):
+    """
+    Raises a ValueError unless the effect size of x0 and x1 can be
+    computed from their counts of ones.
+    """
+    if effect_size not in ("mean_diff", "cohens_h"):
+        err = "The 'counts' engine only supports 'mean_diff' and 'cohens_h', not '{}'."
+        raise ValueError(err.format(effect_size))
+
+    if not (np.isin(x0, [0, 1]).all() and np.isin(x1, [0, 1]).all()):
+        raise ValueError("The 'counts' engine only accepts binary data consisting of 0 and 1.")
+
+
+def _compute_binary_jackknife(x0, x1, is_paired, effect_size):
+    """
+    Computes the jackknife of 'mean_diff' or 'cohens_h' for binary data.
+
+    A leave-one-out sample is determined by the kind of value (or pair)
+    left out, so the distinct jackknife values are returned along with the
+    number of times each occurs, to be passed to `_calc_accel`. As in
+    `_create_two_group_jackknife_indexes`, the unpaired leave-one-out
+    samples of each group are truncated to the size of the smaller group.
+    """
+    from . import effsize as __es
+
+    x0 = np.asarray(x0)
+    x1 = np.asarray(x1)
+
+    with errstate(divide="ignore", invalid="ignore"):
+        if is_paired:
+            cells = __es._binary_cells(x0, x1)
+            # Row k leaves out a pair of the k-th kind.
+            values = __es._binary_difference_from_cells(cells - np.eye(4, dtype=cells.dtype),
+                                                        effect_size)
+            counts = cells
+        else:
+            x0_len, x1_len = len(x0), len(x1)
+            ones0, ones1 = np.count_nonzero(x0), np.count_nonzero(x1)
+            # Leaving out a 0 or a 1 of each group in turn.
+            values = np.concatenate([
+                __es._binary_difference_from_counts(np.array([ones0, ones0 - 1]), x0_len - 1,
+                                                    ones1, x1_len, effect_size),
+                __es._binary_difference_from_counts(ones0, x0_len, np.array([ones1, ones1 - 1]),
+                                                    x1_len - 1, effect_size),
+            ])
+            m = min(x0_len, x1_len)
+            head_ones0, head_ones1 = np.count_nonzero(x0[:m]), np.count_nonzero(x1[:m])
+            counts = np.array([m - head_ones0, head_ones0, m - head_ones1, head_ones1])
+
+    occurs = counts > 0
+    return values[occurs], counts[occurs]
+
+
+def _compute_binary_bootstraps(x0, x1, is_paired, effect_size, resamples, streams,
+                               converged=None):
+    """
+    Bootstraps 'mean_diff' or 'cohens_h' of binary data from its counts, in
+    O(resamples) time whatever the size of the groups.
+
+    An unpaired resample is described by the count of ones of each group,
+    which is binomial, and a paired resample by the counts of each kind of
+    (control, test) pair, which are multinomial. They are drawn from the
+    `_ResampleStreams` `streams`.
+    """
+    from . import effsize as __es
+
+    _check_binary_counts(x0, x1, effect_size)
+    resamples = int(resamples)
+
+    pieces = streams.take(resamples)
+    if is_paired:
+        cells = __es._binary_cells(x0, x1)
+        draws = np.concatenate([rng.multinomial(len(x0), cells / len(x0), size=count)
+                                for rng, count in pieces])
+        out = __es._binary_difference_from_cells(draws, effect_size)
+    else:
+        x0_len, x1_len = len(x0), len(x1)
+        x0_p, x1_p = np.count_nonzero(x0) / x0_len, np.count_nonzero(x1) / x1_len
+        draws = [(rng.binomial(x0_len, x0_p, size=count), rng.binomial(x1_len, x1_p, size=count))
+                 for rng, count in pieces]
+        ones0 = np.concatenate([d[0] for d in draws])
+        ones1 = np.concatenate([d[1] for d in draws])
+        out = __es._binary_difference_from_counts(ones0, x0_len, ones1, x1_len, effect_size)
+
+    if converged is not None:
+        for check in range(ADAPTIVE_CHECK_INTERVAL, resamples + 1, ADAPTIVE_CHECK_INTERVAL):
+            if converged(out[:check]):
+                return out[:check]
+
+    return out
+
+
+def _check_frequency_weights(weights):
+    """
+    Returns `weights` as an integer array, raising a ValueError unless they
+    are non-negative whole numbers.
+    """
+    weights = np.asarray(weights, dtype=float)
+    if not (np.isfinite(weights).all() and (weights >= 0).all()
+            and (weights == np.floor(weights)).all()):
+        raise ValueError("Frequency weights must be non-negative whole numbers.")
+
+    return weights.astype(np.int64)
+
+
+def _compute_weighted_jackknife(x0, x0_weights, x1, x1_weights, effect_size, block_size=None):
+    """
+    Computes the jackknife of the effect size of frequency-weighted groups,
+    in which each value occurs as many times as its weight.
+
+    Leaving out any occurrence of a value gives the same effect size, so
+    the distinct jackknife values are returned with the number of times
+    each occurs, to be passed to `_calc_accel`. As in
+    `_create_two_group_jackknife_indexes`, the leave-one-out samples of
+    each group are truncated to the size of the smaller group, with each
+    value repeated in place in the order given.
+    """
+    from . import effsize as __es
+
+    x0 = np.asarray(x0, dtype=float)
+    x1 = np.asarray(x1, dtype=float)
+    x0_weights = _check_frequency_weights(x0_weights)
+    x1_weights = _check_frequency_weights(x1_weights)
+    m = min(x0_weights.sum(), x1_weights.sum())
+
+    values = []
+    counts = []
+    for left_out in (0, 1):
+        weights = x1_weights if left_out else x0_weights
+        # The occurrences of each value among the first m observations.
+        occurs = np.clip(m - (np.cumsum(weights) - weights), 0, weights)
+        rows = np.flatnonzero(occurs)
+        counts.append(occurs[rows])
+
+        block_size_ = _get_block_size(len(x0) + len(x1), len(rows), block_size)
+        for start in range(0, len(rows), block_size_):
+            block = rows[start : start + block_size_]
+            loo_weights = np.tile(weights, (len(block), 1))
+            loo_weights[arange(len(block)), block] -= 1
+            if left_out:
+                control_counts = np.tile(x0_weights, (len(block), 1))
+                test_counts = loo_weights
+            else:
+                control_counts = loo_weights
+                test_counts = np.tile(x1_weights, (len(block), 1))
+            with errstate(divide="ignore", invalid="ignore"):
+                values.append(__es._weighted_difference(x0, control_counts, x1, test_counts,
+                                                        effect_size))
+
+    return np.concatenate(values), np.concatenate(counts)
+
+
+def _compute_weighted_bootstraps(x0, x0_weights, x1, x1_weights, effect_size, resamples,
+                                 streams, block_size=None, converged=None):
+    """
+    Bootstraps the effect size of frequency-weighted groups, in which each
+    value occurs as many times as its weight, without expanding them.
+
+    A resample of a group is described by the number of times each value is
+    drawn, which is multinomial. The draws of each resample are made in
+    turn, so that the bootstraps do not depend on `block_size`.
+    """
+    from . import effsize as __es
+
+    x0 = np.asarray(x0, dtype=float)
+    x1 = np.asarray(x1, dtype=float)
+    x0_weights = _check_frequency_weights(x0_weights)
+    x1_weights = _check_frequency_weights(x1_weights)
+    x0_n, x1_n = x0_weights.sum(), x1_weights.sum()
+    x0_p, x1_p = x0_weights / x0_n, x1_weights / x1_n
+
+    resamples = int(resamples)
+    block_size = _get_block_size(len(x0) + len(x1), resamples, block_size)
+    if converged is not None:
+        # Ends each block on a check.
+        block_size = min(block_size, ADAPTIVE_CHECK_INTERVAL)
+
+    out = np.empty(resamples)
+    next_check = ADAPTIVE_CHECK_INTERVAL
+    for start in range(0, resamples, block_size):
+        size = min(block_size, resamples - start)
+        x0_counts = np.empty((size, len(x0)), dtype=np.int64)
+        x1_counts = np.empty((size, len(x1)), dtype=np.int64)
+        for i, rng in enumerate(streams.rows(size)):
+            x0_counts[i] = rng.multinomial(x0_n, x0_p)
+            x1_counts[i] = rng.multinomial(x1_n, x1_p)
+
+        out[start : start + size] = __es._weighted_difference(x0, x0_counts, x1, x1_counts,
+                                                              effect_size)
+
+        if converged is not None and start + size >= next_check:
+            if converged(out[: start + size]):
+                return out[: start + size]
+            next_check += ADAPTIVE_CHECK_INTERVAL
+
+    return out
+
+
+def _calc_accel(jack_dist, weights=None):
     """
     Given the Jackknife distribution, calculates the acceleration factor.
+
+    If `weights` is given, `jack_dist` holds the distinct jackknife values
+    and `weights` how many times each of them occurs.
     """
-    jack_mean = npmean(jack_dist)
+    if weights is None:
+        jack_mean = npmean(jack_dist)
 
-    numer = npsum((jack_mean - jack_dist) ** 3)
-    denom = 6.0 * (npsum((jack_mean - jack_dist) ** 2) ** 1.5)
+        numer = npsum((jack_mean - jack_dist) ** 3)
+        denom = 6.0 * (npsum((jack_mean - jack_dist) ** 2) ** 1.5)
+    else:
+        weights = np.asarray(weights, dtype=float)
+        jack_mean = npsum(weights * jack_dist) / npsum(weights)
+
+        numer = npsum(weights * (jack_mean - jack_dist) ** 3)
+        denom = 6.0 * (npsum(weights * (jack_mean - jack_dist) ** 2) ** 1.5)
 
     with errstate(invalid="ignore"):
         # does not raise warning if invalid division encountered.
         return numer / denom
 
 
+# Upper bound on the number of elements held in one block of resampled
+# values, which keeps the peak memory of the vectorized engines bounded.
+MAX_BLOCK_ELEMENTS = 2**22
+
+
+def _get_block_size(group_len, resamples, block_size=None):
+    """
+    Returns the number of resamples to be evaluated per block. If
+    `block_size` is None, it is derived from `MAX_BLOCK_ELEMENTS`.
+    """
+    if block_size is None:
+        block_size = MAX_BLOCK_ELEMENTS // max(int(group_len), 1)
+    elif int(block_size) < 1:
+        raise ValueError("`block_size` must be a positive integer.")
+
+    return int(max(1, min(int(block_size), int(resamples))))
+
+
+# Upper bound on the number of indexes stored by one entry of a resample
+# index cache; larger draws are not cached.
+MAX_CACHED_INDEXES = 2**26
+
+# Upper bound on the number of indexes held by a `_BoundedIndexCache`.
+MAX_INDEX_CACHE_ELEMENTS = 2**27
+
+
+class _BoundedIndexCache(dict):
+    """
+    A resample index cache (see `_iter_index_blocks`) that holds at most
+    `max_elements` indexes, dropping the entries stored first to make room
+    for new ones.
+    """
+
+    def __init__(self, max_elements=MAX_INDEX_CACHE_ELEMENTS):
+        super().__init__()
+        self.max_elements = max_elements
+        self.elements = 0
+
+    def __setitem__(self, key, indexes):
+        if key in self:
+            del self[key]
+        size = sum(idx.size for idx in indexes)
+        for oldest in list(self):
+            if self.elements + size <= self.max_elements:
+                break
+            del self[oldest]
+        if size <= self.max_elements:
+            super().__setitem__(key, indexes)
+            self.elements += size
+
+    def __delitem__(self, key):
+        self.elements -= sum(idx.size for idx in self[key])
+        super().__delitem__(key)
+
+
+def _iter_index_blocks(draw_block, resamples, block_size, group_lens,
+                       index_cache=None, key=None):
+    """
+    Yields `(start, indexes)` for each block of `block_size` resamples,
+    where `indexes` is the tuple of 2-D arrays returned by
+    `draw_block(size)`, one per entry of `group_lens`.
+
+    If `index_cache` is a dict, the indexes of all resamples are stored in
+    it under `key` once drawn, with the smallest integer type that holds
+    them (boolean masks are stored as such), and later calls with the same key read them from the cache
+    instead of drawing them again. The random number generator consumed
+    by `draw_block` must then be determined by `key`; in particular, it
+    must be seeded, so keys holding a `None` seed are never cached.
+    """
+    resamples = int(resamples)
+    if key is None or None in key:
+        index_cache = None
+
+    if index_cache is not None and key in index_cache:
+        cached = index_cache[key]
+        for start in range(0, resamples, block_size):
+            yield start, tuple(c[start : start + block_size] for c in cached)
+        return
+
+    store = (index_cache is not None and
+             resamples * sum(group_lens) <= MAX_CACHED_INDEXES)
+
+    for start in range(0, resamples, block_size):
+        size = min(block_size, resamples - start)
+        indexes = draw_block(size)
+        if store:
+            if start == 0:
+                cached = tuple(
+                    np.empty((resamples, n), dtype=bool if idx.dtype == bool
+                             else np.min_scalar_type(max(n - 1, 0)))
+                    for n, idx in zip(group_lens, indexes)
+                )
+            for c, idx in zip(cached, indexes):
+                c[start : start + size] = idx
+        yield start, indexes
+
+    if store:
+        index_cache[key] = cached
+
+
+def _draw_bootstrap_indexes(streams, x0_len, x1_len, is_paired, size):
+    """
+    Draws the indexes of the next `size` bootstrap resamples of the
+    `_ResampleStreams` `streams` as 2-D arrays, with one resample per row.
+
+    The random number generators are consumed in the same order as in the
+    resample-by-resample loop, so that both engines produce the same
+    bootstraps for a given seed. In 'generator' mode, the two groups are
+    drawn from generators of their own, so the indexes of each are drawn
+    for all the resamples of a shard at once.
+    """
+    if is_paired:
+        random_idx = np.concatenate([_integers(rng, 0, x0_len, size=(count, x0_len))
+                                     for rng, count in streams.take(size)])
+        return random_idx, random_idx
+
+    if streams.rng_mode == "generator":
+        pieces = streams.take(size, groups=2)
+        x0_idx = np.concatenate([x0_rng.integers(0, x0_len, size=(count, x0_len))
+                                 for (x0_rng, _), count in pieces])
+        x1_idx = np.concatenate([x1_rng.integers(0, x1_len, size=(count, x1_len))
+                                 for (_, x1_rng), count in pieces])
+        return x0_idx, x1_idx
+
+    x0_idx = np.empty((size, x0_len), dtype=np.intp)
+    x1_idx = np.empty((size, x1_len), dtype=np.intp)
+    for i, rng in enumerate(streams.rows(size)):
+        x0_idx[i] = _integers(rng, 0, x0_len, x0_len)
+        x1_idx[i] = _integers(rng, 0, x1_len, x1_len)
+
+    return x0_idx, x1_idx
+
+
+def _skip_bootstrap_resamples(streams, x0_len, x1_len, is_paired, size, block_size=None):
+    """
+    Advances the `_ResampleStreams` `streams` past the next `size` bootstrap
+    resamples of the vectorized and loop engines, by drawing their indexes
+    in blocks, without evaluating them.
+    """
+    block_size = _get_block_size(max(x0_len, x1_len), size, block_size)
+    for start in range(0, int(size), block_size):
+        _draw_bootstrap_indexes(streams, x0_len, x1_len, is_paired,
+                                min(block_size, int(size) - start))
+
+
+# Number of resamples drawn between two checks of the stopping rule of an
+# adaptive bootstrap.
+ADAPTIVE_CHECK_INTERVAL = 1000
+
+
+# The random number generators of the resampling routines: 'legacy' draws
+# all the resamples from `RandomState(PCG64(random_seed))`, as earlier
+# versions did, and 'generator' from `Generator` streams spawned from
+# `random_seed` (see `_ResampleStreams`).
+RNG_MODES = ("legacy", "generator")
+
+# The spawn keys of the bootstrap and permutation streams of a contrast.
+BOOTSTRAP_STREAM = 0
+PERMUTATION_STREAM = 1
+
+
+def _check_rng_mode(rng_mode):
+    if rng_mode not in RNG_MODES:
+        err = "`rng_mode` must be one of {}, not '{}'.".format(list(RNG_MODES), rng_mode)
+        raise ValueError(err)
+
+
+def _spawn_seed(random_seed, *spawn_key):
+    """
+    Returns the child of `random_seed`, an int, None or a `SeedSequence`,
+    with the given spawn key, as `SeedSequence.spawn` derives it: e.g.
+    `_spawn_seed(s, 2)` is `SeedSequence(s).spawn(3)[2]`. Unlike `spawn`, it
+    does not depend on the children spawned before.
+    """
+    if not isinstance(random_seed, SeedSequence):
+        random_seed = SeedSequence(random_seed)
+    return SeedSequence(random_seed.entropy, spawn_key=random_seed.spawn_key + spawn_key,
+                        pool_size=random_seed.pool_size)
+
+
+def _seed_key(random_seed):
+    """
+    Returns a hashable description of `random_seed`, for the keys of the
+    resample index caches.
+    """
+    if isinstance(random_seed, SeedSequence):
+        return (random_seed.entropy, random_seed.spawn_key)
+    return random_seed
+
+
+def _make_rng(random_seed, rng_mode="legacy", *spawn_key):
+    """
+    Returns `RandomState(PCG64(random_seed))` in 'legacy' mode, and a
+    `Generator` seeded with the child `spawn_key` of `random_seed` in
+    'generator' mode.
+    """
+    _check_rng_mode(rng_mode)
+    if rng_mode == "legacy":
+        return RandomState(PCG64(random_seed))
+    return Generator(PCG64(_spawn_seed(random_seed, *spawn_key)))
+
+
+def _integers(rng, low, high, size=None):
+    """
+    Draws integers in [low, high) from a `RandomState` or a `Generator`.
+    """
+    if isinstance(rng, RandomState):
+        return rng.randint(low, high, size)
+    return rng.integers(low, high, size)
+
+
+class _ResampleStreams(object):
+    """
+    The random number generators from which consecutive resamples are
+    drawn, for a given `random_seed`.
+
+    In 'legacy' mode, all of them are drawn from `_make_rng(random_seed)`.
+    In 'generator' mode, each shard of `ADAPTIVE_CHECK_INTERVAL` resamples
+    is drawn from its own `Generator`, seeded with the child
+    `stream + (shard,)` of `random_seed`. A resample then only depends on
+    its position, not on how the resamples are split into blocks, and the
+    shards can be drawn independently of each other.
+    """
+
+    def __init__(self, random_seed, rng_mode="legacy", stream=()):
+        _check_rng_mode(rng_mode)
+        if random_seed is None and rng_mode == "generator":
+            # All the shards are spawned from the same fresh entropy.
+            random_seed = SeedSequence()
+        self.random_seed = random_seed
+        self.rng_mode = rng_mode
+        self.stream = tuple(stream)
+        self.position = 0
+        self.__rng = None
+        self.__group_rngs = {}
+
+    def take(self, size, groups=1):
+        """
+        Returns the `(rng, count)` pairs from which the next `size`
+        resamples are drawn, `count` of them from each `rng` in turn.
+
+        If `groups` is greater than 1, `rng` is a tuple of one generator
+        per group. In 'generator' mode, the first is that of the shard and
+        group i > 0 is drawn from the child `(i,)` of its seed; in
+        'legacy' mode, all of them are the single `RandomState`.
+        """
+        pieces = []
+        size = int(size)
+        while size > 0:
+            if self.rng_mode == "legacy":
+                if self.__rng is None:
+                    self.__rng = _make_rng(self.random_seed)
+                count = size
+            else:
+                shard, offset = divmod(self.position, ADAPTIVE_CHECK_INTERVAL)
+                if offset == 0:
+                    self.__rng = _make_rng(self.random_seed, "generator", *self.stream, shard)
+                    self.__group_rngs = {}
+                count = min(size, ADAPTIVE_CHECK_INTERVAL - offset)
+            pieces.append((self.__rng if groups == 1 else self.__rngs(groups), count))
+            self.position += count
+            size -= count
+        return pieces
+
+    def rows(self, size, groups=1):
+        """
+        Yields the random number generator, or with `groups`, the tuple of
+        random number generators, of each of the next `size` resamples.
+        """
+        for rng, count in self.take(size, groups):
+            for _ in range(count):
+                yield rng
+
+    def __rngs(self, groups):
+        """
+        Returns the generators of the `groups` groups of the current shard.
+        """
+        if self.rng_mode == "legacy":
+            return (self.__rng,) * groups
+        shard = self.position // ADAPTIVE_CHECK_INTERVAL
+        for i in range(1, groups):
+            if i not in self.__group_rngs:
+                self.__group_rngs[i] = _make_rng(self.random_seed, "generator",
+                                                 *self.stream, shard, i)
+        return (self.__rng,) + tuple(self.__group_rngs[i] for i in range(1, groups))
+
+
+# The effect sizes that only depend on the size, mean and variance of each
+# group, which the Poisson bootstrap accumulates.
+POISSON_EFFECT_SIZES = ("mean_diff", "cohens_d", "hedges_g", "delta_g", "cohens_h")
+
+# The cumulative distribution function of Poisson(1), up to the count at
+# which it rounds to 1.
+_POISSON_CDF = np.cumsum(np.exp(-1) / np.cumprod(np.r_[1, arange(1, 20)]))
+_POISSON_CDF = _POISSON_CDF[: np.searchsorted(_POISSON_CDF, 1.0) + 1]
+
+
+def _draw_poisson_weights(rng, size):
+    """
+    Draws Poisson(1) counts by inverting the cumulative distribution
+    function at uniform draws, which is quicker than `rng.poisson`.
+    """
+    return np.searchsorted(_POISSON_CDF, rng.random(size), side="right")
+
+
+def _accumulate_poisson_moments(x, resamples, rng, block_size=None):
+    """
+    Returns the sizes, means and sample variances of `resamples` Poisson
+    bootstrap resamples of a group, in a single pass over it.
+
+    `x` is an array-like, or an iterator of array-like chunks that is
+    consumed. Each observation enters each resample a Poisson(1) number
+    of times (see `_draw_poisson_weights`); its weights for all the resamples are drawn together, in
+    the order of the observations, so the resamples do not depend on how
+    the group is chunked. The chunks are split so that at most
+    `MAX_BLOCK_ELEMENTS` weights are held at once, or into pieces of
+    `block_size` observations, and missing values are dropped.
+    """
+    chunks = x if isinstance(x, Iterator) else (x,)
+
+    n = np.zeros(resamples)
+    sums = np.zeros(resamples)
+    sums_sq = np.zeros(resamples)
+    centre = None
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        chunk = chunk[~isnan(chunk)]
+        if not len(chunk):
+            continue
+        if centre is None:
+            # The values are centred on the mean of the first chunk, so that
+            # the sums of squares do not suffer from catastrophic cancellation.
+            centre = chunk.mean()
+
+        step = _get_block_size(resamples, len(chunk), block_size)
+        for start in range(0, len(chunk), step):
+            deviations = chunk[start : start + step] - centre
+            weights = _draw_poisson_weights(rng, (len(deviations), resamples)).astype(float)
+            n += weights.sum(axis=0)
+            sums += deviations @ weights
+            sums_sq += deviations**2 @ weights
+
+    if centre is None:
+        raise ValueError("Cannot bootstrap an empty group.")
+
+    with errstate(divide="ignore", invalid="ignore"):
+        means = centre + sums / n
+        variances = np.maximum(sums_sq - sums**2 / n, 0) / (n - 1)
+
+    return n, means, variances
+
+
+def compute_poisson_bootstrapped_diff(
+    x0, x1, effect_size, resamples=5000, random_seed=12345, block_size=None,
+    rng_mode="legacy"
+):
+    """
+    Bootstraps the unpaired effect_size for 2 groups with the Poisson
+    bootstrap, for groups too large to be resampled by index.
+
+    Each group is read in a single pass, and only the size, sum and sum of
+    squares of each resample are kept (see `_accumulate_poisson_moments`),
+    so the memory used does not depend on the size of the groups, which
+    may be given as iterators of chunks (e.g. the row groups of a Parquet
+    file). The time is still proportional to the size of the groups times
+    `resamples`.
+
+    The size of each resample is itself random, with mean the size of the
+    group; for large groups, the resamples follow the distribution of those
+    of the other engines. Only the effect sizes in `POISSON_EFFECT_SIZES`
+    can be computed. The weights are drawn from `_make_rng(random_seed,
+    rng_mode, BOOTSTRAP_STREAM)`.
+    """
+    from . import effsize as __es
+
+    if effect_size not in POISSON_EFFECT_SIZES:
+        err = "The Poisson bootstrap only supports {}, not '{}'."
+        raise ValueError(err.format(list(POISSON_EFFECT_SIZES), effect_size))
+
+    resamples = int(resamples)
+    rng = _make_rng(random_seed, rng_mode, BOOTSTRAP_STREAM)
+    x0_moments = _accumulate_poisson_moments(x0, resamples, rng, block_size)
+    x1_moments = _accumulate_poisson_moments(x1, resamples, rng, block_size)
+
+    with errstate(divide="ignore", invalid="ignore"):
+        return __es._difference_from_moments(*x0_moments, *x1_moments, effect_size)
+
+
+# The number of subsets of the Bag of Little Bootstraps, and the exponent
+# of the size of the groups that gives the size of each subset.
+BLB_SUBSETS = 20
+BLB_EXPONENT = 0.6
+
+
+def _draw_subset(rng, n, size):
+    """
+    Draws `size` distinct indexes out of `n` uniformly. When `size` is much
+    smaller than `n`, repeated indexes are redrawn instead of permuting all
+    `n` of them.
+    """
+    if 2 * size > n:
+        return rng.permutation(n)[:size]
+
+    chosen = np.empty(0, dtype=np.intp)
+    while len(chosen) < size:
+        draws = np.concatenate([chosen, _integers(rng, 0, n, size=size - len(chosen))])
+        # Keeps the first occurrence of each index, in the order drawn.
+        _, first = np.unique(draws, return_index=True)
+        chosen = draws[np.sort(first)]
+    return chosen
+
+
+def _compute_blb_subset_bootstraps(x0_subset, x0_len, x1_subset, x1_len, effect_size,
+                                   resamples, rng, block_size=None):
+    """
+    Bootstraps the effect size of a subset of each group, resampled to the
+    size of the whole group with multinomial counts of its values, and
+    returns the deviations of the bootstraps from the effect size of the
+    subsets.
+    """
+    from . import effsize as __es
+
+    x0_p = np.full(len(x0_subset), 1 / len(x0_subset))
+    x1_p = np.full(len(x1_subset), 1 / len(x1_subset))
+    block_size = _get_block_size(len(x0_subset) + len(x1_subset), resamples, block_size)
+
+    out = np.empty(resamples)
+    for start in range(0, resamples, block_size):
+        size = min(block_size, resamples - start)
+        x0_counts = rng.multinomial(x0_len, x0_p, size=size)
+        x1_counts = rng.multinomial(x1_len, x1_p, size=size)
+        out[start : start + size] = __es._weighted_difference(x0_subset, x0_counts,
+                                                              x1_subset, x1_counts, effect_size)
+
+    subset_difference = __es._weighted_difference(
+        x0_subset, np.ones((1, len(x0_subset))), x1_subset, np.ones((1, len(x1_subset))),
+        effect_size
+    )
+    return out - subset_difference
+
+
+def compute_blb_bootstrapped_diff(
+    x0, x1, effect_size, resamples=5000, random_seed=12345, subsets=BLB_SUBSETS,
+    exponent=BLB_EXPONENT, block_size=None, executor=None, difference=None,
+    rng_mode="legacy"
+):
+    """
+    Bootstraps the unpaired effect_size for 2 groups with the Bag of Little
+    Bootstraps (Kleiner et al., 2014), for groups too large to be
+    resampled in full.
+
+    Each of `subsets` subsets holds len(x)**`exponent` values drawn without
+    replacement from each group, and is bootstrapped `resamples // subsets`
+    times with multinomial counts that add up to the size of the group, so
+    the cost of a resample depends on the size of the subsets only. This
+    suits effect sizes without sufficient statistics, such as
+    'median_diff' and 'cliffs_delta'.
+
+    The effect size of each subset varies much more than that of the whole
+    groups, so only the deviations of its bootstraps from it are kept, and
+    added to `difference`, the effect size of the whole groups (computed
+    if None). The bootstraps of each subset are returned one after
+    another; the intervals are those of each subset, averaged with
+    `compute_blb_intervals`. Subset i is drawn from a generator of its own,
+    jumped i + 1 times from `random_seed` in 'legacy' `rng_mode` and seeded
+    with the child (BOOTSTRAP_STREAM, i) of `random_seed` in 'generator'
+    mode, so the subsets are independent of each other and of the order in
+    which they are computed. If `executor` is given, the subsets are
+    bootstrapped on it.
+    """
+    from itertools import repeat as iterrepeat
+    from . import effsize as __es
+
+    x0 = np.asarray(x0, dtype=float)
+    x1 = np.asarray(x1, dtype=float)
+    x0 = x0[~isnan(x0)]
+    x1 = x1[~isnan(x1)]
+    if difference is None:
+        difference = __es.two_group_difference(x0, x1, None, effect_size)
+    per_subset = max(int(resamples) // int(subsets), 1)
+    _check_rng_mode(rng_mode)
+    if random_seed is None and rng_mode == "generator":
+        random_seed = SeedSequence()
+
+    x0_subsets, x1_subsets, rngs = [], [], []
+    for i in range(int(subsets)):
+        if rng_mode == "legacy":
+            rng = RandomState(PCG64(random_seed).jumped(i + 1))
+        else:
+            rng = _make_rng(random_seed, rng_mode, BOOTSTRAP_STREAM, i)
+        x0_subsets.append(x0[_draw_subset(rng, len(x0), max(int(len(x0) ** exponent), 2))])
+        x1_subsets.append(x1[_draw_subset(rng, len(x1), max(int(len(x1) ** exponent), 2))])
+        rngs.append(rng)
+
+    args = (x0_subsets, iterrepeat(len(x0)), x1_subsets, iterrepeat(len(x1)),
+            iterrepeat(effect_size), iterrepeat(per_subset), rngs, iterrepeat(block_size))
+    if executor is None:
+        bootstraps = list(map(_compute_blb_subset_bootstraps, *args))
+    else:
+        bootstraps = list(executor.map(_compute_blb_subset_bootstraps, *args))
+
+    return difference + np.concatenate(bootstraps)
+
+
 def compute_bootstrapped_diff(
-    x0, x1, is_paired, effect_size, resamples=5000, random_seed=12345
+    x0, x1, is_paired, effect_size, resamples=5000, random_seed=12345,
+    engine="vectorized", block_size=None, index_cache=None, converged=None,
+    x0_weights=None, x1_weights=None, rng_mode="legacy", streams=None, executor=None
 ):
-    """Bootstraps the effect_size for 2 groups."""
+    """
+    Bootstraps the effect_size for 2 groups.
+
+    With `engine="vectorized"`, the resamples are drawn in blocks of
+    `block_size` as 2-D index arrays, and the effect size is evaluated
+    along the resample axis with `effsize.two_group_difference_batch`.
+    If `block_size` is None, it is chosen such that each block holds at
+    most `MAX_BLOCK_ELEMENTS` values.
+
+    With `engine="loop"`, the resamples are drawn and evaluated one at a
+    time. Both engines draw the same resamples for a given `random_seed`.
+
+    With `engine="counts"`, which only applies to 'mean_diff' and
+    'cohens_h' of binary data, the counts of ones of each resample are
+    drawn instead of its values (see `_compute_binary_bootstraps`), in
+    O(resamples) time. The resamples follow the same distribution as with
+    the other engines, but not the same random stream.
+
+    With `engine="poisson"`, which only applies to unpaired groups and the
+    effect sizes in `POISSON_EFFECT_SIZES`, the groups are resampled with
+    `compute_poisson_bootstrapped_diff`. Its resamples are not adaptive.
+
+    With `engine="blb"`, which only applies to unpaired groups, the groups
+    are resampled with the Bag of Little Bootstraps of
+    `compute_blb_bootstrapped_diff`, whose intervals are computed with
+    `compute_blb_intervals`, and whose subsets are bootstrapped on
+    `executor`, if given. Its resamples are not adaptive either.
+
+    As the resamples only depend on the group sizes, `random_seed` and
+    `resamples`, the vectorized engine can share them across effect sizes
+    and contrasts through `index_cache`, a dict in which the drawn
+    indexes are stored (see `_iter_index_blocks`).
+
+    If `converged` is given, the bootstrap is adaptive: `resamples` is
+    the maximum number of resamples, and every `ADAPTIVE_CHECK_INTERVAL`
+    resamples, `converged` is called with the bootstraps drawn so far.
+    Once it returns True, those bootstraps are returned. They are the
+    first resamples of the non-adaptive bootstrap with the same seed.
+
+    If `x0_weights` and `x1_weights` are given, they are the frequency of
+    each value of the unpaired groups, which are then resampled with
+    multinomial counts of their values instead of being expanded (see
+    `_compute_weighted_bootstraps`), whatever the engine.
+
+    With `rng_mode="legacy"`, the resamples are drawn from
+    `RandomState(PCG64(random_seed))`, as in earlier versions. With
+    `rng_mode="generator"`, they are drawn from `Generator` streams
+    spawned from `random_seed` (see `_ResampleStreams`), each shard of
+    `ADAPTIVE_CHECK_INTERVAL` resamples from its own stream. `random_seed`
+    may then also be a `SeedSequence`, such as a child spawned for a
+    contrast.
+
+    With the vectorized and loop engines, and for weighted groups, the
+    resamples may be drawn from `streams`, the `_ResampleStreams` of
+    `random_seed` and `rng_mode`, instead of fresh ones. As the resamples
+    are drawn one after the other, passing the streams of an earlier call
+    continues its bootstrap: the bootstraps returned are those that follow
+    its own in a single call with all the resamples. Resamples that do not
+    start the streams are not cached, and resamples read from the cache do
+    not advance them (see `_skip_bootstrap_resamples`).
+    """
 
     from . import effsize as __es
 
-    rng = RandomState(PCG64(random_seed))
+    if engine not in ("vectorized", "loop", "counts", "poisson", "blb"):
+        err = ("`engine` must be one of ['vectorized', 'loop', 'counts', 'poisson', 'blb'], "
+               "not '{}'.".format(engine))
+        raise ValueError(err)
+
+    if engine == "poisson" and x0_weights is None and x1_weights is None:
+        if is_paired:
+            raise ValueError("The Poisson bootstrap cannot be used with paired data.")
+        return compute_poisson_bootstrapped_diff(x0, x1, effect_size, resamples,
+                                                 random_seed, block_size, rng_mode)
+
+    if engine == "blb" and x0_weights is None and x1_weights is None:
+        if is_paired:
+            raise ValueError("The Bag of Little Bootstraps cannot be used with paired data.")
+        return compute_blb_bootstrapped_diff(x0, x1, effect_size, resamples, random_seed,
+                                             block_size=block_size, executor=executor,
+                                             rng_mode=rng_mode)
+
+    if streams is None:
+        streams = _ResampleStreams(random_seed, rng_mode, (BOOTSTRAP_STREAM,))
+    elif streams.position > 0:
+        index_cache = None
 
-    out = np.repeat(np.nan, resamples)
     x0_len = len(x0)
     x1_len = len(x1)
 
-    for i in range(int(resamples)):
+    if is_paired and x0_len != x1_len:
+        raise ValueError("The two arrays do not have the same length.")
+
+    if x0_weights is not None or x1_weights is not None:
+        if is_paired:
+            raise ValueError("Frequency weights cannot be used with paired data.")
+        return _compute_weighted_bootstraps(
+            x0, np.ones(x0_len) if x0_weights is None else x0_weights,
+            x1, np.ones(x1_len) if x1_weights is None else x1_weights,
+            effect_size, resamples, streams, block_size, converged
+        )
+
+    if engine == "counts":
+        return _compute_binary_bootstraps(x0, x1, is_paired, effect_size, resamples, streams,
+                                          converged)
+
+    if engine == "vectorized":
+        x0 = np.asarray(x0)
+        x1 = np.asarray(x1)
+        # The batched kernels do not drop NaNs within each resample.
+        if isnan(x0).any() or isnan(x1).any():
+            engine = "loop"
+
+    out = np.repeat(np.nan, resamples)
+    next_check = ADAPTIVE_CHECK_INTERVAL
+
+    if engine == "vectorized":
+        block_size = _get_block_size(max(x0_len, x1_len), resamples, block_size)
+        if converged is not None:
+            # Ends each block on a check.
+            block_size = min(block_size, ADAPTIVE_CHECK_INTERVAL)
+
+        if effect_size == "cliffs_delta" and not is_paired:
+            # Code the values by rank once, so that each resample is only
+            # counted, not sorted.
+            levels, codes = np.unique(np.concatenate([x0, x1]), return_inverse=True)
+            x0_codes, x1_codes = codes[:x0_len], codes[x0_len:]
+
+        def draw_block(size):
+            x0_idx, x1_idx = _draw_bootstrap_indexes(streams, x0_len, x1_len, is_paired, size)
+            return (x0_idx,) if is_paired else (x0_idx, x1_idx)
+
+        group_lens = (x0_len,) if is_paired else (x0_len, x1_len)
+        key = ("bootstrap", x0_len, x1_len, bool(is_paired), int(resamples),
+               _seed_key(random_seed), rng_mode)
+
+        for start, indexes in _iter_index_blocks(
+            draw_block, resamples, block_size, group_lens, index_cache, key
+        ):
+            x0_idx, x1_idx = indexes[0], indexes[-1]
+            size = len(x0_idx)
+            if effect_size == "cliffs_delta" and not is_paired:
+                out[start : start + size] = __es._cliffs_delta_from_codes(
+                    x0_codes[x0_idx], x1_codes[x1_idx], len(levels)
+                )
+            else:
+                out[start : start + size] = __es.two_group_difference_batch(
+                    x0[x0_idx], x1[x1_idx], is_paired, effect_size
+                )
+
+            if converged is not None and start + size >= next_check:
+                if converged(out[: start + size]):
+                    return out[: start + size]
+                next_check += ADAPTIVE_CHECK_INTERVAL
+
+        return out
+
+    for i, (x0_rng, x1_rng) in enumerate(streams.rows(resamples, groups=2)):
         if is_paired:
-            if x0_len != x1_len:
-                raise ValueError("The two arrays do not have the same length.")
-            random_idx = rng.choice(x0_len, x0_len, replace=True)
+            random_idx = _integers(x0_rng, 0, x0_len, x0_len)
             x0_sample = x0[random_idx]
             x1_sample = x1[random_idx]
         else:
-            x0_sample = rng.choice(x0, x0_len, replace=True)
-            x1_sample = rng.choice(x1, x1_len, replace=True)
+            x0_sample = x0[_integers(x0_rng, 0, x0_len, x0_len)]
+            x1_sample = x1[_integers(x1_rng, 0, x1_len, x1_len)]
 
         out[i] = __es.two_group_difference(x0_sample, x1_sample, is_paired, effect_size)
 
+        if converged is not None and i + 1 == next_check:
+            if converged(out[: i + 1]):
+                return out[: i + 1]
+            next_check += ADAPTIVE_CHECK_INTERVAL
+
     return out
 
 
@@ -148,15 +1202,25 @@ def compute_delta2_bootstrapped_diff(
     is_paired: str = None,
     resamples: int = 5000,  # The number of bootstrap resamples to be taken for the calculation of the confidence interval limits.
     random_seed: int = 12345,  # `random_seed` is used to seed the random number generator during bootstrap resampling. This ensures that the confidence intervals reported are replicable.
+    engine: str = "vectorized",  # Either "vectorized" or "loop"; see `compute_bootstrapped_diff`.
+    block_size: int = None,  # The number of resamples evaluated per block by the vectorized engine.
+    index_cache: dict = None,  # A dict in which the resample indexes of the vectorized engine are cached.
+    rng_mode: str = "legacy",  # Either "legacy" or "generator"; see `compute_bootstrapped_diff`.
 ) -> (
     tuple
 ):  # bootstraped result and empirical result of deltas' g, and the bootstraped result of delta-delta
     """
     Bootstraps the effect size deltas' g.
 
+    The vectorized engine draws the same resamples as the loop, in blocks,
+    and caches them in `index_cache`, if given, so that they are drawn only
+    once for all the effect sizes of a delta-delta analysis.
     """
+    if engine not in ("vectorized", "loop"):
+        err = "`engine` must be one of ['vectorized', 'loop'], not '{}'.".format(engine)
+        raise ValueError(err)
 
-    rng = RandomState(PCG64(random_seed))
+    streams = _ResampleStreams(random_seed, rng_mode, (BOOTSTRAP_STREAM,))
 
     x1, x2, x3, x4 = map(np.asarray, [x1, x2, x3, x4])
 
@@ -177,25 +1241,34 @@ def compute_delta2_bootstrapped_diff(
     if np.isnan(pooled_sample_sd) or pooled_sample_sd == 0:
         raise ValueError("Pooled sample standard deviation is NaN or zero.")
 
+    # Empirical delta_g calculation
+    delta_g = ((np.mean(x4) - np.mean(x3)) - (np.mean(x2) - np.mean(x1))) / pooled_sample_sd
+
+    if engine == "vectorized":
+        deltadelta = _compute_delta2_bootstraps_batch(
+            streams, x1, x2, x3, x4, is_paired, resamples, block_size, index_cache
+        )
+        return deltadelta / pooled_sample_sd, delta_g, deltadelta
+
     out_delta_g = np.empty(resamples)
     deltadelta = np.empty(resamples)
 
     # Bootstrapping
-    for i in range(resamples):
+    for i, rng in enumerate(streams.rows(resamples)):
         # Paired or unpaired resampling
         if is_paired:
             if len(x1) != len(x2) or len(x3) != len(x4):
                 raise ValueError("Each control group must have the same length as its corresponding test group in paired analysis.")
-            indices_1 = rng.choice(len(x1), len(x1), replace=True)
-            indices_2 = rng.choice(len(x3), len(x3), replace=True)
+            indices_1 = _integers(rng, 0, len(x1), len(x1))
+            indices_2 = _integers(rng, 0, len(x3), len(x3))
 
             x1_sample, x2_sample = x1[indices_1], x2[indices_1]
             x3_sample, x4_sample = x3[indices_2], x4[indices_2]
         else:
-            x1_sample = rng.choice(x1, len(x1), replace=True)
-            x2_sample = rng.choice(x2, len(x2), replace=True)
-            x3_sample = rng.choice(x3, len(x3), replace=True)
-            x4_sample = rng.choice(x4, len(x4), replace=True)
+            x1_sample = x1[_integers(rng, 0, len(x1), len(x1))]
+            x2_sample = x2[_integers(rng, 0, len(x2), len(x2))]
+            x3_sample = x3[_integers(rng, 0, len(x3), len(x3))]
+            x4_sample = x4[_integers(rng, 0, len(x4), len(x4))]
 
         # Calculating deltas
         delta_1 = np.mean(x2_sample) - np.mean(x1_sample)
@@ -205,12 +1278,49 @@ def compute_delta2_bootstrapped_diff(
         deltadelta[i] = delta_delta
         out_delta_g[i] = delta_delta / pooled_sample_sd
 
-    # Empirical delta_g calculation
-    delta_g = ((np.mean(x4) - np.mean(x3)) - (np.mean(x2) - np.mean(x1))) / pooled_sample_sd
-
     return out_delta_g, delta_g, deltadelta
 
 
+def _compute_delta2_bootstraps_batch(streams, x1, x2, x3, x4, is_paired, resamples,
+                                     block_size=None, index_cache=None):
+    """
+    Computes the delta-delta of each bootstrap resample, evaluating blocks
+    of resamples at once. The `_ResampleStreams` `streams` are consumed in
+    the same order as in the resample-by-resample loop.
+    """
+    resamples = int(resamples)
+    groups = (x1, x3) if is_paired else (x1, x2, x3, x4)
+    if is_paired and (len(x1) != len(x2) or len(x3) != len(x4)):
+        raise ValueError("Each control group must have the same length as its corresponding test group in paired analysis.")
+
+    group_lens = tuple(len(x) for x in groups)
+
+    def draw_block(size):
+        indexes = tuple(np.empty((size, n), dtype=np.intp) for n in group_lens)
+        for i, rng in enumerate(streams.rows(size)):
+            for idx, n in zip(indexes, group_lens):
+                idx[i] = _integers(rng, 0, n, n)
+        return indexes
+
+    key = ("delta2_bootstrap", tuple(len(x) for x in (x1, x2, x3, x4)), bool(is_paired),
+           resamples, _seed_key(streams.random_seed), streams.rng_mode)
+    block_size = _get_block_size(sum(group_lens), resamples, block_size)
+    deltadelta = np.empty(resamples)
+    for start, indexes in _iter_index_blocks(draw_block, resamples, block_size,
+                                             group_lens, index_cache, key):
+        if is_paired:
+            idx_1, idx_2 = indexes
+            idx_1, idx_2, idx_3, idx_4 = idx_1, idx_1, idx_2, idx_2
+        else:
+            idx_1, idx_2, idx_3, idx_4 = indexes
+
+        delta_1 = np.mean(x2[idx_2], axis=1) - np.mean(x1[idx_1], axis=1)
+        delta_2 = np.mean(x4[idx_4], axis=1) - np.mean(x3[idx_3], axis=1)
+        deltadelta[start : start + len(idx_1)] = delta_2 - delta_1
+
+    return deltadelta
+
+
 def compute_meandiff_bias_correction(
     bootstraps,  # An numerical iterable, comprising bootstrap resamples of the effect size.
     effsize,  # The effect size for the original sample.
@@ -275,6 +1385,127 @@ def compute_interval_limits(bias, acceleration, n_boots, ci=95):
     return low, high
 
 
+def compute_intervals(
+    sorted_bootstraps,  # The bootstraps of the effect size, in ascending order.
+    effsize,  # The effect size for the original sample.
+    bias,  # The bias correction of the BCa interval.
+    acceleration,  # The acceleration factor of the BCa interval.
+    ci=(95,),  # The confidence interval widths, in percent.
+    kind=("bca", "percentile"),  # The confidence intervals computed.
+):
+    """
+    Returns the limits of the confidence intervals of each width in `ci`, as
+    a dict of arrays with one value per width. Each limit is read from the
+    sorted bootstraps at the index `compute_interval_limits` would return, so
+    the bootstraps are neither drawn nor sorted again.
+    """
+    n_boots = len(sorted_bootstraps)
+    alpha = np.array([_compute_alpha_from_ci(c) for c in ci])
+    levels = {"low": alpha / 2, "high": 1 - (alpha / 2)}
+
+    limits = {}
+    if "bca" in kind:
+        for side, level in levels.items():
+            quantile = _compute_quantile(norm.ppf(level), bias, acceleration)
+            # As in a single interval, undefined limits are set to the effect size.
+            defined = ~isnan(quantile)
+            bca = np.full(len(alpha), effsize, dtype=float)
+            bca[defined] = sorted_bootstraps[(norm.cdf(quantile[defined]) * n_boots).astype(int)]
+            limits["bca_" + side] = bca
+    if "percentile" in kind:
+        for side, level in levels.items():
+            limits["pct_" + side] = sorted_bootstraps[(level * n_boots).astype(int)]
+
+    return limits
+
+
+def _quantile_mc_se(sorted_bootstraps, q):
+    """
+    Estimates the Monte Carlo standard error of the q-quantile of sorted
+    bootstraps, as half the spacing between the order statistics one
+    binomial standard deviation on either side of it.
+    """
+    n_boots = len(sorted_bootstraps)
+    sd = np.sqrt(q * (1 - q) / n_boots)
+    low = int(np.clip(np.floor((q - sd) * n_boots), 0, n_boots - 1))
+    high = int(np.clip(np.ceil((q + sd) * n_boots), 0, n_boots - 1))
+
+    return (sorted_bootstraps[high] - sorted_bootstraps[low]) / 2
+
+
+def compute_interval_precision(
+    bootstraps,  # An numerical iterable, comprising bootstrap resamples of the effect size.
+    effsize,  # The effect size for the original sample.
+    acceleration,  # The acceleration factor of the BCa interval.
+    ci=95,
+):  # The largest standard error of the interval limits, relative to the interval width.
+    """
+    Returns the largest Monte Carlo standard error of the limits of the
+    percentile and BCa intervals, relative to the width of the percentile
+    interval. This is the precision monitored by the adaptive bootstrap.
+    """
+    sorted_bootstraps = np.sort(bootstraps)
+    n_boots = len(sorted_bootstraps)
+    alpha = _compute_alpha_from_ci(ci)
+
+    levels = [alpha / 2, 1 - (alpha / 2)]
+    bias = compute_meandiff_bias_correction(sorted_bootstraps, effsize)
+    bca_levels = norm.cdf(_compute_quantile(norm.ppf(levels), bias, acceleration))
+    if not isnan(bca_levels).any():
+        levels.extend(bca_levels)
+
+    mc_se = max(_quantile_mc_se(sorted_bootstraps, q) for q in levels)
+    width = (sorted_bootstraps[int(levels[1] * n_boots)] -
+             sorted_bootstraps[int(levels[0] * n_boots)])
+
+    if not (np.isfinite(width) and np.isfinite(mc_se)):
+        return np.inf
+    if width == 0:
+        # All bootstraps are equal; drawing more would not change them.
+        return 0.0 if mc_se == 0 else np.inf
+
+    return mc_se / width
+
+
+def compute_blb_intervals(
+    bootstraps,  # The bootstraps returned by `compute_blb_bootstrapped_diff`.
+    effsize,  # The effect size for the original sample.
+    acceleration,  # The acceleration factor of the BCa interval.
+    ci=95,  # The confidence interval width, in percent.
+    subsets=BLB_SUBSETS,  # The number of subsets the bootstraps were drawn from.
+):
+    """
+    Returns the BCa and percentile interval limits of a Bag of Little
+    Bootstraps, as the averages of those of each subset, with the indexes
+    of the limits within each subset's sorted bootstraps.
+
+    Returns
+    -------
+    (bca_low, bca_high, pct_low, pct_high, bca_interval_idx, pct_interval_idx)
+    """
+    sorted_subsets = np.sort(np.reshape(bootstraps, (int(subsets), -1)), axis=1)
+    per_subset = sorted_subsets.shape[1]
+
+    alpha = _compute_alpha_from_ci(ci)
+    pct_idx = (int((alpha / 2) * per_subset),
+               min(int((1 - alpha / 2) * per_subset), per_subset - 1))
+
+    bca_idx = []
+    bca_limits = []
+    for sorted_bootstraps in sorted_subsets:
+        bias = compute_meandiff_bias_correction(sorted_bootstraps, effsize)
+        idx = compute_interval_limits(bias, acceleration, per_subset, ci)
+        # As for a full bootstrap, undefined limits are set to the effect size.
+        bca_limits.append([effsize if isnan(i) else sorted_bootstraps[min(int(i), per_subset - 1)]
+                           for i in idx])
+        bca_idx.append(idx)
+
+    bca_low, bca_high = np.mean(bca_limits, axis=0)
+    pct_low, pct_high = np.mean(sorted_subsets[:, pct_idx], axis=0)
+    bca_idx = tuple(np.array(idx) for idx in zip(*bca_idx))
+    return bca_low, bca_high, pct_low, pct_high, bca_idx, pct_idx
+
+
 def calculate_group_var(control_var, control_N, test_var, test_N):
     return control_var / control_N + test_var / test_N
 
@@ -282,10 +1513,20 @@ def calculate_group_var(control_var, control_N, test_var, test_N):
 def calculate_weighted_delta(group_var, differences):
     """
     Compute the weighted deltas.
+
+    `differences` holds the deltas of each experiment, such as its
+    bootstraps or permutations, which are stacked and reduced along the
+    experiment axis. `group_var` holds either one variance per experiment
+    or one variance per delta.
     """
+    differences = np.stack(differences)
+    weight = 1 / np.asarray(group_var, dtype=float)
 
-    weight = 1 / group_var
-    denom = np.sum(weight)
-    num = np.sum(weight[i] * differences[i] for i in range(0, len(weight)))
+    if weight.ndim == 1:
+        denom = np.sum(weight)
+        weight = weight.reshape((-1,) + (1,) * (differences.ndim - 1))
+    else:
+        denom = np.sum(weight, axis=0)
+    num = np.sum(weight * differences, axis=0)
 
     return num / denom
@@ -8,7 +8,8 @@ from scipy.special import gamma
 from scipy.stats import mannwhitneyu
 
 # %% auto 0
-__all__ = ['two_group_difference', 'func_difference', 'cohens_d', 'cohens_h', 'hedges_g', 'cliffs_delta', 'weighted_delta']
+__all__ = ['two_group_difference', 'func_difference', 'cohens_d', 'cohens_h', 'hedges_g', 'cliffs_delta', 'weighted_delta',
+           'two_group_difference_batch']
 
 # %% ../../nbs/API/effsize.ipynb 5
 def two_group_difference(control:list|tuple|np.ndarray, #Accepts lists, tuples, or numpy ndarrays of numeric types.
@@ -115,17 +116,11 @@ def func_difference(control:list|tuple|np.ndarray, # NaNs are automatically disc
             err = "The two arrays supplied do not have the same length."
             raise ValueError(err)
 
-        control_nan = np.where(np.isnan(control))[0]
-        test_nan    = np.where(np.isnan(test))[0]
+        # Drop the pairs in which either value is missing.
+        good_pairs = ~(np.isnan(control) | np.isnan(test))
 
-        indexes_to_drop = np.unique(np.concatenate([control_nan,
-                                                    test_nan]))
-
-        good_indexes = [i for i in range(0, len(control))
-                        if i not in indexes_to_drop]
-
-        control = control[good_indexes]
-        test    = test[good_indexes]
+        control = control[good_pairs]
+        test    = test[good_pairs]
 
         return func(test - control)
 
@@ -245,8 +240,8 @@ def cohens_h(control:list|tuple|np.ndarray,
     control = control[~np.isnan(control)]
     test = test[~np.isnan(test)]
 
-    prop_control = sum(control)/len(control)
-    prop_test = sum(test)/len(test)
+    prop_control = np.sum(control)/len(control)
+    prop_test = np.sum(test)/len(test)
 
     # Arcsine transformation
     phi_control = 2 * np.arcsin(np.sqrt(prop_control))
@@ -402,3 +397,365 @@ def weighted_delta(difference, group_var):
 
     weight = np.true_divide(1, group_var)
     return np.sum(difference*weight)/np.sum(weight)
+
+
+def _compute_standardizers_batch(control, test):
+    """
+    Row-wise version of `_compute_standardizers`, where each row of the
+    2-D arrays `control` and `test` is one resample.
+    """
+    control_n = control.shape[1]
+    test_n = test.shape[1]
+
+    control_var = np.var(control, axis=1, ddof=1)
+    test_var = np.var(test, axis=1, ddof=1)
+
+    pooled = np.sqrt(((control_n - 1) * control_var + (test_n - 1) * test_var) /
+               (control_n + test_n - 2)
+               )
+
+    average = np.sqrt((control_var + test_var) / 2)
+
+    return pooled, average
+
+
+def _median_batch(x, overwrite_input=False):
+    """
+    Row-wise median of a 2-D array, found by partitioning each row around
+    its middle element(s) rather than sorting it. If `overwrite_input` is
+    True, `x` is partitioned in place instead of being copied.
+    """
+    n = x.shape[1]
+    kth = [(n - 1) // 2, n // 2]
+
+    if overwrite_input:
+        x.partition(kth, axis=1)
+    else:
+        x = np.partition(x, kth, axis=1)
+
+    return (x[:, kth[0]] + x[:, kth[1]]) / 2
+
+
+def _cohens_d_batch(control, test, is_paired=None):
+    """
+    Row-wise version of `cohens_d` for 2-D arrays of resamples.
+    """
+    pooled_sd, average_sd = _compute_standardizers_batch(control, test)
+
+    if is_paired:
+        M = np.mean(test - control, axis=1)
+        divisor = average_sd
+    else:
+        M = np.mean(test, axis=1) - np.mean(control, axis=1)
+        divisor = pooled_sd
+
+    if (divisor == 0).any():
+        raise ValueError("The divisor is zero, indicating no variability in the data.")
+
+    return M / divisor
+
+
+def two_group_difference_batch(control:np.ndarray, # 2-D array; each row is one resample of the control group.
+                               test:np.ndarray, # 2-D array; each row is one resample of the test group.
+                               is_paired=None, # If not None, rows of `control` and `test` are paired observations.
+                               effect_size:str="mean_diff" # Any one of the effect sizes accepted by `two_group_difference`.
+                              )->np.ndarray: # The effect size of every row.
+    """
+    Computes `two_group_difference` for every row of `control` and `test`
+    at once, evaluating the effect size along the resample axis.
+
+    This is the kernel used by the vectorized resampling engines. Unlike
+    `two_group_difference`, NaNs are not dropped, so the resamples should
+    be drawn from NaN-free data.
+    """
+    control = np.atleast_2d(control)
+    test = np.atleast_2d(test)
+
+    if is_paired and control.shape[1] != test.shape[1]:
+        err = "The two arrays supplied do not have the same length."
+        raise ValueError(err)
+
+    if effect_size == "mean_diff":
+        if is_paired:
+            return np.mean(test - control, axis=1)
+        return np.mean(test, axis=1) - np.mean(control, axis=1)
+
+    if effect_size == "median_diff":
+        if is_paired:
+            return _median_batch(test - control, overwrite_input=True)
+        return _median_batch(test) - _median_batch(control)
+
+    if effect_size == "cohens_d":
+        return _cohens_d_batch(control, test, is_paired)
+
+    if effect_size == "cohens_h":
+        if np.isin(control, [0, 1]).all() == False or np.isin(test, [0, 1]).all() == False:
+            raise ValueError("Input data must be binary.")
+        phi_control = 2 * np.arcsin(np.sqrt(np.mean(control, axis=1)))
+        phi_test = 2 * np.arcsin(np.sqrt(np.mean(test, axis=1)))
+        return phi_test - phi_control
+
+    if effect_size == "hedges_g" or effect_size == "delta_g":
+        d = _cohens_d_batch(control, test, is_paired)
+        correction_factor = _compute_hedges_correction_factor(control.shape[1],
+                                                              test.shape[1])
+        return correction_factor * d
+
+    if effect_size == "cliffs_delta":
+        if is_paired:
+            err1 = "`is_paired` is not None; therefore Cliff's delta is not defined."
+            raise ValueError(err1)
+        return _cliffs_delta_batch(control, test)
+
+    raise ValueError("The effect size '{}' is not supported.".format(effect_size))
+
+
+def _cliffs_delta_from_codes(control_codes:np.ndarray, # 2-D array of the control values coded as in `_cliffs_delta_batch`.
+                             test_codes:np.ndarray, # 2-D array of the test values coded likewise.
+                             n_levels:int # The number of distinct values in the pooled data.
+                            )->np.ndarray:
+    """
+    Row-wise Cliff's delta of samples whose values are coded as their
+    position among the sorted distinct values of the pooled data, so that
+    equal values share a code.
+
+    Each row is counted into a histogram of control codes; its cumulative
+    sum gives, for every test value, the number of control values below
+    and above it. This costs O(n + n_levels) per row, without sorting.
+    """
+    size, control_n = control_codes.shape
+    test_n = test_codes.shape[1]
+
+    offsets = np.arange(size)[:, None] * n_levels
+    counts = np.bincount((control_codes + offsets).ravel(),
+                         minlength=size * n_levels).reshape(size, n_levels)
+    at_or_below = np.cumsum(counts, axis=1)
+
+    n_below = np.take_along_axis(at_or_below - counts, test_codes, axis=1).sum(axis=1)
+    n_above = control_n * test_n - np.take_along_axis(at_or_below, test_codes, axis=1).sum(axis=1)
+
+    # Twice the U statistic of `mannwhitneyu(test, control)`, in which ties
+    # count one half, fed to the formula of `cliffs_delta`, so that both give
+    # the same values to the last bit.
+    U_twice = control_n * test_n + n_below - n_above
+    return (U_twice / (control_n * test_n)) - 1
+
+
+def _cliffs_delta_batch(control, test):
+    """
+    Row-wise version of `cliffs_delta` for 2-D arrays of resamples.
+    """
+    control_n = control.shape[1]
+    levels, codes = np.unique(np.concatenate([control, test], axis=1),
+                              return_inverse=True)
+    codes = codes.reshape(control.shape[0], -1)
+
+    return _cliffs_delta_from_codes(codes[:, :control_n], codes[:, control_n:],
+                                    len(levels))
+
+
+def _cliffs_delta_from_ranks(test_ranks:np.ndarray, # 2-D array of the ranks of the test values within the pooled data.
+                             control_n:int # The size of the control group.
+                            )->np.ndarray:
+    """
+    Row-wise Cliff's delta of permutations of a fixed pooled sample, from
+    the (mid)ranks of the values assigned to the test group. As in
+    `mannwhitneyu`, U is the rank sum of the test group minus its minimum.
+    """
+    test_n = test_ranks.shape[1]
+    U = test_ranks.sum(axis=1) - test_n * (test_n + 1) / 2.0
+
+    return ((2 * U) / (control_n * test_n)) - 1
+
+
+def _binary_cells(control:np.ndarray, # Binary control values.
+                  test:np.ndarray # Binary test values, paired with the control values.
+                 )->np.ndarray:
+    """
+    Counts the (control, test) pairs of binary values of each kind, in the
+    order (0, 0), (0, 1), (1, 0), (1, 1).
+    """
+    codes = 2 * np.asarray(control, dtype=np.intp) + np.asarray(test, dtype=np.intp)
+    return np.bincount(codes, minlength=4)
+
+
+def _binary_difference_from_counts(control_ones, # Counts of ones in the control group.
+                                   control_n, # Size of the control group.
+                                   test_ones, # Counts of ones in the test group.
+                                   test_n, # Size of the test group.
+                                   effect_size:str # Either 'mean_diff' or 'cohens_h'.
+                                  ):
+    """
+    Element-wise 'mean_diff' or 'cohens_h' of binary groups, from their
+    counts of ones.
+    """
+    prop_control = control_ones / control_n
+    prop_test = test_ones / test_n
+
+    if effect_size == "mean_diff":
+        return prop_test - prop_control
+    if effect_size == "cohens_h":
+        return 2 * np.arcsin(np.sqrt(prop_test)) - 2 * np.arcsin(np.sqrt(prop_control))
+
+    raise ValueError("The effect size '{}' is not supported.".format(effect_size))
+
+
+def _binary_difference_from_cells(cells:np.ndarray, # Counts of each kind of pair along the last axis, ordered as by `_binary_cells`.
+                                  effect_size:str # Either 'mean_diff' or 'cohens_h'.
+                                 ):
+    """
+    Element-wise paired 'mean_diff' or 'cohens_h' of binary groups, from
+    the counts of their (control, test) pairs of each kind.
+    """
+    n = cells.sum(axis=-1)
+    if effect_size == "mean_diff":
+        # The mean of the paired differences.
+        return (cells[..., 1] - cells[..., 2]) / n
+
+    return _binary_difference_from_counts(cells[..., 2] + cells[..., 3], n,
+                                          cells[..., 1] + cells[..., 3], n, effect_size)
+
+
+def _weighted_moments(values:np.ndarray, # 1-D array of the distinct values of a group.
+                      counts:np.ndarray # 2-D array; each row holds the number of times each value occurs in one resample.
+                     )->tuple:
+    """
+    Row-wise size, mean and sample variance (N-1 degrees of freedom) of a
+    group in which each value occurs as many times as given by `counts`.
+
+    The values are centred on their mean first, so that the sums of
+    squares do not suffer from catastrophic cancellation.
+    """
+    counts = np.asarray(counts, dtype=float)
+    n = counts.sum(axis=1)
+    centre = np.mean(values)
+    deviations = values - centre
+    sums = counts @ deviations
+    sums_sq = counts @ deviations**2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = centre + sums / n
+        var = np.maximum(sums_sq - sums**2 / n, 0) / (n - 1)
+
+    return n, mean, var
+
+
+def _weighted_median(values:np.ndarray, # 1-D array of the distinct values of a group.
+                     counts:np.ndarray # 2-D array; each row holds the number of times each value occurs in one resample.
+                    )->np.ndarray:
+    """
+    Row-wise median of a group in which each value occurs as many times as
+    given by `counts`, read off the cumulative counts of its sorted values.
+    """
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    cumulative = np.cumsum(counts[:, order], axis=1)
+    n = cumulative[:, -1:]
+
+    # The first sorted values whose cumulative count exceeds the positions
+    # of the middle element(s).
+    low = ((n - 1) // 2 < cumulative).argmax(axis=1)
+    high = (n // 2 < cumulative).argmax(axis=1)
+
+    return (sorted_values[low] + sorted_values[high]) / 2
+
+
+def _weighted_histogram(codes:np.ndarray, # The level of each value.
+                        counts:np.ndarray, # 2-D array; each row holds the number of times each value occurs in one resample.
+                        n_levels:int # The number of levels.
+                       )->np.ndarray:
+    """
+    Row-wise number of values at each level, for values whose levels are
+    given by `codes` and which occur as many times as given by `counts`.
+    """
+    out = np.zeros((counts.shape[0], n_levels))
+    np.add.at(out, (slice(None), codes), counts)
+    return out
+
+
+def _weighted_cliffs_delta(control_values:np.ndarray, # 1-D array of the distinct control values.
+                           control_counts:np.ndarray, # 2-D array of the number of times each control value occurs, one row per resample.
+                           test_values:np.ndarray, # 1-D array of the distinct test values.
+                           test_counts:np.ndarray # 2-D array of the number of times each test value occurs, one row per resample.
+                          )->np.ndarray:
+    """
+    Row-wise Cliff's delta of groups in which each value occurs as many
+    times as given by the counts, from the number of control values below
+    and above each test value.
+    """
+    levels, codes = np.unique(np.concatenate([control_values, test_values]),
+                              return_inverse=True)
+    control_hist = _weighted_histogram(codes[:len(control_values)], control_counts,
+                                       len(levels))
+    test_hist = _weighted_histogram(codes[len(control_values):], test_counts, len(levels))
+
+    control_n = control_hist.sum(axis=1)
+    test_n = test_hist.sum(axis=1)
+    cumulative = np.cumsum(control_hist, axis=1)
+    n_below = cumulative - control_hist
+    n_above = control_n[:, None] - cumulative
+
+    return (test_hist * (n_below - n_above)).sum(axis=1) / (control_n * test_n)
+
+
+def _weighted_difference(control_values:np.ndarray, # 1-D array of the distinct control values.
+                         control_counts:np.ndarray, # 2-D array of the number of times each control value occurs, one row per resample.
+                         test_values:np.ndarray, # 1-D array of the distinct test values.
+                         test_counts:np.ndarray, # 2-D array of the number of times each test value occurs, one row per resample.
+                         effect_size:str="mean_diff" # Any one of the effect sizes accepted by `two_group_difference`.
+                        )->np.ndarray: # The effect size of every row.
+    """
+    Computes the unpaired `two_group_difference` of groups given as their
+    values and the number of times each value occurs, for every row of
+    `control_counts` and `test_counts` at once. The result is that of the
+    groups in which each value is repeated as many times as it occurs.
+
+    This is the kernel used to resample frequency-weighted data.
+    """
+    if effect_size == "median_diff":
+        return (_weighted_median(test_values, test_counts) -
+                _weighted_median(control_values, control_counts))
+
+    if effect_size == "cliffs_delta":
+        return _weighted_cliffs_delta(control_values, control_counts,
+                                      test_values, test_counts)
+
+    if effect_size not in ("mean_diff", "cohens_h", "cohens_d", "hedges_g", "delta_g"):
+        raise ValueError("The effect size '{}' is not supported.".format(effect_size))
+
+    return _difference_from_moments(*_weighted_moments(control_values, control_counts),
+                                    *_weighted_moments(test_values, test_counts),
+                                    effect_size)
+
+
+def _difference_from_moments(control_n:np.ndarray, # Sizes of the control groups.
+                             control_mean:np.ndarray, # Means of the control groups.
+                             control_var:np.ndarray, # Sample variances (N-1 degrees of freedom) of the control groups.
+                             test_n:np.ndarray, # Sizes of the test groups.
+                             test_mean:np.ndarray, # Means of the test groups.
+                             test_var:np.ndarray, # Sample variances (N-1 degrees of freedom) of the test groups.
+                             effect_size:str # One of 'mean_diff', 'cohens_h', 'cohens_d', 'hedges_g' or 'delta_g'.
+                            )->np.ndarray:
+    """
+    Element-wise unpaired effect size of groups given by their sizes, means
+    and variances.
+    """
+    if effect_size == "mean_diff":
+        return test_mean - control_mean
+
+    if effect_size == "cohens_h":
+        return 2 * np.arcsin(np.sqrt(test_mean)) - 2 * np.arcsin(np.sqrt(control_mean))
+
+    pooled_sd = np.sqrt(((control_n - 1) * control_var + (test_n - 1) * test_var) /
+                        (control_n + test_n - 2))
+    if (pooled_sd == 0).any():
+        raise ValueError("The divisor is zero, indicating no variability in the data.")
+
+    d = (test_mean - control_mean) / pooled_sd
+    if effect_size == "cohens_d":
+        return d
+
+    # The group sizes only vary between some of the rows.
+    factors = {sizes: _compute_hedges_correction_factor(*sizes)
+               for sizes in set(zip(control_n, test_n))}
+    return d * np.array([factors[sizes] for sizes in zip(control_n, test_n)])
@@ -5,6 +5,9 @@ __all__ = ['merge_two_dicts', 'unpack_and_add', 'print_greeting', 'get_varname']
 
 # %% ../nbs/API/misc_tools.ipynb 4
 import datetime as dt
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
 from numpy import repeat
 
 # %% ../nbs/API/misc_tools.ipynb 5
@@ -68,3 +71,86 @@ def get_varname(obj):
     if len(matching_vars) > 0:
         return matching_vars[0]
     return ""
+
+
+class _StageProfiler(object):
+    """
+    Records the wall time, the number of calls and the peak of the memory
+    allocated by each stage of a computation, such as the bootstrap of a
+    contrast. Stages are run one at a time, either in `stage(name)` or
+    between `start(name)` and `stop()`.
+
+    The memory is traced with `tracemalloc`, which is started for each stage
+    unless it is already tracing, and which slows allocations down, so the
+    times are those of the traced computation. The peak is that of the
+    bytes allocated since the start of the stage, in all threads. If
+    `tracemalloc` was already tracing on Python 3.8, whose `tracemalloc`
+    cannot reset the peak, it is not recorded.
+    """
+
+    def __init__(self):
+        self.__stages = {}
+        self.__current = None
+
+    def start(self, name):
+        """
+        Starts stage `name`, stopping the current one, if any.
+        """
+        self.stop()
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        # The peak is only that of the stage once it was reset.
+        peak_known = not tracing or hasattr(tracemalloc, "reset_peak")
+        self.__current = (name, tracing, peak_known, tracemalloc.get_traced_memory()[0],
+                          time.perf_counter())
+
+    def stop(self):
+        """
+        Stops the current stage, if any, and records it.
+        """
+        if self.__current is None:
+            return
+        name, tracing, peak_known, start_bytes, start = self.__current
+        self.__current = None
+        wall_time = time.perf_counter() - start
+        peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+        if not tracing:
+            tracemalloc.stop()
+
+        record = self.__stages.setdefault(
+            name, {"calls": 0, "wall_time_s": 0.0, "peak_bytes": 0}
+        )
+        record["calls"] += 1
+        record["wall_time_s"] += wall_time
+        if not peak_known or record["peak_bytes"] is None:
+            record["peak_bytes"] = None
+        else:
+            record["peak_bytes"] = max(record["peak_bytes"], peak_bytes)
+
+    @contextmanager
+    def stage(self, name):
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop()
+
+    def to_dict(self):
+        """
+        Returns a dict of the `calls`, the total `wall_time_s` and the
+        largest `peak_bytes` of each stage, in the order they were first run.
+        """
+        return {name: dict(record) for name, record in self.__stages.items()}
+
+
+def _profile_stage(profiler, name):
+    """
+    Returns the context in which stage `name` is recorded by `profiler`,
+    which does nothing if `profiler` is None.
+    """
+    if profiler is None:
+        return nullcontext()
+    return profiler.stage(name)
@@ -61,6 +61,46 @@ def get_swarm_spans(coll):
         return None
 
 
+def _weighted_quantile(sorted_values, cumulative_weights, q):
+    """
+    Returns the `q` quantile of sorted values that each occur as many times
+    as their weight, interpolated linearly as pandas does for the repeated
+    values.
+    """
+    position = q * (cumulative_weights[-1] - 1)
+    below = np.floor(position)
+    low = sorted_values[np.searchsorted(cumulative_weights, below, side="right")]
+    high = sorted_values[np.searchsorted(cumulative_weights, np.ceil(position), side="right")]
+    return low + (high - low) * (position - below)
+
+
+def _weighted_summaries(values, weights):
+    """
+    Returns the summary statistics plotted by `error_bar` for a group whose
+    values each occur as many times as their weight.
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    if weights.sum() == 0:
+        return pd.Series(np.nan, index=["n", "mean", "sd", "median",
+                                        "lower_quartile", "upper_quartile"])
+    order = np.argsort(values, kind="stable")
+    sorted_values = values[order]
+    cumulative_weights = np.cumsum(weights[order])
+
+    n = cumulative_weights[-1]
+    mean = np.dot(weights, values) / n
+    sd = np.sqrt(np.dot(weights, (values - mean) ** 2) / (n - 1))
+    return pd.Series({
+        "n": n,
+        "mean": mean,
+        "sd": sd,
+        "median": _weighted_quantile(sorted_values, cumulative_weights, 0.5),
+        "lower_quartile": _weighted_quantile(sorted_values, cumulative_weights, 0.25),
+        "upper_quartile": _weighted_quantile(sorted_values, cumulative_weights, 0.75),
+    })
+
+
 def error_bar(
     data: pd.DataFrame,  # This DataFrame should be in 'long' format.
     x: str,  # x column to be plotted.
@@ -75,6 +115,7 @@ def error_bar(
         1,
     ],  # The positions of the error bars for the sankey_error_bar method.
     method: str = "gapped_lines",  # The method to use for drawing the error bars. Options are: 'gapped_lines', 'proportional_error_bar', and 'sankey_error_bar'.
+    weights: str = None,  # The column of frequency weights, if any. The summary statistics are then those of the data with each row repeated as many times as its weight.
     **kwargs: dict,
 ):
     """
@@ -115,15 +156,27 @@ def error_bar(
     else:
         group_order = pd.unique(data[x])
 
-    means = data.groupby(x)[y].mean().reindex(index=group_order)
-
-    if method in ["proportional_error_bar", "sankey_error_bar"]:
-        g = lambda x: np.sqrt(
-            (np.sum(x) * (len(x) - np.sum(x))) / (len(x) * len(x) * len(x))
+    if weights is not None:
+        summaries = (
+            data.groupby(x)
+            .apply(lambda g: _weighted_summaries(g[y], g[weights]))
+            .reindex(index=group_order)
         )
-        sd = data.groupby(x)[y].apply(g)
+        means = summaries["mean"]
+        if method in ["proportional_error_bar", "sankey_error_bar"]:
+            sd = np.sqrt(means * (1 - means) / summaries["n"])
+        else:
+            sd = summaries["sd"]
     else:
-        sd = data.groupby(x)[y].std().reindex(index=group_order)
+        means = data.groupby(x)[y].mean().reindex(index=group_order)
+
+        if method in ["proportional_error_bar", "sankey_error_bar"]:
+            g = lambda x: np.sqrt(
+                (np.sum(x) * (len(x) - np.sum(x))) / (len(x) * len(x) * len(x))
+            )
+            sd = data.groupby(x)[y].apply(g)
+        else:
+            sd = data.groupby(x)[y].std().reindex(index=group_order)
 
     lower_sd = means - sd
     upper_sd = means + sd
@@ -131,12 +184,17 @@ def error_bar(
     if (lower_sd < ax_ylims[0]).any() or (upper_sd > ax_ylims[1]).any():
         kwargs["clip_on"] = True
 
-    medians = data.groupby(x)[y].median().reindex(index=group_order)
-    quantiles = (
-        data.groupby(x)[y].quantile([0.25, 0.75]).unstack().reindex(index=group_order)
-    )
-    lower_quartiles = quantiles[0.25]
-    upper_quartiles = quantiles[0.75]
+    if weights is not None:
+        medians = summaries["median"]
+        lower_quartiles = summaries["lower_quartile"]
+        upper_quartiles = summaries["upper_quartile"]
+    else:
+        medians = data.groupby(x)[y].median().reindex(index=group_order)
+        quantiles = (
+            data.groupby(x)[y].quantile([0.25, 0.75]).unstack().reindex(index=group_order)
+        )
+        lower_quartiles = quantiles[0.25]
+        upper_quartiles = quantiles[0.75]
 
     if type == "mean_sd":
         central_measures = means
@@ -678,6 +736,11 @@ def sankeydiag(
 
     xpos = 0
 
+    # Split the data by group once, rather than filtering it for every diagram.
+    group_data = {
+        group: values for group, values in data.groupby(xvar, observed=True)[yvar]
+    }
+
     # For baseline comparison, broadcast left_idx to the same length as right_idx
     # so that the left of sankey diagram will be the same
     # For sequential comparison, left_idx and right_idx can have anything different
@@ -720,8 +783,8 @@ def sankeydiag(
             )  # Remove last error_bar in flow
             bar_width = 0.4 if sankey == False and flow == False else bar_width
             single_sankey(
-                data[data[xvar] == left][yvar],
-                data[data[xvar] == right][yvar],
+                group_data[left],
+                group_data[right],
                 xpos=xpos,
                 ax=ax,
                 colorDict=plot_palette,
@@ -744,8 +807,8 @@ def sankeydiag(
             if not sankey:
                 bar_width = 0.5
             single_sankey(
-                data[data[xvar] == left][yvar],
-                data[data[xvar] == right][yvar],
+                group_data[left],
+                group_data[right],
                 xpos=xpos,
                 ax=ax,
                 colorDict=plot_palette,
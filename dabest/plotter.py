@@ -70,6 +70,11 @@ def effectsize_df_plotter(effectsize_df, **plot_kwargs):
         _compute_hedges_correction_factor,
     )
 
+    # The stages of the plot are recorded if the effect sizes are profiled.
+    profiler = effectsize_df._plot_profiler
+    if profiler is not None:
+        profiler.start("setup")
+
     warnings.filterwarnings(
         "ignore", "This figure includes Axes that are not compatible with tight_layout"
     )
@@ -449,6 +454,9 @@ def effectsize_df_plotter(effectsize_df, **plot_kwargs):
         True if proportional and not one_sankey and sankey and not flow else False
     )
 
+    if profiler is not None:
+        profiler.start("swarm")
+
     if show_pairs:
         # Determine temp_idx based on is_paired and proportional conditions
         if is_paired == "baseline":
@@ -759,6 +767,7 @@ def effectsize_df_plotter(effectsize_df, **plot_kwargs):
                 type=group_summaries,
                 ax=rawdata_axes,
                 method="gapped_lines",
+                weights=dabest_obj.weights,
                 **group_summary_kwargs
             )
 
@@ -776,11 +785,16 @@ def effectsize_df_plotter(effectsize_df, **plot_kwargs):
                 type=group_summaries,
                 ax=rawdata_axes,
                 method="proportional_error_bar",
+                weights=dabest_obj.weights,
                 **group_summary_kwargs
             )
 
     # Add the counts to the rawdata axes xticks.
-    counts = plot_data.groupby(xvar).count()[yvar]
+    if dabest_obj.weights is not None:
+        # The number of observations the weighted rows stand for.
+        counts = plot_data.groupby(xvar)[dabest_obj.weights].sum().astype(int)
+    else:
+        counts = plot_data.groupby(xvar).count()[yvar]
     ticks_with_counts = []
     ticks_loc = rawdata_axes.get_xticks()
     rawdata_axes.xaxis.set_major_locator(matplotlib.ticker.FixedLocator(ticks_loc))
@@ -811,6 +825,9 @@ def effectsize_df_plotter(effectsize_df, **plot_kwargs):
     if one_sankey:
         rawdata_axes.set_xticks([0, 1])
 
+    if profiler is not None:
+        profiler.start("violins")
+
     # Plot effect sizes and bootstraps.
     # Take note of where the `control` groups are.
     if is_paired == "baseline" and show_pairs:
@@ -1122,8 +1139,8 @@ def effectsize_df_plotter(effectsize_df, **plot_kwargs):
                 which_std = 1
             else:
                 which_std = 0
-            temp_control = plot_data[plot_data[xvar] == current_control][yvar]
-            temp_test = plot_data[plot_data[xvar] == current_group][yvar]
+            temp_control = dabest_obj._get_group_data(current_control)
+            temp_test = dabest_obj._get_group_data(current_group)
 
             stds = _compute_standardizers(temp_control, temp_test)
             if is_paired:
@@ -1468,6 +1485,9 @@ def effectsize_df_plotter(effectsize_df, **plot_kwargs):
 
     # if gridkey_rows is None, skip everything here
     if gridkey_rows is not None:
+        if profiler is not None:
+            profiler.start("gridkey")
+
         # Raise error if there are more than 2 items in any idx and gridkey_merge_pairs is True and is_paired is not None
         if gridkey_merge_pairs and is_paired is not None:
             for i in idx:
@@ -1605,6 +1625,9 @@ def effectsize_df_plotter(effectsize_df, **plot_kwargs):
     for parameter in _changed_rcParams:
         plt.rcParams[parameter] = original_rcParams[parameter]
 
+    if profiler is not None:
+        profiler.stop()
+
     # Return the figure.
     return fig
 
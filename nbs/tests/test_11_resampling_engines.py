@@ -0,0 +1,837 @@
+import pytest
+import numpy as np
+import pandas as pd
+from dabest._stats_tools import confint_2group_diff as ci2g
+from dabest._stats_tools import effsize
+from dabest import PermutationTest
+from dabest._api import load
+from data.mocked_data_test_01 import wellbeing, paired_wellbeing, smoke
+
+
+unpaired_effect_sizes = ["mean_diff", "median_diff", "cohens_d", "hedges_g",
+                         "delta_g", "cliffs_delta"]
+paired_effect_sizes = ["mean_diff", "median_diff", "cohens_d", "hedges_g", "delta_g"]
+
+
+@pytest.mark.parametrize("effect_size", unpaired_effect_sizes)
+def test_vectorized_bootstrap_matches_loop_unpaired(effect_size):
+    c = np.array(wellbeing.control)
+    t = np.array(wellbeing.expt)
+
+    loop = ci2g.compute_bootstrapped_diff(c, t, None, effect_size,
+                                          resamples=1000, engine="loop")
+    vectorized = ci2g.compute_bootstrapped_diff(c, t, None, effect_size,
+                                                resamples=1000, block_size=300)
+
+    assert np.array_equal(vectorized, loop)
+
+
+@pytest.mark.parametrize("effect_size", paired_effect_sizes)
+def test_vectorized_bootstrap_matches_loop_paired(effect_size):
+    pre = np.array(paired_wellbeing.pre)
+    post = np.array(paired_wellbeing.post)
+
+    loop = ci2g.compute_bootstrapped_diff(pre, post, "baseline", effect_size,
+                                          resamples=1000, engine="loop")
+    vectorized = ci2g.compute_bootstrapped_diff(pre, post, "baseline", effect_size,
+                                                resamples=1000, block_size=300)
+
+    assert np.array_equal(vectorized, loop)
+
+
+def test_vectorized_bootstrap_proportional():
+    low = np.array(smoke.low)
+    high = np.array(smoke.high)
+
+    for effect_size in ["mean_diff", "cohens_h"]:
+        loop = ci2g.compute_bootstrapped_diff(low, high, None, effect_size,
+                                              resamples=1000, engine="loop")
+        vectorized = ci2g.compute_bootstrapped_diff(low, high, None, effect_size,
+                                                    resamples=1000)
+        assert vectorized == pytest.approx(loop)
+
+
+def test_bootstrap_block_size_does_not_change_result():
+    c = np.array(wellbeing.control)
+    t = np.array(wellbeing.expt)
+
+    results = [ci2g.compute_bootstrapped_diff(c, t, None, "mean_diff",
+                                              resamples=500, block_size=b)
+               for b in [1, 7, 500, None]]
+
+    for r in results[1:]:
+        assert np.array_equal(r, results[0])
+
+
+def test_two_group_difference_batch_rows():
+    rng = np.random.default_rng(12345)
+    control = rng.normal(size=(5, 20))
+    test = rng.normal(loc=0.5, size=(5, 20))
+
+    for effect_size in paired_effect_sizes:
+        batch = effsize.two_group_difference_batch(control, test, "baseline", effect_size)
+        single = [effsize.two_group_difference(c, t, "baseline", effect_size)
+                  for c, t in zip(control, test)]
+        assert batch == pytest.approx(single)
+
+
+
+def test_cliffs_delta_batch_with_ties():
+    rng = np.random.default_rng(12345)
+    control = rng.integers(0, 5, size=(20, 12)).astype(float)
+    test = rng.integers(1, 6, size=(20, 9)).astype(float)
+
+    batch = effsize.two_group_difference_batch(control, test, None, "cliffs_delta")
+    single = [effsize.cliffs_delta(c, t) for c, t in zip(control, test)]
+    assert np.array_equal(batch, single)
+
+
+def test_cliffs_delta_intervals_match_loop():
+    # Binary data, where many bootstraps equal the observed effect size, so
+    # that the bias correction depends on their last bit.
+    rng = np.random.default_rng(12345)
+    df = pd.DataFrame({"control": (rng.random(30) < 0.4).astype(float),
+                       "test": (rng.random(30) < 0.55).astype(float)})
+
+    results = [load(df, idx=("control", "test"), resamples=2000, engine=engine)
+               .cliffs_delta.results for engine in ["vectorized", "loop"]]
+    for column in ["difference", "bca_low", "bca_high", "bca_interval_idx",
+                   "pct_low", "pct_high", "pct_interval_idx"]:
+        assert results[0][column][0] == results[1][column][0]
+    assert np.array_equal(results[0]["bootstraps"][0], results[1]["bootstraps"][0])
+
+
+def test_median_batch():
+    rng = np.random.default_rng(12345)
+    for n in [1, 2, 7, 10]:
+        x = rng.lognormal(size=(6, n))
+        assert np.array_equal(effsize._median_batch(x), np.median(x, axis=1))
+        assert np.array_equal(effsize._median_batch(x.copy(), overwrite_input=True),
+                              np.median(x, axis=1))
+
+def test_bootstrap_engine_errors():
+    c = np.array(wellbeing.control)
+    t = np.array(wellbeing.expt)
+
+    error_msg = "`engine` must be one of"
+    with pytest.raises(ValueError) as excinfo:
+        ci2g.compute_bootstrapped_diff(c, t, None, "mean_diff", engine="fast")
+    assert error_msg in str(excinfo.value)
+
+    error_msg = "`block_size` must be a positive integer."
+    with pytest.raises(ValueError) as excinfo:
+        ci2g.compute_bootstrapped_diff(c, t, None, "mean_diff", block_size=0)
+    assert error_msg in str(excinfo.value)
+
+    error_msg = "The two arrays do not have the same length."
+    with pytest.raises(ValueError) as excinfo:
+        ci2g.compute_bootstrapped_diff(c, t[:-1], "baseline", "mean_diff")
+    assert error_msg in str(excinfo.value)
+
+
+def _jackknife_by_loop(x0, x1, is_paired, effect_size):
+    jackknives = ci2g._create_two_group_jackknife_indexes(x0, x1, is_paired)
+    return [effsize.two_group_difference(x0[j[0]], x1[j[1]], is_paired, effect_size)
+            for j in jackknives]
+
+
+@pytest.mark.parametrize("effect_size", ["mean_diff", "median_diff", "cohens_d",
+                                         "hedges_g", "delta_g"])
+def test_closed_form_jackknife(effect_size):
+    c = np.array(wellbeing.control, dtype=float)
+    t = np.array(wellbeing.expt, dtype=float)
+    pre = np.array(paired_wellbeing.pre, dtype=float)
+    post = np.array(paired_wellbeing.post, dtype=float)
+
+    for x0, x1, is_paired in [(c, t, None), (c, t[:7], None), (c[:6], t, None),
+                              (pre, post, "baseline")]:
+        closed_form = ci2g.compute_meandiff_jackknife(x0, x1, is_paired, effect_size)
+        loop = _jackknife_by_loop(x0, x1, is_paired, effect_size)
+
+        assert closed_form == pytest.approx(loop)
+        assert ci2g._calc_accel(closed_form) == pytest.approx(ci2g._calc_accel(loop))
+
+
+
+def test_cliffs_delta_jackknife():
+    c = np.array(wellbeing.control, dtype=float)
+    t = np.array(wellbeing.expt, dtype=float)
+
+    for x0, x1 in [(c, t), (c, t[:7]), (c[:6], t)]:
+        fast = ci2g.compute_meandiff_jackknife(x0, x1, None, "cliffs_delta")
+        loop = _jackknife_by_loop(x0, x1, None, "cliffs_delta")
+        assert fast == pytest.approx(loop)
+
+@pytest.mark.parametrize("effect_size", unpaired_effect_sizes)
+def test_vectorized_permutation_matches_loop_unpaired(effect_size):
+    c = wellbeing.control
+    t = wellbeing.expt
+
+    loop = PermutationTest(c, t, effect_size, permutation_count=1000, engine="loop")
+    vectorized = PermutationTest(c, t, effect_size, permutation_count=1000,
+                                 block_size=300)
+
+    assert np.array_equal(vectorized.permutations, loop.permutations)
+    assert vectorized.permutations_var == pytest.approx(loop.permutations_var)
+    assert vectorized.pvalue == loop.pvalue
+
+
+@pytest.mark.parametrize("effect_size", paired_effect_sizes)
+def test_vectorized_permutation_matches_loop_paired(effect_size):
+    # Integer data, where many permutations tie with the observed effect
+    # size, so that they must be computed to the same last bit.
+    pre = paired_wellbeing.pre
+    post = paired_wellbeing.post
+
+    loop = PermutationTest(pre, post, effect_size, "baseline",
+                           permutation_count=1000, engine="loop")
+    vectorized = PermutationTest(pre, post, effect_size, "baseline",
+                                 permutation_count=1000, block_size=300)
+
+    assert np.array_equal(vectorized.permutations, loop.permutations)
+    assert vectorized.permutations_var == pytest.approx(loop.permutations_var)
+    assert vectorized.pvalue == loop.pvalue
+
+
+def test_permutation_pvalues_with_ties():
+    # Binary data, where over a tenth of the permutations tie with the
+    # observed effect size. As in earlier versions, ties are not extreme.
+    c = np.array([0, 1, 0, 0, 1, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0], dtype=float)
+    t = np.array([1, 1, 0, 1, 1, 0, 1, 0, 1, 1, 0, 1, 1, 0, 0], dtype=float)
+
+    for paired, pvalue in [(None, 0.07558487657667028), ("baseline", 0.00019995356137726195)]:
+        for engine in ["vectorized", "loop"]:
+            perm_test = PermutationTest(c, t, "mean_diff", paired, engine=engine)
+            assert perm_test.pvalue == pvalue
+
+
+def test_permutation_engine_errors():
+    error_msg = "`engine` must be one of"
+    with pytest.raises(ValueError) as excinfo:
+        PermutationTest(wellbeing.control, wellbeing.expt, "mean_diff", engine="fast")
+    assert error_msg in str(excinfo.value)
+
+
+def test_exact_permutation_unpaired():
+    from itertools import combinations
+
+    c = np.array(wellbeing.control[:6], dtype=float)
+    t = np.array(wellbeing.expt[:5], dtype=float)
+    bag = np.concatenate([c, t])
+
+    observed = abs(t.mean() - c.mean())
+    extreme = 0
+    for control_idx in combinations(range(len(bag)), len(c)):
+        in_control = np.isin(np.arange(len(bag)), control_idx)
+        diff = abs(bag[~in_control].mean() - bag[in_control].mean())
+        extreme += diff > observed or np.isclose(diff, observed)
+
+    perm_test = PermutationTest(c, t, "mean_diff", exact=True, block_size=100)
+
+    assert perm_test.exact
+    assert perm_test.permutation_count == 462
+    assert len(perm_test.permutations) == 462
+    assert perm_test.pvalue == pytest.approx(extreme / 462)
+
+
+def test_exact_permutation_paired():
+    from itertools import product
+
+    pre = np.array(paired_wellbeing.pre, dtype=float)
+    post = np.array(paired_wellbeing.post, dtype=float)
+    diff = post - pre
+
+    observed = abs(diff.mean())
+    extreme = 0
+    for signs in product([1, -1], repeat=len(diff)):
+        flipped = abs(np.mean(np.array(signs) * diff))
+        extreme += flipped > observed or np.isclose(flipped, observed)
+
+    for effect_size in ["mean_diff", "cohens_d"]:
+        perm_test = PermutationTest(pre, post, effect_size, "baseline",
+                                    exact=True, block_size=100)
+        assert perm_test.exact
+        assert perm_test.permutation_count == 2 ** len(diff)
+        assert perm_test.pvalue == pytest.approx(extreme / 2 ** len(diff))
+
+
+def test_exact_permutation_does_not_depend_on_scale():
+    c = np.array(wellbeing.control[:6], dtype=float)
+    t = np.array(wellbeing.expt[:5], dtype=float)
+
+    pvalues = [PermutationTest(c * scale, t * scale, "mean_diff", exact=True).pvalue
+               for scale in [1, 1e-6, 1e-9, 1e6]]
+    assert pvalues == pytest.approx([pvalues[0]] * 4)
+    assert pvalues[0] < 1
+
+
+def test_exact_permutation_auto():
+    small = PermutationTest(wellbeing.control[:5], wellbeing.expt[:5], "mean_diff",
+                            permutation_count=5000, exact="auto")
+    large = PermutationTest(wellbeing.control, wellbeing.expt, "mean_diff",
+                            permutation_count=5000, exact="auto")
+
+    assert small.exact and small.permutation_count == 252
+    assert not large.exact and large.permutation_count == 5000
+
+    error_msg = "`exact` must be one of"
+    with pytest.raises(ValueError) as excinfo:
+        PermutationTest(wellbeing.control, wellbeing.expt, "mean_diff", exact="yes")
+    assert error_msg in str(excinfo.value)
+
+    error_msg = "missing values"
+    with pytest.raises(ValueError) as excinfo:
+        PermutationTest([1., 2., np.nan], [3., 4., 5.], "mean_diff", exact=True)
+    assert error_msg in str(excinfo.value)
+
+
+def test_load_exact_permutation():
+    from dabest._api import load
+
+    paired = dict(idx=("pre", "post"), paired="baseline", id_col="ID")
+    exact = load(paired_wellbeing, exact=True, **paired)
+    assert exact.exact is True
+    results = exact.mean_diff.results
+    expected = PermutationTest(paired_wellbeing.pre, paired_wellbeing.post,
+                               "mean_diff", "baseline", exact=True)
+    assert results["permutation_count"][0] == 2 ** 10
+    assert results["pvalue_permutation"][0] == pytest.approx(expected.pvalue)
+
+    # 'auto' enumerates the 252 relabellings of two groups of 5.
+    small = wellbeing.head(5)
+    auto = load(small, idx=("control", "expt"), exact="auto").cliffs_delta.results
+    assert auto["permutation_count"][0] == 252
+    default = load(small, idx=("control", "expt")).cliffs_delta.results
+    assert default["permutation_count"][0] == 5000
+
+    with pytest.raises(ValueError) as excinfo:
+        load(wellbeing, idx=("control", "expt"), exact="yes")
+    assert "`exact` must be one of" in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        load(wellbeing, idx=(("control", "expt"),), mini_meta=True, exact="auto")
+    assert "`exact` must be False with `delta2` or `mini_meta`." in str(excinfo.value)
+
+
+def test_exact_permutation_size_limit():
+    error_msg = "Exact permutation tests enumerate at most"
+    pre = np.arange(64.)
+    with pytest.raises(ValueError) as excinfo:
+        PermutationTest(pre[:30], pre[30:], "mean_diff", exact=True)
+    assert error_msg in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        PermutationTest(pre, pre + 1, "mean_diff", "baseline", exact=True)
+    assert error_msg in str(excinfo.value)
+
+    # 'auto' falls back to random permutations however many are asked for.
+    auto = PermutationTest(pre[:30], pre[:30] + 1, "mean_diff", "baseline",
+                           permutation_count=2 ** 31, exact="auto",
+                           engine="loop", deadline=0)
+    assert not auto.exact
+
+
+def test_bootstrap_index_cache():
+    c = np.array(wellbeing.control, dtype=float)
+    t = np.array(wellbeing.expt, dtype=float)
+
+    for is_paired, x1 in [(None, t), ("baseline", t[:len(c)])]:
+        index_cache = {}
+        expected = ci2g.compute_bootstrapped_diff(c, x1, is_paired, "mean_diff",
+                                                  resamples=1000)
+        first = ci2g.compute_bootstrapped_diff(c, x1, is_paired, "mean_diff",
+                                               resamples=1000, index_cache=index_cache)
+        cached = ci2g.compute_bootstrapped_diff(c, x1, is_paired, "mean_diff",
+                                                resamples=1000, block_size=300,
+                                                index_cache=index_cache)
+
+        assert len(index_cache) == 1
+        assert all(idx.dtype == np.uint8 for idx in list(index_cache.values())[0])
+        assert np.array_equal(first, expected)
+        assert np.array_equal(cached, expected)
+
+    index_cache = {}
+    ci2g.compute_bootstrapped_diff(c, t, None, "mean_diff", resamples=100,
+                                   random_seed=None, index_cache=index_cache)
+    assert len(index_cache) == 0
+
+
+def test_permutation_index_cache():
+    index_cache = {}
+    for is_paired in [None, "baseline"]:
+        for effect_size in ["mean_diff", "hedges_g"]:
+            expected = PermutationTest(paired_wellbeing.pre, paired_wellbeing.post,
+                                       effect_size, is_paired, permutation_count=1000)
+            cached = PermutationTest(paired_wellbeing.pre, paired_wellbeing.post,
+                                     effect_size, is_paired, permutation_count=1000,
+                                     index_cache=index_cache)
+            assert np.array_equal(cached.permutations, expected.permutations)
+            assert np.array_equal(cached.permutations_var, expected.permutations_var)
+
+    assert len(index_cache) == 2
+
+
+def test_dabest_shares_resample_indexes():
+    from dabest._api import load
+
+    shared = load(wellbeing, idx=("control", "expt"))
+    shared.mean_diff.results
+    assert len(shared._resample_index_cache) == 2
+
+    fresh = load(wellbeing, idx=("control", "expt"))
+    for column in ["bootstraps", "permutations"]:
+        assert np.array_equal(shared.hedges_g.results[column][0],
+                              fresh.hedges_g.results[column][0])
+    assert shared._resample_index_cache.max_elements == ci2g.MAX_INDEX_CACHE_ELEMENTS
+
+
+def test_bounded_index_cache():
+    c = np.array(wellbeing.control, dtype=float)
+    t = np.array(wellbeing.expt, dtype=float)
+
+    # Each draw holds 1000 resamples of 20 indexes, so only two fit.
+    index_cache = ci2g._BoundedIndexCache(max_elements=50000)
+    for seed in [1, 2, 3]:
+        ci2g.compute_bootstrapped_diff(c, t, None, "mean_diff", resamples=1000,
+                                       random_seed=seed, index_cache=index_cache)
+    assert len(index_cache) == 2 and index_cache.elements == 40000
+
+    # The first draw was dropped, and is drawn again.
+    for seed in [1, 2, 3]:
+        cached = ci2g.compute_bootstrapped_diff(c, t, None, "cohens_d", resamples=1000,
+                                                random_seed=seed, index_cache=index_cache)
+        assert cached == pytest.approx(ci2g.compute_bootstrapped_diff(
+            c, t, None, "cohens_d", resamples=1000, random_seed=seed))
+    assert len(index_cache) == 2 and index_cache.elements == 40000
+
+    # Draws larger than the cache are not kept.
+    index_cache = ci2g._BoundedIndexCache(max_elements=10000)
+    ci2g.compute_bootstrapped_diff(c, t, None, "mean_diff", resamples=1000,
+                                   index_cache=index_cache)
+    assert len(index_cache) == 0 and index_cache.elements == 0
+
+
+@pytest.mark.parametrize("engine", ["vectorized", "loop"])
+def test_adaptive_bootstrap_stops_at_checks(engine):
+    c = np.array(wellbeing.control, dtype=float)
+    t = np.array(wellbeing.expt, dtype=float)
+    checked = []
+
+    def converged(bootstraps):
+        checked.append(len(bootstraps))
+        return len(bootstraps) >= 3000
+
+    full = ci2g.compute_bootstrapped_diff(c, t, None, "mean_diff", resamples=5000,
+                                          engine=engine)
+    adaptive = ci2g.compute_bootstrapped_diff(c, t, None, "mean_diff", resamples=5000,
+                                              engine=engine, converged=converged)
+
+    assert checked == [1000, 2000, 3000]
+    assert np.array_equal(adaptive, full[:3000])
+
+
+def test_interval_precision():
+    rng = np.random.default_rng(12345)
+    bootstraps = rng.normal(size=20000)
+
+    coarse = ci2g.compute_interval_precision(bootstraps[:1000], 0., 0.)
+    fine = ci2g.compute_interval_precision(bootstraps, 0., 0.)
+    assert 0 < fine < coarse
+    # The standard error of the quantiles decreases as 1/sqrt(B).
+    assert fine == pytest.approx(coarse / np.sqrt(20), rel=0.5)
+
+    assert ci2g.compute_interval_precision(np.ones(1000), 1., 0.) == 0.
+
+
+def test_adaptive_bootstrap_results():
+    from dabest._api import load
+
+    fixed = load(wellbeing, idx=("control", "expt"), resamples=20000)
+    adaptive = load(wellbeing, idx=("control", "expt"), resamples=20000,
+                    ci_precision=0.05)
+    results = adaptive.mean_diff.results
+    resamples = results["resamples"][0]
+
+    assert resamples < 20000 and resamples % ci2g.ADAPTIVE_CHECK_INTERVAL == 0
+    assert len(results["bootstraps"][0]) == resamples
+    assert np.array_equal(results["bootstraps"][0],
+                          fixed.mean_diff.results["bootstraps"][0][:resamples])
+
+
+def test_adaptive_bootstrap_errors():
+    from dabest._api import load
+
+    error_msg = "`ci_precision` must be a positive number."
+    for ci_precision in [-0.1, True, "0.05"]:
+        with pytest.raises(ValueError) as excinfo:
+            load(wellbeing, idx=("control", "expt"), ci_precision=ci_precision)
+        assert error_msg in str(excinfo.value)
+
+    # NumPy scalars are numbers too.
+    for ci_precision in [np.float32(0.05), np.int64(1)]:
+        load(wellbeing, idx=("control", "expt"), ci_precision=ci_precision)
+
+    error_msg = "`ci_precision` cannot be used with `delta2` or `mini_meta`."
+    with pytest.raises(ValueError) as excinfo:
+        load(wellbeing, idx=(("control", "expt"),), mini_meta=True, ci_precision=0.01)
+    assert error_msg in str(excinfo.value)
+
+
+@pytest.mark.parametrize("engine", ["vectorized", "loop"])
+@pytest.mark.parametrize("paired", [None, "baseline"])
+def test_permutation_deadline(engine, paired):
+    c = np.array(wellbeing.control, dtype=float)
+    t = np.array(wellbeing.expt, dtype=float)
+
+    full = PermutationTest(c, t, "mean_diff", paired, engine=engine)
+    # A deadline in the past stops the permutations after the first block.
+    truncated = PermutationTest(c, t, "mean_diff", paired, engine=engine, deadline=0.)
+
+    assert truncated.permutation_count == ci2g.ADAPTIVE_CHECK_INTERVAL
+    assert np.array_equal(truncated.permutations,
+                          full.permutations[:ci2g.ADAPTIVE_CHECK_INTERVAL])
+
+
+def test_time_budget_results():
+    from dabest._api import load
+
+    with pytest.warns(UserWarning, match="The time budget of"):
+        tight = load(wellbeing, idx=("control", "expt"),
+                     time_budget_s=1e-9).mean_diff.results
+    assert tight["resamples"][0] == ci2g.ADAPTIVE_CHECK_INTERVAL
+    assert tight["permutation_count"][0] == ci2g.ADAPTIVE_CHECK_INTERVAL
+    assert tight["truncated"][0]
+
+    loose = load(wellbeing, idx=("control", "expt"),
+                 time_budget_s=1000).mean_diff.results
+    assert loose["resamples"][0] == 5000
+    assert loose["permutation_count"][0] == 5000
+    assert not loose["truncated"][0]
+
+    unbounded = load(wellbeing, idx=("control", "expt")).mean_diff.results
+    assert "truncated" not in unbounded.columns
+
+
+def test_time_budget_errors():
+    from dabest._api import load
+
+    error_msg = "`time_budget_s` must be a positive number."
+    for time_budget_s in [0, True, "10"]:
+        with pytest.raises(ValueError) as excinfo:
+            load(wellbeing, idx=("control", "expt"), time_budget_s=time_budget_s)
+        assert error_msg in str(excinfo.value)
+
+    # NumPy scalars are numbers too.
+    for time_budget_s in [np.float32(60), np.int64(60)]:
+        load(wellbeing, idx=("control", "expt"), time_budget_s=time_budget_s)
+
+    error_msg = "`time_budget_s` cannot be used with `delta2` or `mini_meta`."
+    with pytest.raises(ValueError) as excinfo:
+        load(wellbeing, idx=(("control", "expt"),), mini_meta=True, time_budget_s=1)
+    assert error_msg in str(excinfo.value)
+
+
+def test_1group_mean_jackknife():
+    from dabest._stats_tools import confint_1group as ci1g
+
+    rng = np.random.default_rng(12345)
+    x = rng.normal(loc=1e3, size=500)
+    expected = [np.mean(x[j]) for j in ci2g.create_jackknife_indexes(x)]
+
+    assert ci1g.compute_1group_mean_jackknife(x) == pytest.approx(expected, rel=1e-12)
+    assert ci1g.compute_1group_jackknife(x, np.mean) == pytest.approx(expected, rel=1e-12)
+
+    x[3] = np.nan
+    expected = [np.mean(x[j]) for j in ci2g.create_jackknife_indexes(x)]
+    np.testing.assert_array_equal(ci1g.compute_1group_mean_jackknife(x), expected)
+
+
+def test_weighted_delta_aggregation():
+    rng = np.random.default_rng(12345)
+    bootstraps = np.empty(5, dtype=object)
+    bootstraps[:] = [rng.normal(size=100) for _ in range(5)]
+    group_var = rng.uniform(1, 2, size=5)
+
+    weight = 1 / group_var
+    expected = sum(weight[j] * bootstraps[j] for j in range(5)) / np.sum(weight)
+    assert np.array_equal(ci2g.calculate_weighted_delta(group_var, bootstraps), expected)
+
+    permutations_var = rng.uniform(1, 2, size=(5, 100))
+    expected = [np.sum(permutations_var[:, i] ** -1 * [b[i] for b in bootstraps])
+                / np.sum(permutations_var[:, i] ** -1) for i in range(100)]
+    weighted = ci2g.calculate_weighted_delta(permutations_var, bootstraps)
+    assert weighted == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("paired", [None, "baseline"])
+def test_vectorized_delta2_bootstrap_matches_loop(paired):
+    rng = np.random.default_rng(12345)
+    groups = [rng.normal(loc=i, size=20) for i in range(4)]
+
+    loop = ci2g.compute_delta2_bootstrapped_diff(*groups, paired, resamples=1000,
+                                                 engine="loop")
+    index_cache = {}
+    for _ in range(2):
+        vectorized = ci2g.compute_delta2_bootstrapped_diff(
+            *groups, paired, resamples=1000, block_size=300, index_cache=index_cache
+        )
+        assert np.array_equal(vectorized[0], loop[0])
+        assert vectorized[1] == loop[1]
+        assert np.array_equal(vectorized[2], loop[2])
+    assert len(index_cache) == 1
+
+
+def binary_groups(paired):
+    rng = np.random.default_rng(12345)
+    control = (rng.random(300) < 0.4).astype(float)
+    if paired:
+        # Paired outcomes agree most of the time.
+        flip = rng.random(300) < 0.3
+        test = np.where(flip, 1 - control, control)
+    else:
+        test = (rng.random(250) < 0.55).astype(float)
+    return control, test
+
+
+@pytest.mark.parametrize("effect_size", ["mean_diff", "cohens_h"])
+@pytest.mark.parametrize("paired", [None, "baseline"])
+def test_counts_engine_bootstrap(effect_size, paired):
+    c, t = binary_groups(paired)
+
+    values = ci2g.compute_bootstrapped_diff(c, t, paired, effect_size, resamples=20000)
+    counts = ci2g.compute_bootstrapped_diff(c, t, paired, effect_size, resamples=20000,
+                                            engine="counts")
+
+    assert len(counts) == 20000
+    assert np.mean(counts) == pytest.approx(np.mean(values), abs=0.005)
+    assert np.std(counts) == pytest.approx(np.std(values), rel=0.05)
+
+
+@pytest.mark.parametrize("effect_size", ["mean_diff", "cohens_h"])
+@pytest.mark.parametrize("paired", [None, "baseline"])
+def test_counts_engine_jackknife(effect_size, paired):
+    c, t = binary_groups(paired)
+    jackknives = [effsize.two_group_difference(c[j[0]], t[j[1]], paired, effect_size)
+                  for j in ci2g._create_two_group_jackknife_indexes(c, t, paired)]
+
+    values, counts = ci2g._compute_binary_jackknife(c, t, paired, effect_size)
+
+    assert counts.sum() == len(jackknives)
+    assert sorted(np.repeat(values, counts)) == pytest.approx(sorted(jackknives))
+    assert ci2g._calc_accel(values, counts) == pytest.approx(ci2g._calc_accel(jackknives))
+
+
+@pytest.mark.parametrize("effect_size", ["mean_diff", "cohens_h"])
+@pytest.mark.parametrize("paired", [None, "baseline"])
+def test_counts_engine_permutation(effect_size, paired):
+    c, t = binary_groups(paired)
+
+    values = PermutationTest(c, t, effect_size, paired, permutation_count=20000)
+    counts = PermutationTest(c, t, effect_size, paired, permutation_count=20000,
+                             engine="counts")
+
+    assert len(counts.permutations) == 20000
+    assert np.std(counts.permutations) == pytest.approx(np.std(values.permutations),
+                                                        rel=0.05)
+    assert np.mean(counts.permutations_var) == pytest.approx(
+        np.mean(values.permutations_var), rel=0.01)
+    assert counts.pvalue == pytest.approx(values.pvalue, abs=0.02)
+
+
+def test_counts_engine_results():
+    from dabest._api import load
+
+    c, t = binary_groups(None)
+    df = pd.DataFrame({"control": pd.Series(c), "test": pd.Series(t)})
+    values = load(df, idx=("control", "test"), proportional=True)
+    counts = load(df, idx=("control", "test"), proportional=True, engine="counts")
+
+    for effect_size in ["mean_diff", "cohens_h"]:
+        v = getattr(values, effect_size).results
+        r = getattr(counts, effect_size).results
+        assert r["difference"][0] == v["difference"][0]
+        for column in ["bca_low", "bca_high", "pct_low", "pct_high"]:
+            assert r[column][0] == pytest.approx(v[column][0], abs=0.02)
+
+
+def test_counts_engine_errors():
+    from dabest._api import load
+
+    c, t = binary_groups(None)
+    with pytest.raises(ValueError) as excinfo:
+        ci2g.compute_bootstrapped_diff(c, t, None, "hedges_g", engine="counts")
+    assert "only supports 'mean_diff' and 'cohens_h'" in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        PermutationTest(c + 0.5, t, "mean_diff", engine="counts")
+    assert "only accepts binary data" in str(excinfo.value)
+
+    error_msg = "The 'counts' engine can only be used when `proportional` is True."
+    with pytest.raises(ValueError) as excinfo:
+        load(wellbeing, idx=("control", "expt"), engine="counts")
+    assert error_msg in str(excinfo.value)
+
+
+@pytest.mark.parametrize("effect_size", ["mean_diff", "cohens_d", "hedges_g"])
+def test_poisson_bootstrap(effect_size):
+    rng = np.random.default_rng(3)
+    c, t = rng.normal(0, 1, 600), rng.normal(0.3, 2, 500)
+
+    values = ci2g.compute_bootstrapped_diff(c, t, None, effect_size, resamples=5000)
+    poisson = ci2g.compute_bootstrapped_diff(c, t, None, effect_size, resamples=5000,
+                                             engine="poisson")
+    assert len(poisson) == 5000
+    assert np.mean(poisson) == pytest.approx(np.mean(values), abs=0.01)
+    assert np.std(poisson) == pytest.approx(np.std(values), rel=0.05)
+
+    # The groups may be streamed in chunks of any size.
+    chunked = ci2g.compute_poisson_bootstrapped_diff(
+        iter(np.array_split(c, 7)), iter(np.array_split(t, 3)), effect_size,
+        resamples=5000, block_size=41
+    )
+    np.testing.assert_allclose(chunked, poisson, rtol=1e-10)
+
+
+def test_poisson_engine_results_and_errors():
+    from dabest._api import load
+
+    values = load(wellbeing, idx=("control", "expt"))
+    poisson = load(wellbeing, idx=("control", "expt"), engine="poisson")
+    v = values.mean_diff.results
+    r = poisson.mean_diff.results
+    assert r["difference"][0] == v["difference"][0]
+    assert r["pvalue_permutation"][0] == v["pvalue_permutation"][0]
+    width = v["bca_high"][0] - v["bca_low"][0]
+    for column in ["bca_low", "bca_high", "pct_low", "pct_high"]:
+        assert r[column][0] == pytest.approx(v[column][0], abs=0.1 * width)
+
+    with pytest.raises(ValueError) as excinfo:
+        ci2g.compute_poisson_bootstrapped_diff(wellbeing.control, wellbeing.expt,
+                                               "median_diff")
+    assert "The Poisson bootstrap only supports" in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        load(paired_wellbeing, idx=("pre", "post"), paired="baseline", id_col="ID",
+             engine="poisson")
+    assert "The 'poisson' engine cannot be used with paired data." in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        load(wellbeing, idx=("control", "expt"), engine="poisson", ci_precision=0.01)
+    assert "cannot be used with `ci_precision` or `time_budget_s`" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("effect_size", ["median_diff", "cliffs_delta", "mean_diff"])
+def test_blb_intervals(effect_size):
+    from concurrent.futures import ThreadPoolExecutor
+    from dabest._effsize_objects import TwoGroupsEffectSize
+
+    rng = np.random.default_rng(5)
+    c, t = rng.exponential(1, 5000), rng.exponential(1.2, 5000)
+    full = TwoGroupsEffectSize(c, t, effect_size, permutation_count=100)
+    blb = TwoGroupsEffectSize(c, t, effect_size, permutation_count=100, engine="blb")
+
+    width = full.pct_high - full.pct_low
+    for limit in ["bca_low", "bca_high", "pct_low", "pct_high"]:
+        assert getattr(blb, limit) == pytest.approx(getattr(full, limit), abs=0.1 * width)
+    assert blb.resamples == 5000
+
+    # The subsets do not depend on where they are bootstrapped.
+    serial = ci2g.compute_blb_bootstrapped_diff(c, t, effect_size, resamples=1000)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        parallel = ci2g.compute_blb_bootstrapped_diff(c, t, effect_size, resamples=1000,
+                                                      executor=executor)
+    assert np.array_equal(serial, parallel)
+
+
+def test_blb_errors():
+    from dabest._api import load
+
+    with pytest.raises(ValueError) as excinfo:
+        ci2g.compute_bootstrapped_diff(paired_wellbeing.pre, paired_wellbeing.post,
+                                       "baseline", "median_diff", engine="blb")
+    assert "The Bag of Little Bootstraps cannot be used with paired data." in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        load(wellbeing, idx=("control", "expt"), engine="blb", time_budget_s=1)
+    assert "The 'blb' engine cannot be used with `ci_precision` or `time_budget_s`." \
+        in str(excinfo.value)
+
+
+@pytest.mark.parametrize("paired", [None, "baseline"])
+def test_generator_streams(paired):
+    c = np.array(paired_wellbeing.pre)
+    t = np.array(paired_wellbeing.post)
+    kwargs = dict(resamples=2500, rng_mode="generator")
+
+    # The resamples only depend on their position, not on the blocks or engine.
+    results = [ci2g.compute_bootstrapped_diff(c, t, paired, "mean_diff", block_size=b,
+                                              **kwargs) for b in [1, 777, None]]
+    results.append(ci2g.compute_bootstrapped_diff(c, t, paired, "mean_diff", engine="loop",
+                                                  **kwargs))
+    for r in results[1:]:
+        assert r == pytest.approx(results[0])
+
+    # A shard can be drawn on its own, from its child seed.
+    streams = ci2g._ResampleStreams(12345, "generator", (ci2g.BOOTSTRAP_STREAM,))
+    streams.position = 2 * ci2g.ADAPTIVE_CHECK_INTERVAL
+    x0_idx, x1_idx = ci2g._draw_bootstrap_indexes(streams, len(c), len(t), paired, 500)
+    assert effsize.two_group_difference_batch(c[x0_idx], t[x1_idx], paired, "mean_diff") \
+        == pytest.approx(results[0][2000:])
+    if not paired:
+        # Each group is drawn from a generator of its own, a block at a time.
+        x0_rng, x1_rng = [ci2g._make_rng(12345, "generator", ci2g.BOOTSTRAP_STREAM, 2, *group)
+                          for group in [(), (1,)]]
+        assert np.array_equal(x0_idx, x0_rng.integers(0, len(c), (500, len(c))))
+        assert np.array_equal(x1_idx, x1_rng.integers(0, len(t), (500, len(t))))
+
+    legacy = ci2g.compute_bootstrapped_diff(c, t, paired, "mean_diff", resamples=2500)
+    assert not np.array_equal(legacy, results[0])
+    assert np.std(legacy) == pytest.approx(np.std(results[0]), rel=0.1)
+
+    loop = PermutationTest(c, t, "mean_diff", paired, 2500, engine="loop", rng_mode="generator")
+    vectorized = PermutationTest(c, t, "mean_diff", paired, 2500, block_size=300,
+                                 rng_mode="generator")
+    assert vectorized.permutations == pytest.approx(loop.permutations)
+
+
+def test_generator_contrasts():
+    from dabest._api import load
+
+    idx = ("control", "expt")
+    kwargs = dict(idx=idx, resamples=1000)
+    legacy = load(wellbeing, **kwargs).mean_diff.results
+    generator = load(wellbeing, rng_mode="generator", **kwargs)
+    results = generator.mean_diff.results
+
+    assert generator.rng_mode == "generator"
+    assert results["random_seed"][0] == 12345
+    assert results["difference"][0] == legacy["difference"][0]
+    assert not np.array_equal(results["bootstraps"][0], legacy["bootstraps"][0])
+
+    # The contrast is seeded with the first child spawned from the seed.
+    seed = np.random.SeedSequence(12345).spawn(2)[0]
+    bootstraps = ci2g.compute_bootstrapped_diff(wellbeing.control, wellbeing.expt, None,
+                                                "mean_diff", 1000, seed, rng_mode="generator")
+    assert np.array_equal(bootstraps, results["bootstraps"][0])
+
+    with pytest.raises(ValueError) as excinfo:
+        load(wellbeing, rng_mode="numpy", **kwargs)
+    assert "`rng_mode` must be one of ['legacy', 'generator'], not 'numpy'." \
+        in str(excinfo.value)
+
+
+@pytest.mark.parametrize("paired", [None, "baseline", "sequential"])
+def test_load_results_match_loop(paired):
+    results = []
+    for engine in ["vectorized", "loop"]:
+        dabest_obj = load(paired_wellbeing, idx=("pre", "post"),
+                          paired=paired, id_col="ID", resamples=1000,
+                          engine=engine)
+        results.append([getattr(dabest_obj, effect_size).results for effect_size
+                        in ["mean_diff", "median_diff", "cohens_d", "hedges_g"]])
+    for vectorized, loop in zip(*results):
+        for column in ["difference", "bca_low", "bca_high", "pct_low",
+                       "pct_high", "pvalue_permutation"]:
+            assert vectorized[column][0] == loop[column][0]
+        assert np.array_equal(vectorized["bootstraps"][0], loop["bootstraps"][0])
+        assert np.array_equal(vectorized["permutations"][0], loop["permutations"][0])
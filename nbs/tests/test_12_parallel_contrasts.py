@@ -0,0 +1,102 @@
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dabest._api import load
+from data.mocked_data_test_load_errors import dummy_df
+from data.mocked_data_test_06 import df_test
+from data.mocked_data_test_08 import df_mini_meta
+
+
+def assert_same_results(serial, parallel):
+    assert list(serial.columns) == list(parallel.columns)
+    for column in serial.columns:
+        for s, p in zip(serial[column], parallel[column]):
+            # Treats NaNs in the same positions as equal.
+            np.testing.assert_array_equal(s, p)
+
+
+@pytest.mark.parametrize("paired", [None, "baseline", "sequential"])
+def test_parallel_contrasts_match_serial(paired):
+    idx = ("Control 1", "Test 1", "Control 2", "Test 2", "Control 3")
+    kwargs = dict(idx=idx, paired=paired, id_col="ID", resamples=1000)
+
+    serial = load(dummy_df, **kwargs)
+    parallel = load(dummy_df, n_jobs=2, **kwargs)
+
+    assert parallel.n_jobs == 2
+    for effect_size in ["mean_diff", "median_diff", "hedges_g"]:
+        assert_same_results(getattr(serial, effect_size).results,
+                            getattr(parallel, effect_size).results)
+
+
+def test_executor_contrasts_match_serial():
+    idx = (("Control 1", "Test 1"), ("Control 2", "Test 2", "Control 3"))
+
+    serial = load(dummy_df, idx=idx, resamples=1000)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        parallel = load(dummy_df, idx=idx, resamples=1000, executor=executor)
+        parallel_results = parallel.cliffs_delta.results
+
+    assert parallel.executor is executor
+    assert_same_results(serial.cliffs_delta.results, parallel_results)
+
+
+def test_blb_subsets_run_on_the_executor():
+    idx = (("Control 1", "Test 1"), ("Control 2", "Test 2"))
+    kwargs = dict(idx=idx, resamples=1000, engine="blb")
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def map(self, fn, *iterables):
+            self.calls.append(fn.__name__)
+            return super().map(fn, *iterables)
+
+    serial = load(dummy_df, **kwargs).median_diff.results
+    with CountingExecutor(max_workers=3) as executor:
+        executor.calls = []
+        parallel = load(dummy_df, executor=executor, **kwargs).median_diff.results
+
+    # The contrasts run here, and the subsets of each on the executor.
+    assert executor.calls == ["_compute_blb_subset_bootstraps"] * 2
+    assert_same_results(serial, parallel)
+    assert_same_results(serial, load(dummy_df, n_jobs=2, **kwargs).median_diff.results)
+
+
+def test_generator_contrasts_match_serial():
+    idx = (("Control 1", "Test 1"), ("Control 2", "Test 2", "Control 3"))
+    kwargs = dict(idx=idx, resamples=1000, rng_mode="generator")
+
+    serial = load(dummy_df, **kwargs).mean_diff.results
+    parallel = load(dummy_df, n_jobs=2, **kwargs).mean_diff.results
+
+    assert_same_results(serial, parallel)
+    # Each contrast is drawn from its own streams.
+    assert not np.array_equal(serial["bootstraps"][0], serial["bootstraps"][1])
+
+
+def test_parallel_delta_delta_and_mini_meta():
+    kwargs = dict(x=["Time", "Drug"], y="Heart Rate", delta2=True,
+                  experiment="Experiment", resamples=1000)
+    serial = load(df_test, **kwargs).mean_diff.delta_delta
+    parallel = load(df_test, n_jobs=2, **kwargs).mean_diff.delta_delta
+
+    assert parallel.difference == serial.difference
+    assert np.array_equal(parallel.bootstraps_delta_delta, serial.bootstraps_delta_delta)
+    assert parallel.pvalue_permutation == serial.pvalue_permutation
+
+    idx = (("Rep1_Yes", "Rep1_No"), ("Rep2_Yes", "Rep2_No"))
+    serial = load(df_mini_meta, idx=idx, mini_meta=True).mean_diff.mini_meta_delta
+    parallel = load(df_mini_meta, idx=idx, mini_meta=True,
+                    n_jobs=2).mean_diff.mini_meta_delta
+
+    assert parallel.difference == serial.difference
+    assert np.array_equal(parallel.bootstraps_weighted_delta,
+                          serial.bootstraps_weighted_delta)
+    assert parallel.pvalue_permutation == serial.pvalue_permutation
+
+
+def test_n_jobs_errors():
+    error_msg = "`n_jobs` must be a positive integer or -1"
+    for n_jobs in [0, -2, 1.5]:
+        with pytest.raises(ValueError) as excinfo:
+            load(dummy_df, idx=("Control 1", "Test 1"), n_jobs=n_jobs)
+        assert error_msg in str(excinfo.value)
@@ -0,0 +1,34 @@
+import pytest
+import numpy as np
+import pandas as pd
+from dabest._api import load
+from data.mocked_data_test_load_errors import dummy_df
+from data.mocked_data_test_06 import df_test
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(data=dummy_df, idx=(("Control 1", "Test 1"), ("Control 2", "Test 2", "Control 3"))),
+    dict(data=dummy_df, idx=("Control 1", "Test 1"), paired="baseline", id_col="ID"),
+    dict(data=df_test, x=["Time", "Drug"], y="Heart Rate", delta2=True,
+         experiment="Experiment"),
+])
+def test_group_index_matches_filtering(kwargs):
+    dabest_obj = load(**kwargs)
+    dat = dabest_obj._plot_data
+    xvar = dabest_obj._xvar
+    yvar = dabest_obj._yvar
+
+    for group in dabest_obj._all_plot_groups:
+        expected = dat[dat[xvar] == group][yvar]
+        group_data = dabest_obj._get_group_data(group)
+
+        pd.testing.assert_series_equal(group_data, expected)
+
+
+def test_group_index_skips_missing_values():
+    df = pd.DataFrame({"group": ["a", "b", "a", "b", "a"],
+                       "value": [1., 2., np.nan, 4., 5.]})
+    dabest_obj = load(df, x="group", y="value", idx=("a", "b"))
+
+    assert dabest_obj._get_group_data("a").tolist() == [1., 5.]
+    assert dabest_obj._get_group_data("b").tolist() == [2., 4.]
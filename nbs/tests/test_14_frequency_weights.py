@@ -0,0 +1,137 @@
+import pytest
+import numpy as np
+import pandas as pd
+from dabest._api import load
+from dabest._stats_tools import confint_2group_diff as ci2g
+from dabest._stats_tools import effsize
+from dabest._effsize_objects import TwoGroupsEffectSize
+from dabest import PermutationTest
+from dabest.plot_tools import _weighted_summaries
+
+
+def aggregated_groups():
+    rng = np.random.default_rng(7)
+    control = np.round(rng.normal(0, 1, 30), 1)
+    test = np.round(rng.normal(0.5, 1, 25), 1)
+    return control, rng.integers(0, 5, 30), test, rng.integers(1, 5, 25)
+
+
+EFFECT_SIZES = ["mean_diff", "median_diff", "cohens_d", "hedges_g", "cliffs_delta"]
+
+
+@pytest.mark.parametrize("effect_size", EFFECT_SIZES)
+def test_weighted_difference_and_jackknife(effect_size):
+    c, cw, t, tw = aggregated_groups()
+    expanded_c, expanded_t = np.repeat(c, cw), np.repeat(t, tw)
+    jackknives = ci2g.compute_meandiff_jackknife(expanded_c, expanded_t, None, effect_size)
+
+    difference = effsize._weighted_difference(c, cw[None], t, tw[None], effect_size)
+    values, counts = ci2g._compute_weighted_jackknife(c, cw, t, tw, effect_size)
+
+    assert difference[0] == pytest.approx(
+        effsize.two_group_difference(expanded_c, expanded_t, None, effect_size))
+    assert counts.sum() == len(jackknives)
+    assert sorted(np.repeat(values, counts)) == pytest.approx(sorted(jackknives))
+    assert ci2g._calc_accel(values, counts) == pytest.approx(ci2g._calc_accel(jackknives),
+                                                             nan_ok=True)
+
+
+@pytest.mark.parametrize("effect_size", ["mean_diff", "median_diff", "cliffs_delta"])
+def test_weighted_bootstrap_and_permutation(effect_size):
+    c, cw, t, tw = aggregated_groups()
+    expanded_c, expanded_t = np.repeat(c, cw), np.repeat(t, tw)
+
+    expanded = ci2g.compute_bootstrapped_diff(expanded_c, expanded_t, None, effect_size,
+                                              resamples=10000)
+    weighted = ci2g.compute_bootstrapped_diff(c, t, None, effect_size, resamples=10000,
+                                              x0_weights=cw, x1_weights=tw)
+    assert np.std(weighted) == pytest.approx(np.std(expanded), rel=0.05)
+
+    # The resamples do not depend on the size of the blocks, up to rounding.
+    blocked = ci2g.compute_bootstrapped_diff(c, t, None, effect_size, resamples=10000,
+                                             block_size=77, x0_weights=cw, x1_weights=tw)
+    np.testing.assert_allclose(weighted, blocked, rtol=1e-12)
+
+    expanded = PermutationTest(expanded_c, expanded_t, effect_size, permutation_count=10000)
+    weighted = PermutationTest(c, t, effect_size, permutation_count=10000,
+                               control_weights=cw, test_weights=tw)
+    assert len(weighted.permutations) == 10000
+    assert np.std(weighted.permutations) == pytest.approx(np.std(expanded.permutations),
+                                                          rel=0.05)
+    assert np.mean(weighted.permutations_var) == pytest.approx(
+        np.mean(expanded.permutations_var), rel=0.01)
+    assert weighted.pvalue == pytest.approx(expanded.pvalue, abs=0.01)
+
+
+@pytest.mark.parametrize("effect_size", ["mean_diff", "median_diff", "cliffs_delta"])
+def test_weighted_statistical_tests(effect_size):
+    c, cw, t, tw = aggregated_groups()
+    expanded = TwoGroupsEffectSize(np.repeat(c, cw), np.repeat(t, tw), effect_size,
+                                   resamples=1000, permutation_count=1000)
+    weighted = TwoGroupsEffectSize(c, t, effect_size, resamples=1000, permutation_count=1000,
+                                   control_weights=cw, test_weights=tw)
+
+    for test in ["welch", "students_t", "mann_whitney", "kruskal", "brunner_munzel"]:
+        for kind in ["pvalue", "statistic"]:
+            name = "{}_{}".format(kind, test)
+            assert getattr(weighted, name) == pytest.approx(getattr(expanded, name),
+                                                            nan_ok=True)
+
+
+def test_weighted_results_and_summaries():
+    c, cw, t, tw = aggregated_groups()
+    df = pd.DataFrame({"group": ["control"] * len(c) + ["test"] * len(t),
+                       "value": np.concatenate([c, t]),
+                       "count": np.concatenate([cw, tw])})
+    expanded_df = df.loc[df.index.repeat(df["count"])]
+
+    weighted = load(df, x="group", y="value", idx=("control", "test"), weights="count")
+    expanded = load(expanded_df, x="group", y="value", idx=("control", "test"))
+
+    assert weighted.weights == "count"
+    w = weighted.mean_diff.results
+    e = expanded.mean_diff.results
+    for column in ["control_N", "test_N", "difference", "pvalue_welch"]:
+        assert w[column][0] == pytest.approx(e[column][0])
+    for column in ["bca_low", "bca_high", "pct_low", "pct_high"]:
+        assert w[column][0] == pytest.approx(e[column][0], abs=0.05)
+
+    summaries = _weighted_summaries(c, cw)
+    expanded_c = pd.Series(np.repeat(c, cw))
+    assert summaries["mean"] == pytest.approx(expanded_c.mean())
+    assert summaries["sd"] == pytest.approx(expanded_c.std())
+    assert summaries["median"] == pytest.approx(expanded_c.median())
+    assert summaries["lower_quartile"] == pytest.approx(expanded_c.quantile(0.25))
+    assert summaries["upper_quartile"] == pytest.approx(expanded_c.quantile(0.75))
+
+
+def test_weights_errors():
+    c, cw, t, tw = aggregated_groups()
+    df = pd.DataFrame({"group": ["control"] * len(c) + ["test"] * len(t),
+                       "value": np.concatenate([c, t]),
+                       "count": np.concatenate([cw, tw]).astype(float),
+                       "ID": np.arange(len(c) + len(t)) % len(t)})
+    kwargs = dict(x="group", y="value", idx=("control", "test"))
+
+    with pytest.raises(IndexError) as excinfo:
+        load(df, weights="missing", **kwargs)
+    assert "missing is not a column in `data`" in str(excinfo.value)
+
+    df_bad = df.assign(count=df["count"] + 0.5)
+    with pytest.raises(ValueError) as excinfo:
+        load(df_bad, weights="count", **kwargs)
+    assert "must be non-negative whole numbers" in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        load(df, weights="count", paired="baseline", id_col="ID", **kwargs)
+    assert "`weights` cannot be used with `paired`" in str(excinfo.value)
+
+    wide = pd.DataFrame({"control": c[:25], "test": t})
+    with pytest.raises(ValueError) as excinfo:
+        load(wide, idx=("control", "test"), weights="count")
+    assert "`weights` can only be used with long data" in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        ci2g.compute_bootstrapped_diff(c, t, None, "mean_diff", x0_weights=-cw,
+                                       x1_weights=tw)
+    assert "Frequency weights must be non-negative whole numbers." in str(excinfo.value)
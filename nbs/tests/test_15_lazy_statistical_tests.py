@@ -0,0 +1,100 @@
+import pytest
+import numpy as np
+from dabest._api import load
+from dabest._effsize_objects import TwoGroupsEffectSize, STATISTICAL_TESTS
+from data.mocked_data_test_01 import wellbeing, paired_wellbeing
+from data.mocked_data_test_06 import df_test
+
+
+def test_statistical_tests_are_lazy():
+    lazy = TwoGroupsEffectSize(wellbeing.control, wellbeing.expt, "mean_diff",
+                               resamples=1000, permutation_count=1000)
+    eager = TwoGroupsEffectSize(wellbeing.control, wellbeing.expt, "mean_diff",
+                                resamples=1000, permutation_count=1000,
+                                tests=STATISTICAL_TESTS)
+
+    assert lazy._TwoGroupsEffectSize__test_results == {}
+    assert not hasattr(lazy, "_TwoGroupsEffectSize__PermutationTest_result")
+
+    for test in STATISTICAL_TESTS:
+        for kind in ["pvalue", "statistic"]:
+            name = "{}_{}".format(kind, test)
+            if test == "permutation" and kind == "statistic":
+                continue
+            assert getattr(lazy, name) == pytest.approx(getattr(eager, name), nan_ok=True)
+    assert np.array_equal(lazy.permutations, eager.permutations)
+
+    # Each test is performed once.
+    results = lazy._TwoGroupsEffectSize__test_results
+    assert lazy.pvalue_welch is results["welch"][1]
+    assert lazy._permutation_test() is lazy._permutation_test()
+
+
+def test_results_only_report_selected_tests():
+    kwargs = dict(idx=("pre", "post"), paired="baseline", id_col="ID", resamples=1000)
+    full = load(paired_wellbeing, **kwargs).mean_diff.results
+    selected = load(paired_wellbeing, tests=["wilcoxon"], **kwargs).mean_diff.results
+
+    assert "pvalue_wilcoxon" in selected.columns
+    for column in ["pvalue_permutation", "permutations", "pvalue_paired_students_t"]:
+        assert column in full.columns
+        assert column not in selected.columns
+    for column in ["bca_low", "bca_high", "pvalue_wilcoxon"]:
+        assert selected[column][0] == full[column][0]
+
+    # The delta-delta p-value needs the permutations of the contrasts.
+    delta2 = load(df_test, x=["Time", "Drug"], y="Heart Rate", delta2=True,
+                  experiment="Experiment", resamples=1000, tests=[]).mean_diff
+    assert "permutations" in delta2.results.columns
+    assert np.isfinite(delta2.delta_delta.pvalue_permutation)
+
+    with pytest.raises(ValueError) as excinfo:
+        load(wellbeing, idx=("control", "expt"), tests=["welch", "t"])
+    assert "`tests` must be None, False or a list of tests among" in str(excinfo.value)
+
+
+def test_percentile_intervals_skip_the_jackknife(monkeypatch):
+    from dabest._stats_tools import confint_2group_diff as ci2g
+
+    kwargs = dict(idx=("control", "expt"), resamples=1000, permutation_count=999)
+    full = load(wellbeing, **kwargs).median_diff.results
+
+    def jackknife(*args, **kwargs):
+        raise AssertionError("The jackknife was computed.")
+
+    monkeypatch.setattr(ci2g, "compute_meandiff_jackknife", jackknife)
+    percentile = load(wellbeing, intervals=("percentile",), permutation=False, **kwargs)
+    results = percentile.median_diff.results
+
+    assert percentile.intervals == ("percentile",)
+    for column in ["bca_low", "bca_high", "bca_interval_idx", "permutations",
+                   "pvalue_permutation"]:
+        assert column not in results.columns
+    for column in ["difference", "pct_low", "pct_high", "pvalue_kruskal"]:
+        assert results[column][0] == full[column][0]
+    assert full["permutation_count"][0] == 999
+
+    with pytest.raises(ValueError) as excinfo:
+        percentile.median_diff.plot()
+    assert "The BCa intervals were not computed" in str(excinfo.value)
+
+    monkeypatch.undo()
+    no_tests = load(wellbeing, tests=False, **kwargs).mean_diff.results
+    assert not [c for c in no_tests.columns if c.startswith(("pvalue", "statistic"))]
+
+
+def test_stage_selection_errors():
+    kwargs = dict(idx=("control", "expt"))
+    with pytest.raises(ValueError) as excinfo:
+        load(wellbeing, intervals=(), **kwargs)
+    assert "`intervals` must be a non-empty list among ['bca', 'percentile']" \
+        in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        load(wellbeing, permutation_count=0, **kwargs)
+    assert "`permutation_count` must be a positive integer" in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        load(df_test, x=["Time", "Drug"], y="Heart Rate", delta2=True,
+             experiment="Experiment", permutation=False)
+    assert "`permutation` cannot be False with `delta2` or `mini_meta`." in str(excinfo.value)
@@ -0,0 +1,48 @@
+import pytest
+import numpy as np
+from dabest._api import load
+from data.mocked_data_test_load_errors import dummy_df
+
+
+IDX = (("Control 1", "Test 1"), ("Control 2", "Test 2", "Control 3"))
+
+
+@pytest.mark.parametrize("paired", [None, "baseline"])
+def test_intervals_match_separate_runs(paired):
+    kwargs = dict(idx=IDX, paired=paired, id_col="ID", resamples=2000)
+    intervals = load(dummy_df, **kwargs).mean_diff.intervals(ci=[90, 95, 99])
+
+    assert len(intervals) == 9
+    for ci in [90, 95, 99]:
+        results = load(dummy_df, ci=ci, **kwargs).mean_diff.results
+        selected = intervals[intervals["ci"] == ci].reset_index(drop=True)
+        for column in ["control", "test", "difference", "bca_low", "bca_high",
+                       "pct_low", "pct_high"]:
+            assert np.array_equal(selected[column], results[column])
+
+
+def test_intervals_kind_and_engines():
+    effsize_df = load(dummy_df, idx=IDX, resamples=2000).median_diff
+    percentile = effsize_df.intervals(kind="percentile")
+    assert "bca_low" not in percentile.columns
+    assert np.array_equal(percentile["pct_low"], effsize_df.results["pct_low"])
+
+    blb = load(dummy_df, idx=("Control 1", "Test 1"), resamples=2000, engine="blb").mean_diff
+    for column in ["bca_low", "bca_high", "pct_low", "pct_high"]:
+        assert blb.intervals()[column][0] == blb.results[column][0]
+
+
+def test_intervals_errors():
+    kwargs = dict(idx=("Control 1", "Test 1"), resamples=1000)
+    with pytest.raises(ValueError) as excinfo:
+        load(dummy_df, intervals=("percentile",), **kwargs).mean_diff.intervals(kind="bca")
+    assert "The BCa intervals cannot be computed" in str(excinfo.value)
+
+    effsize_df = load(dummy_df, **kwargs).mean_diff
+    with pytest.raises(ValueError) as excinfo:
+        effsize_df.intervals(kind=["bca", "student"])
+    assert "`kind` must be a non-empty list among ['bca', 'percentile']" in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        effsize_df.intervals(ci=[95, 101])
+    assert "`ci` must be a number between 0 and 100." in str(excinfo.value)
@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+from dabest._api import load
+from data.mocked_data_test_load_errors import dummy_df
+from data.mocked_data_test_06 import df_test
+from test_12_parallel_contrasts import assert_same_results
+
+
+IDX = (("Control 1", "Test 1"), ("Control 2", "Test 2", "Control 3"))
+
+
+@pytest.mark.parametrize("paired", [None, "baseline"])
+@pytest.mark.parametrize("rng_mode", ["legacy", "generator"])
+def test_extended_results_match_one_shot(paired, rng_mode):
+    kwargs = dict(idx=IDX, paired=paired, id_col="ID", rng_mode=rng_mode)
+    dabest_obj = load(dummy_df, resamples=1500, permutation_count=700, **kwargs)
+    # Reads the resamples of mean_diff from the index cache.
+    dabest_obj.median_diff.results
+    extended = dabest_obj.mean_diff
+    extended.extend_resamples(2000, permutation_count=300)
+
+    one_shot = load(dummy_df, resamples=3500, permutation_count=1000, **kwargs).mean_diff
+    assert_same_results(one_shot.results, extended.results)
+
+
+def test_extend_selected_contrasts():
+    effsize_df = load(dummy_df, idx=IDX, resamples=1000).hedges_g
+    before = effsize_df.results
+    effsize_df.extend_resamples(1000, contrasts=[1])
+    after = effsize_df.results
+
+    assert list(after["resamples"]) == [1000, 2000, 1000]
+    assert np.array_equal(after["bootstraps"][1][:1000], before["bootstraps"][1])
+    for column in ["bca_low", "bca_high", "pvalue_permutation"]:
+        assert after[column][0] == before[column][0]
+        assert after[column][2] == before[column][2]
+
+
+def test_extend_resamples_errors():
+    effsize_df = load(dummy_df, idx=("Control 1", "Test 1"), resamples=1000).mean_diff
+    with pytest.raises(ValueError) as excinfo:
+        effsize_df.extend_resamples(-1)
+    assert "must be non-negative integers" in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        effsize_df.extend_resamples(1000, contrasts=[1])
+    assert "1 is not a row of `results`." in str(excinfo.value)
+
+    blb = load(dummy_df, idx=("Control 1", "Test 1"), resamples=1000, engine="blb")
+    with pytest.raises(ValueError) as excinfo:
+        blb.mean_diff.extend_resamples(1000)
+    assert "The bootstrap of the 'blb' engine cannot be extended." in str(excinfo.value)
+
+    delta2 = load(df_test, x=["Time", "Drug"], y="Heart Rate", delta2=True,
+                  experiment="Experiment", resamples=1000)
+    with pytest.raises(ValueError) as excinfo:
+        delta2.mean_diff.extend_resamples(1000)
+    assert "cannot be extended with `delta2` or `mini_meta`" in str(excinfo.value)
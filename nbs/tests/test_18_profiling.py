@@ -0,0 +1,63 @@
+import pytest
+import tracemalloc
+import numpy as np
+import matplotlib as mpl
+mpl.use("Agg")
+from dabest._api import load
+from dabest._effsize_objects import PROFILED_STAGES
+from dabest.misc_tools import _StageProfiler
+from data.mocked_data_test_load_errors import dummy_df
+
+
+IDX = (("Control 1", "Test 1"), ("Control 2", "Test 2"))
+
+
+def test_profiled_results():
+    profiled = load(dummy_df, idx=IDX, resamples=1000, profile=True).mean_diff
+    plain = load(dummy_df, idx=IDX, resamples=1000).mean_diff
+
+    results = profiled.results
+    for column in plain.results.columns:
+        for p, q in zip(results[column], plain.results[column]):
+            np.testing.assert_array_equal(p, q)
+    for stage in PROFILED_STAGES:
+        assert (results["calls_" + stage] >= 1).all()
+        assert (results["wall_time_s_" + stage] >= 0).all()
+    assert (results["peak_bytes_bootstrap"] > 0).all()
+    assert list(results["calls_tests"]) == [8, 8]
+
+    profiled.plot()
+    timings = profiled.timings
+    assert list(timings.columns) == ["control", "test", "stage", "calls", "wall_time_s",
+                                     "peak_bytes"]
+    assert len(timings) == 2 * len(PROFILED_STAGES) + 3
+    assert list(timings["stage"][-3:]) == ["setup", "swarm", "violins"]
+    assert not tracemalloc.is_tracing()
+
+    assert plain.timings is None
+    assert "calls_bootstrap" not in plain.results.columns
+
+
+def test_stage_profiler():
+    profiler = _StageProfiler()
+    for _ in range(2):
+        with profiler.stage("allocate"):
+            np.ones(100000)
+    assert not tracemalloc.is_tracing()
+
+    tracemalloc.start()
+    try:
+        profiler.start("traced")
+        np.ones(200000)
+        profiler.stop()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    timings = profiler.to_dict()
+    assert timings["allocate"]["calls"] == 2
+    assert timings["allocate"]["peak_bytes"] >= 800000
+    if hasattr(tracemalloc, "reset_peak"):
+        assert timings["traced"]["peak_bytes"] >= 1600000
+    else:
+        assert timings["traced"]["peak_bytes"] is None